@@ -0,0 +1,42 @@
+"""
+Benchmark: batch scoring throughput vs. --workers.
+
+    python benchmarks/bench_batch_workers.py [ROWS]
+
+Scores the same random build list with 1, 2, 4 … os.cpu_count() worker
+processes and reports rows/sec and speedup over a single process.
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST
+from bottleneck_calculator.batch import run_batch
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 400_000
+    rng = random.Random(42)
+    rows = [(rng.choice(CPU_LIST).name, rng.choice(GPU_LIST).name, rng.choice(MB_LIST).name)
+            for _ in range(n)]
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, cores} | {2 ** i for i in range(1, 8) if 2 ** i < cores})
+    print(f"rows: {n:,}   cores: {cores}")
+    base = None
+    with open(os.devnull, "w") as out:
+        for w in counts:
+            t0 = time.perf_counter()
+            run_batch(rows, out, "jsonl", workers=w)
+            dt = time.perf_counter() - t0
+            base = base or dt
+            print(f"  workers={w:<3} {n / dt:>10,.0f} rows/s   speedup {base / dt:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
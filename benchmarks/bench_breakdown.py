@@ -0,0 +1,108 @@
+"""
+Stress test: memory and widget count across many breakdown updates.
+
+    python benchmarks/bench_breakdown.py [UPDATES]
+
+Needs a display. Builds BottleneckApp and pushes UPDATES (default 10000)
+results for random CPU/GPU/board picks through _set_breakdown, followed by
+update_idletasks(). Every 1000 updates it prints the widget count under the
+score panel, the process RSS and the Python heap (tracemalloc). With
+in-place rows all three stay flat after the first update.
+
+For comparison it then runs a shorter pass of the previous implementation,
+reproduced below, which destroyed the panel's children and built every
+row again.
+"""
+
+import gc
+import random
+import resource
+import sys
+import time
+import tkinter as tk
+import tracemalloc
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST, cached_bottleneck
+from bottleneck_calculator.gui import T, THEME, BottleneckApp
+
+
+def rebuild_breakdown(app, bd, side):
+    for w in app.score_frame.winfo_children():
+        w.destroy()
+    gap = bd["performance_gap"]
+    for label, val, color, disp in (
+        ("CPU Perf Score",  bd["cpu_perf_score"],  "primary", str(int(bd["cpu_perf_score"]))),
+        ("GPU Perf Score",  bd["gpu_perf_score"],  "#9C27B0", str(int(bd["gpu_perf_score"]))),
+        ("Performance Gap", gap, "success" if gap > 0 else "error", f"{gap:+.0f}"),
+        ("Thread Penalty",  bd["thread_penalty"],  "warning", f"{bd['thread_penalty']:.1f}"),
+        ("PCIe Penalty",    bd["pcie_penalty"],    "warning", f"{bd['pcie_penalty']:.1f}"),
+    ):
+        row = THEME.add(tk.Frame(app.score_frame), bg="card")
+        row.pack(fill="x", pady=2)
+        THEME.add(tk.Label(row, text=label, font=("Segoe UI",9), anchor="w", width=18),
+                  fg="secondary_text", bg="card").pack(side="left")
+        v = THEME.add(tk.Label(row, text=disp, font=("Segoe UI",9,"bold"), width=6, anchor="e"),
+                      bg="card")
+        if color in T:
+            THEME.add(v, fg=color)
+        else:
+            v.configure(fg=color)
+        v.pack(side="right")
+        THEME.add(tk.Frame(app.score_frame, height=1), bg="divider").pack(fill="x")
+    THEME.add(tk.Label(app.score_frame, text=side, font=("Segoe UI",8,"italic"),
+                       wraplength=230, justify="left"),
+              fg="primary", bg="card").pack(anchor="w", pady=(6,0))
+
+
+def _widgets(root):
+    n, stack = 0, [root]
+    while stack:
+        w = stack.pop(); n += 1; stack.extend(w.winfo_children())
+    return n
+
+
+def _run(app, update, results, label):
+    print(f"\n{label}")
+    print(f"{'updates':>9}{'widgets':>9}{'RSS MB':>9}{'heap KB':>9}{'median ms':>11}")
+    tracemalloc.start()
+    samples = []
+    for i, (bd, side) in enumerate(results, 1):
+        t0 = time.perf_counter()
+        update(app, bd, side)
+        app.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+        if i % 1000 == 0 or i == 1:
+            gc.collect()
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            heap = tracemalloc.get_traced_memory()[0] / 1024
+            print(f"{i:>9}{_widgets(app.score_frame):>9}{rss:>9.1f}{heap:>9.0f}"
+                  f"{median(samples[-1000:]) * 1e3:>11.3f}")
+    tracemalloc.stop()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    try:
+        app = BottleneckApp()
+    except tk.TclError as e:
+        print(f"needs a display: {e}")
+        return 2
+    app.withdraw()
+    rnd = random.Random(1)
+    results = []
+    for _ in range(n):
+        r = cached_bottleneck(rnd.choice(CPU_LIST), rnd.choice(GPU_LIST), rnd.choice(MB_LIST))
+        results.append((r.breakdown, r.side))
+
+    _run(app, BottleneckApp._set_breakdown, results, "in place (_set_breakdown)")
+    _run(app, rebuild_breakdown, results[:max(1, n // 5)], "destroy + rebuild (previous)")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,96 @@
+"""
+Benchmark: UI responsiveness while a slow calculation runs.
+
+    python benchmarks/bench_calc_jobs.py [WORK_MS] [CLICKS]
+
+Needs a display. Builds BottleneckApp and slows its worker-side _score
+down by WORK_MS (default 400) of pure-Python work, as a heavier scoring
+model would. A 16 ms after() ticker stands in for redraws and input. The
+benchmark then fires CLICKS (default 5) CALCULATE clicks 50 ms apart,
+two ways:
+
+  - inline: _score and _show_result called on Tk's thread, as
+    _calculate used to do;
+  - jobs: the app's _calculate, through CalcJobs.
+
+For each it reports the worst and p95 gap between ticks, how many results
+reached the UI, and the time from the last click to its result.
+"""
+
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator.gui import BottleneckApp
+
+
+def busy(ms, stop=lambda: False):
+    end = time.perf_counter() + ms / 1000
+    x = 0
+    while time.perf_counter() < end:
+        if stop():
+            return
+        for i in range(2000):
+            x += i
+
+
+def _run(app, click, clicks):
+    gaps, last, shown, done = [], [time.perf_counter()], [], [None]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last[0]); last[0] = now
+        if done[0] is None:
+            app.after(16, tick)
+
+    show = app._show_result
+    def counted(res):
+        shown.append(time.perf_counter())
+        show(res)
+    app._show_result = app._jobs._on_result = counted
+
+    app.after(16, tick)
+    fired = []
+    for k in range(clicks):
+        app.after(50 * k, lambda: (fired.append(time.perf_counter()), click()))
+    while len(fired) < clicks or not shown or app._jobs.busy() or shown[-1] < fired[-1]:
+        app.update()
+    done[0] = True
+    app._show_result = app._jobs._on_result = show
+    gaps.sort()
+    return gaps[-1], gaps[int(0.95 * (len(gaps) - 1))], len(shown), shown[-1] - fired[-1]
+
+
+def main():
+    work = float(sys.argv[1]) if len(sys.argv) > 1 else 400
+    clicks = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    try:
+        app = BottleneckApp()
+    except tk.TclError as e:
+        print(f"needs a display: {e}")
+        return 2
+    app._update_check = lambda: None
+
+    score = BottleneckApp._score
+    def slow_score(*names):
+        busy(work, app._jobs.superseded)
+        return score(*names)
+    app._score = slow_score
+
+    def inline():
+        app._show_result(slow_score(app.cpu_cb.get(), app.gpu_cb.get(), app.mb_cb.get()))
+
+    print(f"{work:.0f} ms per calculation  •  {clicks} clicks 50 ms apart")
+    print(f"{'':<8}{'worst gap':>11}{'p95 gap':>10}{'results':>9}{'last click → UI':>17}")
+    for label, click in (("inline", inline), ("jobs", app._calculate)):
+        worst, p95, n, lag = _run(app, click, clicks)
+        print(f"{label:<8}{worst * 1e3:>9.0f}ms{p95 * 1e3:>8.0f}ms{n:>9}{lag * 1e3:>15.0f}ms")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
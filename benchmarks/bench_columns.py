@@ -0,0 +1,70 @@
+"""
+Benchmark: memory and lookup cost of the component representations.
+
+    python benchmarks/bench_columns.py [SKUS]
+
+Builds a synthetic catalog of SKUS GPUs (the built-in list, repeated with
+suffixed names) three ways — plain @dataclass objects in a list (the old
+model), slotted frozen dataclasses in a list, and a ColumnTable — then
+compares allocated memory, a full perf_score scan and name lookups.
+"""
+
+import sys
+import time
+import tracemalloc
+from dataclasses import astuple, make_dataclass
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import GPU, GPU_LIST, ColumnTable
+
+LegacyGPU = make_dataclass("LegacyGPU", [("name", str), ("vram_gb", int), ("tdp", int),
+                                         ("perf_score", int), ("vendor", str),
+                                         ("low_profile", bool), ("price", float)])
+
+
+def _measure(build):
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def _per_op(fn, n):
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) / n * 1e9
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    # Fresh string objects per SKU, as a parsed retailer feed would produce.
+    rows = [(f"{g.name} #{i}",) + astuple(g)[1:]
+            for i in range(n // len(GPU_LIST) + 1) for g in GPU_LIST][:n]
+
+    legacy, m_legacy = _measure(lambda: [LegacyGPU(*r) for r in rows])
+    slotted, m_slot  = _measure(lambda: [GPU(*r) for r in rows])
+    table, m_cols    = _measure(lambda: ColumnTable(GPU, slotted))
+
+    print(f"SKUs: {n:,}")
+    print(f"memory   list[@dataclass]        {m_legacy / 2**20:7.2f} MiB")
+    print(f"         list[slots, frozen]     {m_slot / 2**20:7.2f} MiB")
+    print(f"         ColumnTable             {m_cols / 2**20:7.2f} MiB")
+
+    col = table.columns["perf_score"]
+    print(f"scan     sum(perf_score) list    {_per_op(lambda: sum(g.perf_score for g in slotted), n):7.1f} ns/row")
+    print(f"         sum(perf_score) column  {_per_op(lambda: sum(col), n):7.1f} ns/row")
+
+    probe = [r[0] for r in rows[::97]]
+    by_name = {g.name: g for g in slotted}
+    print(f"lookup   dict[name]              {_per_op(lambda: [by_name[p] for p in probe], len(probe)):7.1f} ns/op"
+          f"   (+{sys.getsizeof(by_name) / 2**20:.2f} MiB for the dict)")
+    print(f"         ColumnTable.find        {_per_op(lambda: [table.find(p) for p in probe], len(probe)):7.1f} ns/op")
+    print(f"         ColumnTable.get (row)   {_per_op(lambda: [table.get(p) for p in probe], len(probe)):7.1f} ns/op")
+    assert all(table.get(p) == by_name[p] for p in probe)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+"""
+Benchmark: "cheapest build scoring at least N" from a Pareto table vs. a full scan.
+
+    python benchmarks/bench_frontier.py [SCALES...]
+
+Prices and scales the built-in catalog the same way bench_optimize.py does
+(default 1, 3 and 10 times). For each scale it
+
+  - builds the ParetoTable in one go, and again incrementally (a quarter
+    of the parts, then the rest in eight batches), timing both;
+  - for catalogs up to 3x, scores every socket-compatible build and checks
+    the table holds exactly the non-dominated (price, perf, bottleneck_pct)
+    points per socket;
+  - saves and reloads the table, and reports the file size;
+  - times cheapest() for every min_score from 0 to 200, with and without a
+    bottleneck_pct cap, against a scan of all scored builds (for catalogs up
+    to 3x). The prices have to match.
+
+Exits non-zero on any mismatch.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST, score_build
+from bottleneck_calculator.frontier import ParetoTable
+
+CAPS = (None, 10.0)         # max_pct values queried
+
+
+def _price(rnd, perf, lo, hi):
+    return round((lo + (hi - lo) * (perf / 100) ** 2.5) * rnd.uniform(0.85, 1.15), 2)
+
+def catalog(scale, rnd):
+    cpus, gpus, mbs = [], [], []
+    for r in range(scale):
+        jit = (lambda s: s) if r == 0 else (lambda s: max(1, min(100, s + rnd.randint(-2, 2))))
+        for c in CPU_LIST:
+            s = jit(c.perf_score)
+            cpus.append(replace(c, name=f"{c.name} #{r}", perf_score=s,
+                                price=_price(rnd, s, 60, 650)))
+        for g in GPU_LIST:
+            s = jit(g.perf_score)
+            gpus.append(replace(g, name=f"{g.name} #{r}", perf_score=s,
+                                price=_price(rnd, s, 90, 2000)))
+        for m in MB_LIST:
+            mbs.append(replace(m, name=f"{m.name} #{r}",
+                               price=round(rnd.uniform(80, 200) + 60 * m.pcie_gen, 2)))
+    return cpus, gpus, mbs
+
+
+def every_build(cpus, gpus, mbs):
+    """(socket, price, perf, bottleneck_pct) of every compatible build."""
+    out = []
+    for c in cpus:
+        for m in mbs:
+            if m.socket == c.socket:
+                for g in gpus:
+                    out.append((c.socket, c.price + m.price + g.price, c.perf_score + g.perf_score,
+                                score_build(c, g, m).bottleneck_pct))
+    return out
+
+
+def non_dominated(points):
+    """Distinct (price, perf, pct) points nothing else beats, the slow way."""
+    points = sorted(set(points), key=lambda p: (p[0], -p[1], p[2]))
+    kept = []
+    for p in points:
+        if not any(q[0] <= p[0] and q[1] >= p[1] and q[2] <= p[2] for q in kept):
+            kept.append(p)
+    return set(kept)
+
+
+def _points(table):
+    return {s: {(b.price, b.perf, b.bottleneck_pct) for b in front}
+            for s, front in table.frontiers.items()}
+
+
+def run(scale, rnd):
+    cpus, gpus, mbs = catalog(scale, rnd)
+    check = scale <= 3
+    ok = True
+
+    t0 = time.perf_counter()
+    table = ParetoTable.build(cpus, gpus, mbs)
+    t_build = time.perf_counter() - t0
+
+    parts = [(0, p) for p in cpus] + [(1, p) for p in gpus] + [(2, p) for p in mbs]
+    rnd.shuffle(parts)
+    cut = len(parts) // 4
+    batches = [parts[:cut]] + [parts[cut + i::8] for i in range(8)]
+    inc, scored, t_inc = ParetoTable(), [], []
+    for batch in batches:
+        lists = ([], [], [])
+        for kind, p in batch:
+            lists[kind].append(p)
+        t0 = time.perf_counter()
+        scored.append(inc.add(*lists))
+        t_inc.append(time.perf_counter() - t0)
+    same_inc = _points(inc) == _points(table)
+    ok &= same_inc
+
+    with tempfile.TemporaryDirectory() as d:
+        path = os.path.join(d, "frontier.json")
+        table.save(path)
+        size = os.path.getsize(path)
+        t0 = time.perf_counter()
+        loaded = ParetoTable.load(path)
+        t_load = time.perf_counter() - t0
+    same_load = _points(loaded) == _points(table)
+    ok &= same_load
+
+    print(f"\n{len(cpus):,} CPUs × {len(gpus):,} GPUs × {len(mbs):,} boards")
+    print(f"  build {t_build * 1e3:8.1f} ms   {len(table):,} frontier builds over "
+          f"{len(table.frontiers)} sockets")
+    print(f"  incremental: first quarter {t_inc[0] * 1e3:.1f} ms ({scored[0]:,} scored), then "
+          f"{median(t_inc[1:]) * 1e3:.1f} ms median per batch ({sum(scored[1:]):,} scored)"
+          f"   {'ok' if same_inc else 'MISMATCH'}")
+    print(f"  saved {size / 1024:.0f} KiB, loads in {t_load * 1e3:.1f} ms"
+          f"   {'ok' if same_load else 'MISMATCH'}")
+
+    builds = None
+    if check:
+        t0 = time.perf_counter()
+        builds = every_build(cpus, gpus, mbs)
+        t_all = time.perf_counter() - t0
+        by_socket = {}
+        for s, *p in builds:
+            by_socket.setdefault(s, []).append(tuple(p))
+        want = {s: non_dominated(p) for s, p in by_socket.items()}
+        same = want == _points(table)
+        ok &= same
+        print(f"  scoring all {len(builds):,} builds {t_all * 1e3:.0f} ms; frontier "
+              f"{'matches' if same else 'DOES NOT MATCH'} the brute-force one")
+
+    for cap in CAPS:
+        qs = [(n, None, cap) for n in range(201)]
+        samples, got = [], []
+        for q in qs:
+            t0 = time.perf_counter()
+            got.append(table.cheapest(*q))
+            samples.append(time.perf_counter() - t0)
+        line = (f"  cheapest(min_score, max_pct={cap}) "
+                f"{median(samples) * 1e6:6.2f} µs median, {max(samples) * 1e6:6.1f} µs max")
+        if builds is not None:
+            t0 = time.perf_counter()
+            want = [min((p for _, p, perf, pct in builds
+                         if perf >= n and (cap is None or pct <= cap)), default=None)
+                    for n, _, cap in qs]
+            t_scan = (time.perf_counter() - t0) / len(qs)
+            same = want == [None if b is None else b.price for b in got]
+            ok &= same
+            line += f"   scan {t_scan * 1e3:6.1f} ms   {'ok' if same else 'MISMATCH'}"
+        print(line)
+    return ok
+
+
+def main():
+    scales = [int(a) for a in sys.argv[1:]] or [1, 3, 10]
+    rnd = random.Random(1)
+    ok = all([run(s, rnd) for s in scales])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
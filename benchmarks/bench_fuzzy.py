@@ -0,0 +1,164 @@
+"""
+Benchmark: resolving messy component names, alias lookup vs. fuzzy resolver.
+
+    python benchmarks/bench_fuzzy.py [ROWS] [DISTINCT]
+
+Builds a feed of ROWS dirty names (default 200k) drawn from DISTINCT
+variants (default 20k) of the shipped CPU, GPU and board names. Variants
+mix case, spacing and hyphens, drop or run together vendor words, write
+"12G" for "12GB", add "board" / "graphics card", drop a board's "(socket)",
+and in about 15% of them make one typo (a typo in a model number, like
+"rtx 4080" for a 4090, is meant to find nothing). It reports
+
+  - how many names REGISTRY.find (the alias lookup) resolves;
+  - ComponentRegistry.resolve over the feed from cold: names per second,
+    how many resolve, how many to the part the variant came from, and how
+    many to some other part;
+  - the cold cost per distinct name by how it resolved: exact key, one
+    edit (deletion table), or the BK-tree;
+  - that every fuzzy match is the nearest same-shape key a linear scan
+    finds, and that names one model-number digit or suffix away from a
+    part (CHECKS) resolve to the part they name or to nothing (exits
+    non-zero if not).
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST, ComponentRegistry
+from bottleneck_calculator.fuzzy import NameMatcher, _masks, distance, fold, shape
+
+KINDS = (("cpu", CPU_LIST), ("gpu", GPU_LIST), ("board", MB_LIST))
+VENDORS = re.compile(r"\b(?:Intel|Core|NVIDIA|GeForce|AMD|Radeon)\b ?")
+
+# (kind, dirty name, the part it must resolve to or None).
+CHECKS = (("gpu",   "rtx 4090 ti",       None),         # not the 4070 Ti, nor the 4090
+          ("gpu",   "rtx 5080 super",    None),         # not the 4080 Super
+          ("cpu",   "ryzen 5 3500",      None),         # not the 5500
+          ("gpu",   "RX 7700",           None),         # not the 7600
+          ("board", "b660",              None),         # not the B860
+          ("cpu",   "intl i5-13600",     None),         # not the 13600K
+          ("gpu",   "RTX4070TI 12G",     "NVIDIA RTX 4070 Ti 12GB"),
+          ("gpu",   "rtx 4070 supr",     "NVIDIA RTX 4070 Super 12GB"),
+          ("cpu",   "ryzne 5 5600x",     "AMD Ryzen 5 5600X"),
+          ("cpu",   "intl i5-13600k",    "Intel Core i5-13600K"),
+          ("cpu",   "i7 13700kk",        "Intel Core i7-13700K"),
+          ("board", "b650 am5 board",    "B650 (AM5)"))
+
+
+def _typo(s, rnd):
+    i, c = rnd.randrange(len(s)), rnd.choice("abcdefghijklmnopqrstuvwxyz0123456789")
+    return rnd.choice((s[:i] + c + s[i + 1:], s[:i] + s[i + 1:], s[:i] + c + s[i:],
+                       s[:i] + s[i + 1:i + 2] + s[i:i + 1] + s[i + 2:]))
+
+def dirty(name, kind, rnd):
+    s = name
+    if rnd.random() < 0.5:
+        s = VENDORS.sub("", s)
+    if kind == "gpu" and rnd.random() < 0.5:
+        s = re.sub(r"(\d+)GB", lambda m: m[1] + rnd.choice(("G", " gb", "GB", "gig")), s)
+    if kind == "board":
+        s = rnd.choice((s, re.sub(r"\s*\((.*?)\)", r" \1", s), re.sub(r"\s*\(.*?\)", "", s)))
+        if rnd.random() < 0.3:
+            s += rnd.choice((" board", " motherboard", " mobo"))
+    if kind == "gpu" and rnd.random() < 0.2:
+        s += " graphics card"
+    s = s.replace("-", rnd.choice(("-", " ", "")))
+    if rnd.random() < 0.3:
+        words = s.split()
+        j = rnd.randrange(len(words))
+        s = " ".join(words[:j]) + "".join(words[j:j + 2]) + " " + " ".join(words[j + 2:])
+    s = rnd.choice((s, s.lower(), s.upper()))
+    if rnd.random() < 0.15:
+        s = _typo(s, rnd)
+    return " ".join(s.split())
+
+
+def feed(rows, distinct, rnd):
+    variants = []
+    for _ in range(distinct):
+        kind, parts = rnd.choice(KINDS)
+        p = rnd.choice(parts)
+        variants.append((kind, dirty(p.name, kind, rnd), p))
+    return [rnd.choice(variants) for _ in range(rows)], variants
+
+
+def nearest(matcher, key):
+    """Brute force: the best (distance, catalog rank) over same-shape keys, within the radius."""
+    peq, m = _masks(key), len(key)
+    best = min(((distance(peq, m, k), matcher._exact[k], k) for k in matcher._exact
+                if shape(k) == shape(key)), default=None)
+    return best if best and best[0] <= matcher._radius(key) else None
+
+
+def main():
+    rows     = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    rnd = random.Random(1)
+    names, variants = feed(rows, distinct, rnd)
+    print(f"{rows:,} names from {len(set((k, n) for k, n, _ in variants)):,} distinct dirty variants")
+
+    reg = ComponentRegistry(CPU_LIST, GPU_LIST, MB_LIST)
+    t0 = time.perf_counter()
+    found = sum(reg.find(k, n) is not None for k, n, _ in names)
+    t_find = time.perf_counter() - t0
+    print(f"  REGISTRY.find      {found / rows:7.1%} resolved   {rows / t_find:>10,.0f} names/s")
+
+    reg = ComponentRegistry(CPU_LIST, GPU_LIST, MB_LIST)
+    t0 = time.perf_counter()
+    for kind, _ in KINDS:                               # build the matchers
+        reg._matcher(kind)
+    t_build = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    hits = [reg.resolve(k, n) for k, n, _ in names]
+    t_res = time.perf_counter() - t0
+    ok_n  = sum(h is not None for h in hits)
+    right = sum(h is not None and h.part is p for h, (_, _, p) in zip(hits, names))
+    print(f"  resolve (cold)     {ok_n / rows:7.1%} resolved   {rows / t_res:>10,.0f} names/s"
+          f"   {right / rows:.1%} to the source part, {(ok_n - right) / rows:.2%} to another"
+          f"   (index built in {t_build * 1e3:.0f} ms)")
+
+    # Cold cost per distinct name, by the tier that answered; checked afterwards.
+    tiers = {"exact key": [], "one edit": [], "BK-tree": [], "no match": []}
+    fresh = {k: NameMatcher(parts) for k, parts in KINDS}
+    results = []
+    for kind, name in dict.fromkeys((k, n) for k, n, _ in variants):
+        t0 = time.perf_counter()
+        h = fresh[kind].match(name)
+        dt = time.perf_counter() - t0
+        tier = ("no match" if h is None else "exact key" if h.distance == 0 else
+                "one edit" if h.distance == 1 else "BK-tree")
+        tiers[tier].append(dt)
+        results.append((kind, name, h))
+    mismatches = 0
+    for kind, name, h in results:
+        if h is not None and h.distance == 0:
+            continue
+        m    = fresh[kind]
+        want = nearest(m, fold(name, loose=True))
+        got  = None if h is None else h.part
+        if (want is None) != (got is None) or (want and m._parts[want[1]] is not got):
+            mismatches += 1
+    for tier, ts in tiers.items():
+        if ts:
+            print(f"  {tier:<10} {len(ts):>7,} names   {sum(ts) / len(ts) * 1e6:8.1f} µs each, cold")
+    print(f"  fuzzy matches vs. linear scan: {'ok' if not mismatches else f'{mismatches} MISMATCHES'}")
+
+    reg, failed = ComponentRegistry(CPU_LIST, GPU_LIST, MB_LIST), 0
+    for kind, name, want in CHECKS:
+        h = reg.resolve(kind, name)
+        got = None if h is None else h.part.name
+        if got != want:
+            failed += 1
+            print(f"    {kind} {name!r}: {got!r} ({h and h.confidence}), expected {want!r}")
+    print(f"  model-number checks: {'ok' if not failed else f'{failed} of {len(CHECKS)} FAILED'}")
+    return 1 if mismatches or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Benchmark: per-update cost of the gauge, in-place items vs. delete("all").
+
+    python benchmarks/bench_gauge.py [UPDATES]
+
+Needs a display. Builds BottleneckApp and pushes UPDATES (default 2000)
+random results through the gauge two ways, each followed by
+update_idletasks():
+
+  - redraw: the previous _draw_gauge, reproduced below, which deletes
+    every item and recreates the arcs and texts;
+  - in place: the app's _draw_gauge, which reconfigures the items built
+    once by _build_gauge.
+
+It also counts the canvas items each path allocates, and the frame
+pacing of one animated sweep.
+"""
+
+import random
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator.gui import T, BottleneckApp
+
+
+def redraw_gauge(app, pct, side):
+    c = app.gauge; c.delete("all")
+    cx, cy, r = 155, 150, 112
+    c.create_arc(cx-r, cy-r, cx+r, cy+r, start=0, extent=180,
+                 style="arc", outline=T["gauge_track"], width=20)
+    if side == "Balanced" or pct < 8:   color = T["success"]
+    elif pct < 20:  color = "#8BC34A"
+    elif pct < 35:  color = "#FBC02D"
+    elif pct < 50:  color = T["warning"]
+    else:           color = T["error"]
+    extent = int(pct/100*180)
+    if extent > 0:
+        c.create_arc(cx-r, cy-r, cx+r, cy+r, start=180, extent=-extent,
+                     style="arc", outline=color, width=20)
+    c.create_text(cx, cy-24, text=f"{pct:.1f}%" if pct > 0 else "—",
+                  font=("Segoe UI",30,"bold"), fill=color)
+    c.create_text(cx, cy+10, text="Bottleneck", font=("Segoe UI",10), fill=T["secondary_text"])
+    sc = {"CPU":T["warning"],"GPU":T["primary"],"Balanced":T["success"]}.get(side,T["secondary_text"])
+    c.create_text(cx, cy+35, text=f"Side: {side}", font=("Segoe UI",12,"bold"), fill=sc)
+    c.create_text(cx-r-8, cy+8, text="0%", font=("Segoe UI",8), fill=T["secondary_text"], anchor="e")
+    c.create_text(cx+r+8, cy+8, text="100%", font=("Segoe UI",8), fill=T["secondary_text"], anchor="w")
+
+
+def _time(app, draw, results):
+    samples = []
+    for pct, side in results:
+        t0 = time.perf_counter()
+        draw(app, pct, side)
+        app.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    try:
+        app = BottleneckApp()
+    except tk.TclError as e:
+        print(f"needs a display: {e}")
+        return 2
+    rnd = random.Random(1)
+    results = [(round(rnd.uniform(0, 70), 1), rnd.choice(("CPU", "GPU", "Balanced")))
+               for _ in range(n)]
+
+    def created(run):
+        """Run, returning (samples, canvas items allocated meanwhile)."""
+        probe = app.gauge.create_line(0, 0, 0, 0); app.gauge.delete(probe)
+        samples = run()
+        after = app.gauge.create_line(0, 0, 0, 0); app.gauge.delete(after)
+        return samples, after - probe - 1
+
+    new, new_items = created(lambda: _time(app, BottleneckApp._draw_gauge, results))
+    old, old_items = created(lambda: _time(app, redraw_gauge, results))
+    app.gauge.delete("all")
+    app._build_gauge()
+
+    print(f"{n} gauge updates each")
+    for label, s, items in (("delete+redraw", old, old_items), ("in place", new, new_items)):
+        print(f"  {label:<14} median {median(s) * 1e3:6.3f} ms   max {max(s) * 1e3:6.3f} ms"
+              f"   {items:,} canvas items created")
+
+    frames, paint = [], app._paint_gauge
+    def timed_paint(pct, side):
+        frames.append(time.perf_counter())
+        paint(pct, side)
+    app._paint_gauge = timed_paint
+    app._animate_gauge(65.0, "GPU")
+    while app._gauge_anim:
+        app.update()
+    gaps = [b - a for a, b in zip(frames, frames[1:])]
+    print(f"  animation: {len(frames)} frames in {(frames[-1] - frames[0]) * 1e3:.0f} ms, "
+          f"frame interval median {median(gaps) * 1e3:.1f} ms (budget {app.GAUGE_FRAME_MS} ms)")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
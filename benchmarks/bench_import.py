@@ -0,0 +1,93 @@
+"""
+Benchmark: cold import cost of the package in a headless process.
+
+    python benchmarks/bench_import.py [RUNS] [--budget-ms MS]
+
+Runs `python -X importtime -c "import bottleneck_calculator"` RUNS times
+in fresh interpreters and reports the median self / cumulative time of
+each bottleneck_calculator module, plus the whole import. Sources are
+byte-compiled first and PYTHONDONTWRITEBYTECODE is dropped from the child
+environment, so the numbers measure module execution, not compilation.
+Fails if tkinter or numpy is imported, or if the package's own modules
+(self time, excluding stdlib dependencies) other than models.py exceed
+--budget-ms, 4 ms by default. models.py is reported but not budgeted:
+most of its ~4 ms is dataclass() generating the three slotted, frozen
+part classes, a fixed cost of the data model that would otherwise hide
+regressions elsewhere. The rest (engine, data, update, the package
+__init__) measure 2-3 ms, and pulling one lazily loaded module back
+into the import (fuzzy.py, say) takes them over the budget.
+"""
+
+import argparse
+import compileall
+import os
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+from statistics import median
+
+ROOT = Path(__file__).resolve().parent.parent
+PKG  = "bottleneck_calculator"
+FIXED = (f"{PKG}.models",)          # reported, not budgeted (see the docstring)
+PROBE = (f"import sys, {PKG}; "
+         "print(','.join(m for m in ('tkinter', 'numpy', '_tkinter') if m in sys.modules))")
+
+
+def _run(env):
+    p = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE], cwd=ROOT,
+                       env=env, capture_output=True, text=True, check=True)
+    times = {}
+    for line in p.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        times[name.strip()] = (int(self_us), int(cum_us))
+    return times, p.stdout.strip()
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("runs", nargs="?", type=int, default=15)
+    ap.add_argument("--budget-ms", type=float, default=4.0,
+                    help="max median self time of the package's own modules, "
+                         "models.py aside")
+    args = ap.parse_args()
+
+    compileall.compile_dir(ROOT / PKG, quiet=1)
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    _run(env)                                           # warm the page cache
+
+    samples, heavy = defaultdict(list), set()
+    for _ in range(args.runs):
+        times, loaded = _run(env)
+        heavy.update(filter(None, loaded.split(",")))
+        for name, t in times.items():
+            samples[name].append(t)
+
+    own = sorted(n for n in samples if n == PKG or n.startswith(PKG + "."))
+    print(f"{'module':<34}{'self ms':>10}{'cum ms':>10}   (median of {args.runs})")
+    for n in own:
+        s = median(t[0] for t in samples[n]) / 1000
+        c = median(t[1] for t in samples[n]) / 1000
+        print(f"{n:<34}{s:>10.2f}{c:>10.2f}")
+    own_ms   = median(sum(samples[n][i][0] for n in own) for i in range(args.runs)) / 1000
+    budgeted = [n for n in own if n not in FIXED]
+    rest_ms  = median(sum(samples[n][i][0] for n in budgeted) for i in range(args.runs)) / 1000
+    total_ms = median(t[1] for t in samples[PKG]) / 1000
+    print(f"\npackage modules (self): {own_ms:.2f} ms, {rest_ms:.2f} ms without models.py   "
+          f"whole import: {total_ms:.2f} ms   stdlib deps: {total_ms - own_ms:.2f} ms")
+
+    ok = True
+    if heavy:
+        print(f"FAIL: importing {PKG} pulled in {', '.join(sorted(heavy))}")
+        ok = False
+    if rest_ms > args.budget_ms:
+        print(f"FAIL: package modules other than models.py took {rest_ms:.2f} ms "
+              f"(budget {args.budget_ms} ms)")
+        ok = False
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
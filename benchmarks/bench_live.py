@@ -0,0 +1,99 @@
+"""
+Benchmark: latency of a live-mode update, from combo change to drawn panel.
+
+    python benchmarks/bench_live.py [CHANGES]
+
+First a scoring-only comparison (no Tk) of LiveScorer and score_build
+over single-part edits, from a few candidates per slot and from the whole
+catalog. Then, if there is a display, it builds BottleneckApp with live
+mode on and the gauge animation off, and makes CHANGES (default 3000)
+random selections through SearchCombo.set, timing each up to
+update_idletasks(). The changes are split three ways: board only, CPU or
+GPU, and flipping back and forth between two recent builds. It reports
+median / p99 / max per change against the 16 ms frame budget, and the
+LiveScorer's partial term hit rate. Without a display that part is
+skipped.
+"""
+
+import random
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST, LiveScorer, score_build
+from bottleneck_calculator.gui import BottleneckApp
+
+
+def _stats(s):
+    s = sorted(s)
+    return median(s) * 1e3, s[int(0.99 * (len(s) - 1))] * 1e3, s[-1] * 1e3
+
+
+def _changes(kind, n, rnd):
+    if kind == "board only":
+        return [(("mb_cb", rnd.choice(MB_LIST).name),) for _ in range(n)]
+    if kind == "cpu or gpu":
+        return [(("cpu_cb", rnd.choice(CPU_LIST).name),) if rnd.random() < 0.5 else
+                (("gpu_cb", rnd.choice(GPU_LIST).name),) for _ in range(n)]
+    a = (("cpu_cb", CPU_LIST[0].name), ("gpu_cb", GPU_LIST[5].name), ("mb_cb", MB_LIST[2].name))
+    b = (("cpu_cb", CPU_LIST[9].name), ("gpu_cb", GPU_LIST[1].name), ("mb_cb", MB_LIST[7].name))
+    return [a if i % 2 else b for i in range(n)]
+
+
+def scoring(rnd):
+    # Scoring alone, suggestions included, over 100k single-part edits
+    # that pick from a pool of candidates per slot: a few parts being
+    # compared, or the whole catalog.
+    for pool in (6, len(GPU_LIST)):
+        parts = [rnd.sample(lst, min(pool, len(lst))) for lst in (CPU_LIST, GPU_LIST, MB_LIST)]
+        walk, cur = [], [p[0] for p in parts]
+        for _ in range(100_000):
+            i = rnd.randrange(3)
+            cur[i] = rnd.choice(parts[i])
+            walk.append(tuple(cur))
+        for label, fn in (("score_build", score_build), ("LiveScorer", LiveScorer())):
+            t0 = time.perf_counter()
+            for b in walk:
+                fn(*b).suggestions
+            print(f"{pool:>4} candidates/slot  {label:<12}"
+                  f"{(time.perf_counter() - t0) / len(walk) * 1e6:6.2f} µs per edit")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    rnd = random.Random(1)
+    scoring(rnd)
+    try:
+        app = BottleneckApp()
+    except tk.TclError as e:
+        print(f"Tk timing skipped, no display: {e}")
+        return 0
+    app._update_check = lambda: None
+    app.GAUGE_ANIMATE = False
+    app._live.set(True)
+    app._on_part()
+    app.update_idletasks()
+
+    print(f"\n{'':<16}{'median':>9}{'p99':>9}{'max':>9}   (budget 16 ms)")
+    for kind in ("board only", "cpu or gpu", "flip two builds"):
+        samples = []
+        for change in _changes(kind, n // 3, rnd):
+            t0 = time.perf_counter()
+            for combo, name in change:
+                getattr(app, combo).set(name)
+            app.update_idletasks()
+            samples.append(time.perf_counter() - t0)
+        med, p99, mx = _stats(samples)
+        print(f"{kind:<16}{med:>7.2f}ms{p99:>7.2f}ms{mx:>7.2f}ms")
+    ls = app._live_score
+    print(f"partial terms: {ls.hits} hits, {ls.misses} misses")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
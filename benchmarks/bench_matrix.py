@@ -0,0 +1,55 @@
+"""
+Benchmark: bottleneck_matrix vs. a triple loop over calculate_bottleneck.
+
+    python benchmarks/bench_matrix.py
+
+Also checks that every cell of the cube matches the scalar engine.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import (CPU_LIST, GPU_LIST, MB_LIST, SIDES,
+                                   bottleneck_matrix, calculate_bottleneck)
+
+
+def main():
+    n = len(CPU_LIST) * len(GPU_LIST) * len(MB_LIST)
+
+    t0 = time.perf_counter()
+    cube = bottleneck_matrix()
+    t_vec = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for cpu in CPU_LIST:
+        for gpu in GPU_LIST:
+            for mb in MB_LIST:
+                calculate_bottleneck(cpu, gpu, mb)
+    t_loop = time.perf_counter() - t0
+
+    pct, side, gap = (cube[k].tolist() for k in ("bottleneck_pct", "side", "gap"))
+    thr, pcie, comp = (cube[k].tolist() for k in ("thread_penalty", "pcie_penalty", "compatible"))
+    mismatches = 0
+    for i, cpu in enumerate(CPU_LIST):
+        for j, gpu in enumerate(GPU_LIST):
+            for k, mb in enumerate(MB_LIST):
+                r = calculate_bottleneck(cpu, gpu, mb)
+                bd = r["breakdown"]
+                if (r["bottleneck_pct"] != pct[i][j][k] or r["side"] != SIDES[side[i][j][k]]
+                        or r["gap"] != gap[i][j][k] or r["compatible"] != comp[i][j][k]
+                        or bd["thread_penalty"] != thr[i][j][k] or bd["pcie_penalty"] != pcie[i][j][k]):
+                    mismatches += 1
+
+    print(f"combinations : {n:,}")
+    print(f"python loop  : {t_loop*1e3:9.1f} ms")
+    print(f"numpy matrix : {t_vec*1e3:9.1f} ms")
+    print(f"speedup      : {t_loop/t_vec:9.1f}x")
+    print(f"mismatches   : {mismatches}")
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Benchmark: numeric-only score_build vs. the full calculate_bottleneck.
+
+    python benchmarks/bench_numeric_core.py
+
+Runs every CPU × GPU pairing against a handful of boards and reports the
+per-call cost of each API, plus score_build when suggestions are read.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import (CPU_LIST, GPU_LIST, MB_LIST,
+                                   calculate_bottleneck, score_build)
+
+
+def _time(fn, builds):
+    t0 = time.perf_counter()
+    for cpu, gpu, mb in builds:
+        fn(cpu, gpu, mb)
+    return (time.perf_counter() - t0) / len(builds) * 1e6
+
+
+def main():
+    builds = [(c, g, m) for c in CPU_LIST for g in GPU_LIST for m in MB_LIST[::6]]
+    full    = _time(calculate_bottleneck, builds)
+    numeric = _time(score_build, builds)
+    lazy    = _time(lambda c, g, m: score_build(c, g, m).suggestions, builds)
+    print(f"builds                         : {len(builds):,}")
+    print(f"calculate_bottleneck           : {full:6.2f} µs/call")
+    print(f"score_build (numeric only)     : {numeric:6.2f} µs/call  ({full / numeric:.1f}x faster)")
+    print(f"score_build + .suggestions     : {lazy:6.2f} µs/call")
+
+
+if __name__ == "__main__":
+    main()
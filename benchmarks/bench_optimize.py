@@ -0,0 +1,116 @@
+"""
+Benchmark: best_builds (branch and bound) vs. scoring every build.
+
+    python benchmarks/bench_optimize.py [SCALES...]
+
+Prices the built-in CPU, GPU and board lists with a made-up but plausible
+curve (price rises steeply with perf_score, ± jitter) and scales the
+catalog by each SCALE (default 1, 3 and 10), replicating parts with
+jittered scores and prices. For a spread of budgets and both objectives
+it times the top-10 query two ways:
+
+  - brute force: score_build on every socket-compatible, affordable build,
+    then sort (run for catalogs up to 3x only, 10x takes minutes);
+  - best_builds: the branch-and-bound search.
+
+It reports both times and how many exact scores the search computed. It
+exits non-zero if the two disagree on any query.
+"""
+
+import itertools
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST, MB_LIST, ComponentRegistry, score_build
+from bottleneck_calculator.optimize import optimizer
+
+BUDGETS = (600, 900, 1300, 2000, 3500)
+K = 10
+
+
+def _price(rnd, perf, lo, hi):
+    return round((lo + (hi - lo) * (perf / 100) ** 2.5) * rnd.uniform(0.85, 1.15), 2)
+
+def catalog(scale, rnd):
+    cpus, gpus, mbs = [], [], []
+    for r in range(scale):
+        jit = (lambda s: s) if r == 0 else (lambda s: max(1, min(100, s + rnd.randint(-2, 2))))
+        for c in CPU_LIST:
+            s = jit(c.perf_score)
+            cpus.append(replace(c, name=f"{c.name} #{r}", perf_score=s,
+                                price=_price(rnd, s, 60, 650)))
+        for g in GPU_LIST:
+            s = jit(g.perf_score)
+            gpus.append(replace(g, name=f"{g.name} #{r}", perf_score=s,
+                                price=_price(rnd, s, 90, 2000)))
+        for m in MB_LIST:
+            mbs.append(replace(m, name=f"{m.name} #{r}",
+                               price=round(rnd.uniform(80, 200) + 60 * m.pcie_gen, 2)))
+    return cpus, gpus, mbs
+
+
+def brute_force(budget, k, objective, cpus, gpus, mbs):
+    keys, scored = [], 0
+    for (ci, c), (mi, m) in itertools.product(enumerate(cpus), enumerate(mbs)):
+        if c.socket != m.socket:
+            continue
+        for gi, g in enumerate(gpus):
+            price = c.price + m.price + g.price
+            if price > budget:
+                continue
+            pct, perf = score_build(c, g, m).bottleneck_pct, c.perf_score + g.perf_score
+            scored += 1
+            keys.append(((-perf, pct) if objective == "perf" else (pct, -perf)) + (price, ci, gi, mi))
+    keys.sort()
+    return [k_[2:] for k_ in keys[:k]], scored
+
+
+def run(scale, rnd):
+    cpus, gpus, mbs = catalog(scale, rnd)
+    reg = ComponentRegistry(cpus, gpus, mbs)
+    t0 = time.perf_counter()
+    opt = optimizer(reg)
+    build = (time.perf_counter() - t0) * 1e3
+    pos = {id(p): i for parts in (cpus, gpus, mbs) for i, p in enumerate(parts)}
+    check = scale <= 3
+
+    print(f"\n{len(cpus):,} CPUs × {len(gpus):,} GPUs × {len(mbs):,} boards"
+          f"  •  optimizer indexes {build:.1f} ms")
+    print(f"{'budget':>8} {'objective':<9}{'brute force':>14}{'builds scored':>15}"
+          f"{'best_builds':>13}{'scored':>8}{'speedup':>9}")
+    ok = True
+    for budget, objective in itertools.product(BUDGETS, ("balance", "perf")):
+        t0 = time.perf_counter()
+        got = opt.best(budget, K, objective)
+        t_bb = time.perf_counter() - t0
+        if check:
+            t0 = time.perf_counter()
+            want, scored = brute_force(budget, K, objective, cpus, gpus, mbs)
+            t_bf = time.perf_counter() - t0
+            mine = [(b.price, pos[id(b.score.cpu)], pos[id(b.score.gpu)], pos[id(b.score.mb)])
+                    for b in got]
+            same = mine == want
+            ok &= same
+            print(f"{budget:>8} {objective:<9}{t_bf * 1e3:>12.1f}ms{scored:>15,}"
+                  f"{t_bb * 1e3:>11.2f}ms{opt.evaluated:>8,}{t_bf / t_bb:>8.0f}x"
+                  f"{'' if same else '   MISMATCH'}")
+        else:
+            print(f"{budget:>8} {objective:<9}{'—':>14}{'—':>15}"
+                  f"{t_bb * 1e3:>11.2f}ms{opt.evaluated:>8,}{'—':>9}")
+    return ok
+
+
+def main():
+    scales = [int(a) for a in sys.argv[1:]] or [1, 3, 10]
+    rnd = random.Random(1)
+    ok = all([run(s, rnd) for s in scales])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
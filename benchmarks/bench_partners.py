@@ -0,0 +1,89 @@
+"""
+Benchmark: "which parts balance this one?", full evaluation vs. range scan.
+
+    python benchmarks/bench_partners.py [SIZES...]
+
+For synthetic catalogs (default 1k, 10k and 100k GPUs, and as many CPUs)
+built from the shipped lists with jittered perf_scores, it answers two
+questions for a sample of parts, two ways:
+
+  - GPUs for a CPU, and CPUs for a GPU on a given board;
+  - full: score_build against every candidate, keeping side == "Balanced"
+    (and, for CPUs, only those that fit the board's socket);
+  - range: balanced_gpus / balanced_cpus, a bisect on the registry's
+    perf_score indexes plus one slice, for the first page of 50 and for
+    all matches.
+
+Exits non-zero if the two ever disagree.
+"""
+
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import (CPU_LIST, GPU_LIST, MB_LIST, ComponentRegistry,
+                                   balanced_cpus, balanced_gpus, score_build)
+
+
+def catalog(base, n, rnd):
+    return [replace(rnd.choice(base), name=f"part {i}",
+                    perf_score=max(1, min(100, rnd.choice(base).perf_score + rnd.randint(-3, 3))))
+            for i in range(n)]
+
+
+def _ms(fn, args_list):
+    samples, out = [], []
+    for args in args_list:
+        t0 = time.perf_counter()
+        out.append(fn(*args))
+        samples.append(time.perf_counter() - t0)
+    return median(samples) * 1e3, out
+
+
+def run(n, rnd):
+    cpus, gpus = catalog(CPU_LIST, n, rnd), catalog(GPU_LIST, n, rnd)
+    reg = ComponentRegistry(cpus, gpus, MB_LIST)
+    t0 = time.perf_counter()
+    reg.gpu_index, reg.cpu_index
+    build = (time.perf_counter() - t0) * 1e3
+
+    cpu_q = [(c,) for c in rnd.sample(cpus, 20)]
+    gpu_q = [(g, rnd.choice(MB_LIST)) for g in rnd.sample(gpus, 20)]
+    full_gpus = lambda cpu: [g for g in gpus if score_build(cpu, g, MB_LIST[0]).side == "Balanced"]
+    full_cpus = lambda gpu, mb: [c for c in cpus if c.socket == mb.socket
+                                 and score_build(c, gpu, mb).side == "Balanced"]
+
+    ok = True
+    print(f"\n{n:,} CPUs and GPUs  •  perf_score indexes built in {build:.0f} ms")
+    for label, full, ranged, queries in (
+            ("GPUs for a CPU", full_gpus,
+             lambda cpu, **kw: balanced_gpus(cpu, registry=reg, **kw), cpu_q),
+            ("CPUs for GPU+board", full_cpus,
+             lambda gpu, mb, **kw: balanced_cpus(gpu, mb, registry=reg, **kw), gpu_q)):
+        t_full, want = _ms(full, queries)
+        t_page, pages = _ms(lambda *a: ranged(*a, limit=50), queries)
+        t_all, got = _ms(ranged, queries)
+        same = all(set(w) == set(g.parts) and len(w) == g.total == p.total
+                   for w, g, p in zip(want, got, pages))
+        ok &= same
+        avg = sum(len(w) for w in want) / len(want)
+        print(f"  {label:<19} full {t_full:9.3f} ms   range page {t_page:7.4f} ms"
+              f"   range all {t_all:7.4f} ms   {avg:7.0f} matches avg"
+              f"   {'ok' if same else 'MISMATCH'}")
+    return ok
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    rnd = random.Random(1)
+    ok = all([run(n, rnd) for n in sizes])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""
+Benchmark: per-keystroke latency of SearchCombo filtering.
+
+    python benchmarks/bench_search.py [SIZES...]
+
+Builds synthetic catalogs (default 10k and 100k names) from the built-in
+CPU and GPU lists, crossed with board-partner brands, product lines and a
+SKU code, the way a retailer feed looks. It then "types" a set of queries
+one character at a time. Each keystroke is timed three ways:
+
+  - the old linear filter (`q in v.lower()` over every item);
+  - SearchIndex.search as the dropdown uses it: the match count and the
+    ten visible rows (results are ranked lazily, as far as they are read);
+  - SearchIndex.search with every match ranked and read.
+
+It reports the index build time, and median / p95 / max per keystroke
+and the total.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import CPU_LIST, GPU_LIST
+from bottleneck_calculator.search import SearchIndex
+
+BRANDS = ("ASUS", "MSI", "Gigabyte", "Zotac", "Sapphire", "PowerColor", "XFX",
+          "Palit", "PNY", "Gainward", "ASRock", "Inno3D", "EVGA", "Colorful")
+LINES  = ("", "OC", "Gaming X", "TUF", "ROG Strix", "Eagle", "Ventus 2X",
+          "Pulse", "Nitro+", "Dual", "Twin Edge", "Phantom", "Trinity", "Aero")
+ROWS    = 10      # rows the dropdown shows
+QUERIES = ("4070 ti", "rtx 4070 ti super", "ryzen 7 7800x3d", "i7 13700k", "rx 7900 xtx",
+           "asus tuf 4080", "ti 4060", "arc a770", "sapphire nitro 7800", "5090")
+
+
+def catalog(n, seed=1):
+    rnd = random.Random(seed)
+    bases = [c.name for c in CPU_LIST] + [g.name for g in GPU_LIST]
+    names = []
+    for i in range(n):
+        b = rnd.choice(bases)
+        names.append(" ".join(filter(None, (rnd.choice(BRANDS), b, rnd.choice(LINES),
+                                            f"#{100000 + i}"))))
+    return names
+
+
+def linear(items, q):
+    q = q.lower()
+    return [v for v in items if q in v.lower()] if q else list(items)
+
+
+def _stats(samples):
+    s = sorted(samples)
+    return median(s) * 1e3, s[int(0.95 * (len(s) - 1))] * 1e3, s[-1] * 1e3, sum(s) * 1e3
+
+
+def run(n):
+    names = catalog(n)
+    t0 = time.perf_counter()
+    index = SearchIndex(names)
+    build = time.perf_counter() - t0
+
+    old, new, full = [], [], []
+    for q in QUERIES:
+        for k in range(1, len(q) + 1):
+            prefix = q[:k]
+            t0 = time.perf_counter(); linear(names, prefix);  old.append(time.perf_counter() - t0)
+            t0 = time.perf_counter()
+            r = index.search(prefix); len(r); r[:ROWS]
+            new.append(time.perf_counter() - t0)
+            t0 = time.perf_counter(); list(index.search(prefix)); full.append(time.perf_counter() - t0)
+
+    print(f"\n{n:,} names  •  index build {build * 1e3:.0f} ms  •  {len(new)} keystrokes")
+    print(f"{'':<26}{'median':>10}{'p95':>10}{'max':>10}{'total':>11}")
+    for label, s in (("linear q in v.lower()", old), (f"SearchIndex, {ROWS} rows", new),
+                     ("SearchIndex, all ranked", full)):
+        med, p95, mx, tot = _stats(s)
+        print(f"{label:<26}{med:>8.2f}ms{p95:>8.2f}ms{mx:>8.2f}ms{tot:>9.1f}ms")
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [10_000, 100_000]
+    for n in sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    main()
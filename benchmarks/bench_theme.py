@@ -0,0 +1,133 @@
+"""
+Benchmark: light/dark toggle cost, ThemeRegistry vs. the old tree walk.
+
+    python benchmarks/bench_theme.py [TOGGLES]
+
+Needs a display (X11, Windows or macOS). Builds the full BottleneckApp
+with a calculation shown, then times TOGGLES theme switches (default 50)
+each way, including update_idletasks():
+
+  - ThemeRegistry: the app's own _toggle_theme;
+  - tree walk: the previous recursive _restyle_all / _restyle_label /
+    _restyle_button, reproduced below, which re-derives each widget's
+    role from its current colours.
+"""
+
+import sys
+import time
+import tkinter as tk
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator.gui import THEMES, T, BottleneckApp, SearchCombo
+
+
+# ─────────────────────────── previous implementation ─────────────────────────
+def _refresh_combo(cb):
+    cb.configure(bg=T["card"])
+    cb._entry.configure(bg=T["entry_bg"], fg=T["entry_fg"], insertbackground=T["entry_fg"],
+                        highlightbackground=T["divider"], highlightcolor=T["primary"])
+    frame = cb._popup.winfo_children()[0] if cb._popup.winfo_children() else None
+    if frame:
+        frame.configure(bg=T["divider"])
+    cb._lb.configure(bg=T["list_bg"], fg=T["on_surface"],
+                     selectbackground=T["list_select"], selectforeground=T["on_surface"])
+
+def _restyle_all(app, widget):
+    cls = widget.__class__.__name__
+    try:
+        if isinstance(widget, SearchCombo):
+            _refresh_combo(widget)
+            return
+        if cls == "Frame":
+            bg = widget.cget("bg")
+            for key in ("bg", "card", "primary_light", "primary", "divider", "topbar_bg"):
+                if bg == THEMES["dark" if not app._dark else "light"][key]:
+                    widget.configure(bg=T[key])
+                    break
+        elif cls == "Label":
+            _restyle_label(app, widget)
+        elif cls == "Button":
+            _restyle_button(app, widget)
+        elif cls == "Canvas":
+            widget.configure(bg=T["card"])
+            if widget is app.gauge:
+                app._draw_gauge(app._last_pct, app._last_side)
+        elif cls == "Text":
+            widget.configure(bg=T["card"], fg=T["on_surface"])
+    except Exception:
+        pass
+    for child in widget.winfo_children():
+        _restyle_all(app, child)
+
+def _restyle_label(app, lbl):
+    try:
+        old_bg, old_fg = lbl.cget("bg"), lbl.cget("fg")
+        other = THEMES["dark" if not app._dark else "light"]
+        color_map = {other[k]: T[k] for k in
+                     ("bg", "card", "primary_light", "primary", "topbar_bg", "divider")}
+        fg_map = {other[k]: T[k] for k in
+                  ("on_surface", "on_bg", "secondary_text", "primary", "primary_dark",
+                   "on_primary", "topbar_fg", "topbar_sub", "divider", "success",
+                   "warning", "error", "accent")}
+        lbl.configure(bg=color_map.get(old_bg, old_bg), fg=fg_map.get(old_fg, old_fg))
+    except Exception:
+        pass
+
+def _restyle_button(app, btn):
+    try:
+        txt = btn.cget("text")
+        if "☀️" in txt or "🌙" in txt:
+            btn.configure(bg=T["toggle_bg"], fg=T["toggle_fg"], activebackground=T["primary_light"])
+            btn.configure(text=("☀️  Light Mode" if app._dark else "🌙  Dark Mode"))
+        elif "CALCULATE" in txt:
+            btn.configure(bg=T["accent"], fg="#FFFFFF", activebackground="#E65100")
+    except Exception:
+        pass
+
+def tree_walk_toggle(app):
+    app._dark = not app._dark
+    T.update(THEMES["dark"] if app._dark else THEMES["light"])
+    app.configure(bg=T["bg"])
+    _restyle_all(app, app)
+
+
+# ─────────────────────────── benchmark ───────────────────────────────────────
+def _time(app, toggle, n):
+    samples = []
+    for _ in range(n):
+        t0 = time.perf_counter()
+        toggle(app)
+        app.update_idletasks()
+        samples.append(time.perf_counter() - t0)
+    return samples
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    try:
+        app = BottleneckApp()
+    except tk.TclError as e:
+        print(f"needs a display: {e}")
+        return 2
+    app.withdraw()
+    app._calculate()          # default selection is a compatible build: no dialog
+    app.update_idletasks()
+
+    widgets, stack = 0, [app]
+    while stack:
+        w = stack.pop(); widgets += 1; stack.extend(w.winfo_children())
+
+    new = _time(app, BottleneckApp._toggle_theme, n)
+    old = _time(app, tree_walk_toggle, n)
+    print(f"{widgets} widgets  •  {n} toggles each")
+    for label, s in (("tree walk", old), ("ThemeRegistry", new)):
+        print(f"  {label:<14} median {median(s) * 1e3:7.2f} ms   max {max(s) * 1e3:7.2f} ms")
+    app.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
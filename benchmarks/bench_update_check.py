@@ -0,0 +1,114 @@
+"""
+Benchmark: update check latency against a local stub of the GitHub API.
+
+    python benchmarks/bench_update_check.py [DELAY_MS]
+
+Serves /releases/latest and /releases/tags/BC_Main from an in-process
+http.server that answers If-None-Match with 304 and sleeps DELAY_MS per
+request, then times check_update through its paths: cold (both endpoints
+fetched concurrently), warm within the TTL (no network), revalidated after
+the TTL (304s), and a server that never answers, with and without a
+cached failure. Exits non-zero if any path returns the wrong answer.
+"""
+
+import json
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bottleneck_calculator import RELEASE_TAG, check_update
+
+RELEASES = {
+    "/releases/latest":             {"tag_name": "v3.1.0", "html_url": "https://example.invalid/v3.1.0"},
+    f"/releases/tags/{RELEASE_TAG}": {"tag_name": RELEASE_TAG, "assets": [{"name": "bc.exe"}],
+                                      "html_url": "https://example.invalid/bc"},
+}
+
+
+def _stub(delay):
+    hits = {"200": 0, "304": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(delay)
+            body = RELEASES.get(self.path)
+            if body is None:
+                self.send_error(404)
+                return
+            etag = f'"{hash(json.dumps(body, sort_keys=True)) & 0xffffffff:x}"'
+            if self.headers.get("If-None-Match") == etag:
+                hits["304"] += 1
+                self.send_response(304)
+                self.send_header("ETag", etag)
+                self.end_headers()
+                return
+            hits["200"] += 1
+            data = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    return srv, hits
+
+
+def main():
+    delay = (float(sys.argv[1]) if len(sys.argv) > 1 else 300) / 1000
+    srv, hits = _stub(delay)
+    base = f"http://127.0.0.1:{srv.server_address[1]}"
+    urls = dict(latest_url=base + "/releases/latest",
+                tag_url=f"{base}/releases/tags/{RELEASE_TAG}")
+    cache = os.path.join(tempfile.mkdtemp(), "update.json")
+    ok = True
+
+    def run(label, expect, **kw):
+        nonlocal ok
+        t0 = time.perf_counter()
+        got = check_update(cache_path=cache, timeout=2, **kw)
+        dt = (time.perf_counter() - t0) * 1000
+        good = got == expect
+        ok &= good
+        print(f"{label:<34}{dt:>9.1f} ms   {got[0]!s:<8} {'ok' if good else 'WRONG'}"
+              f"   (200s {hits['200']}, 304s {hits['304']})")
+
+    want = ("v3.1.0", RELEASES["/releases/latest"]["html_url"])
+    print(f"stub server delay {delay * 1000:.0f} ms per request\n")
+    run("cold, both endpoints concurrently", want, **urls)
+    run("warm, within TTL (no network)", want, **urls)
+    run("after TTL, revalidated (304)", want, ttl=0, **urls)
+
+    RELEASES["/releases/latest"] = {"tag_name": RELEASE_TAG}     # no newer versioned release
+    run("after TTL, changed upstream", (RELEASE_TAG, "https://example.invalid/bc"), ttl=0, **urls)
+    srv.shutdown()
+    srv.server_close()
+
+    # A listener that never answers, like a firewall that drops packets:
+    # both requests time out together, so the cold case costs one timeout.
+    hole = socket.socket()
+    hole.bind(("127.0.0.1", 0))
+    hole.listen(8)
+    base = f"http://127.0.0.1:{hole.getsockname()[1]}"
+    urls = dict(latest_url=base + "/releases/latest",
+                tag_url=f"{base}/releases/tags/{RELEASE_TAG}")
+    os.remove(cache)
+    run("unreachable, cold (2 s timeout)", (None, None), **urls)
+    run("unreachable, cached failure", (None, None), **urls)
+    hole.close()
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+"""
+Benchmark: upgrade_plan (DP / beam search) vs. trying every swap sequence.
+
+    python benchmarks/bench_upgrade.py [SCALES...]
+
+Prices and scales the built-in catalog the same way bench_optimize.py does
+(default 1 and 10 times), then plans 3-step upgrades from random
+compatible builds at per-step budgets of 300, 600 and 1000:
+
+  - beam: UpgradePlanner.plan with the default beam;
+  - exhaustive (1x only, 10x takes seconds a plan): the same DP with
+    beam=None;
+  - blind (1x only, 2 steps, a few starts): every sequence of swaps over the
+    raw catalog, calling calculate_bottleneck for each build reached, with
+    no memo and no merging.
+
+It reports the median time and builds looked at per plan, and how often
+(and by how much) the beam plan falls short of the exhaustive one. It exits
+non-zero if the exhaustive and blind searches disagree.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+from statistics import median
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_optimize import catalog
+from bottleneck_calculator import calculate_bottleneck
+from bottleneck_calculator.upgrade import BEAM, UpgradePlanner
+
+BUDGETS = (300, 600, 1000)
+STEPS   = 3
+STARTS  = 20
+BLIND_STARTS = 5
+
+
+def blind(start, budget, steps, cpus, gpus, mbs):
+    """(pct_sum, spend, swaps) of the best plan, trying every upgrade sequence."""
+    calls = 0
+    def swaps(cpu, gpu, mb):
+        for g in gpus:
+            if g.perf_score > gpu.perf_score and g.price <= budget:
+                yield (cpu, g, mb), g.price
+        for m in mbs:
+            if m.socket == cpu.socket and m.pcie_gen > 3 >= mb.pcie_gen and m.price <= budget:
+                yield (cpu, gpu, m), m.price
+        for c in cpus:
+            if c.price > budget or not (c.perf_score > cpu.perf_score or
+                                        (c.perf_score == cpu.perf_score and c.cores > 4 >= cpu.cores)):
+                continue
+            if c.socket == mb.socket:
+                yield (c, gpu, mb), c.price
+            else:
+                for m in mbs:
+                    if m.socket == c.socket and c.price + m.price <= budget:
+                        yield (c, gpu, m), c.price + m.price
+    def best(build, pct, left):
+        nonlocal calls
+        if not left:
+            return (0.0, 0.0, 0)
+        a, s, n = best(build, pct, left - 1)                    # swap nothing
+        out = (a + pct, s, n)
+        for nb, price in swaps(*build):
+            q = calculate_bottleneck(*nb)["bottleneck_pct"]
+            calls += 1
+            a, s, n = best(nb, q, left - 1)
+            out = min(out, (a + q, s + price, n + 1))
+        return out
+    res = best(start, calculate_bottleneck(*start)["bottleneck_pct"], steps)
+    return res, calls
+
+
+def _plan(planner, start, budget, steps, beam):
+    t0 = time.perf_counter()
+    p = planner.plan(*start, budget, steps, beam)
+    return p, time.perf_counter() - t0, planner.evaluated
+
+
+def run(scale, rnd):
+    cpus, gpus, mbs = catalog(scale, rnd)
+    t0 = time.perf_counter()
+    planner = UpgradePlanner(cpus, gpus, mbs)
+    t_init = (time.perf_counter() - t0) * 1e3
+    starts = []
+    while len(starts) < STARTS:
+        c = rnd.choice(cpus)
+        boards = [m for m in mbs if m.socket == c.socket]
+        if boards:
+            starts.append((c, rnd.choice(gpus), rnd.choice(boards)))
+
+    print(f"\n{len(cpus):,} CPUs × {len(gpus):,} GPUs × {len(mbs):,} boards"
+          f"  •  planner indexes {t_init:.1f} ms, {STEPS} steps, {STARTS} starts per budget")
+    print(f"{'budget':>7}{'beam':>11}{'looked at':>11}{'exhaustive':>12}{'looked at':>11}"
+          f"{'beam = best':>13}{'worst gap':>11}")
+    ok, check = True, scale == 1
+    for budget in BUDGETS:
+        t_b, n_b, t_x, n_x, same, gap = [], [], [], [], 0, 0.0
+        for start in starts:
+            pb, t, n = _plan(planner, start, budget, STEPS, BEAM)
+            t_b.append(t); n_b.append(n)
+            if check:
+                px, t, n = _plan(planner, start, budget, STEPS, None)
+                t_x.append(t); n_x.append(n)
+                same += pb.pct_sum == px.pct_sum
+                gap = max(gap, pb.pct_sum - px.pct_sum)
+        line = f"{budget:>7}{median(t_b) * 1e3:>9.1f}ms{median(n_b):>11,.0f}"
+        if check:
+            line += (f"{median(t_x) * 1e3:>10.1f}ms{median(n_x):>11,.0f}"
+                     f"{same:>9}/{len(starts)}{gap:>11.1f}")
+        print(line)
+
+    if check:
+        budget, steps = 1000, 2
+        print(f"\nblind search, budget {budget}, {steps} steps:")
+        for start in starts[:BLIND_STARTS]:
+            t0 = time.perf_counter()
+            want, calls = blind(start, budget, steps, cpus, gpus, mbs)
+            t_bl = time.perf_counter() - t0
+            px, t_x, n_x = _plan(planner, start, budget, steps, None)
+            got = (px.pct_sum, px.spend, len(px.steps))
+            match = round(want[0], 1) == got[0] and abs(want[1] - got[1]) < 1e-6 \
+                and want[2] == got[2]
+            ok &= match
+            print(f"  blind {t_bl:7.2f} s ({calls:,} calls)   exhaustive DP {t_x * 1e3:6.1f} ms"
+                  f" ({n_x:,})   {t_bl / t_x:6.0f}x   {'ok' if match else 'MISMATCH'}")
+    return ok
+
+
+def main():
+    scales = [int(a) for a in sys.argv[1:]] or [1, 10]
+    rnd = random.Random(1)
+    ok = all([run(s, rnd) for s in scales])
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""
+Bottleneck Calculator v3.0.0
+- Light / Dark mode toggle
+- Searchable dropdowns
+- Simplified motherboard names (H510, B550, Z790…)
+- Low Profile GPU models included
+- VRAM shown in GPU names (8GB, 16GB…)
+
+Importing the package loads only the models, data and scalar engine, and
+not the built-in data when $BOTTLENECK_DB names a database file. The Tk
+stack (BottleneckApp, SearchCombo, THEMES, T), the columnar store and
+database file support, and NumPy for the matrix engine are imported on
+first use, so headless processes start fast.
+
+    python -m bottleneck_calculator            # desktop app
+    python -m bottleneck_calculator batch ...  # headless batch scoring
+    python -m bottleneck_calculator db ...     # export / inspect a database file
+    python -m bottleneck_calculator serve ...  # HTTP scoring service (+ loadtest)
+"""
+
+from .models import CPU, GPU, Motherboard
+from .engine import (BALANCED_GAP, REGISTRY, SIDES, BottleneckCache, BottleneckScore,
+                     CacheInfo, ComponentRegistry, LiveScorer, PartnerPage, ScoreIndex,
+                     balanced_cpus, balanced_gpus, bottleneck_matrix,
+                     build_suggestions, cached_bottleneck, calculate_bottleneck,
+                     component_arrays, normalize_name, score_build)
+from .update import (CURRENT_VER, DOWNLOAD_PAGE, GITHUB_REPO, LATEST_URL, RELEASE_TAG,
+                     RELEASES_URL, UPDATE_TTL, check_update, check_update_async)
+
+_LAZY = {
+    "CPU_LIST": "data", "GPU_LIST": "data", "MB_LIST": "data",
+    "BottleneckApp": "gui", "SearchCombo": "gui", "VirtualListbox": "gui",
+    "THEMES": "gui", "T": "gui", "THEME": "gui", "ThemeRegistry": "gui",
+    "CalcJobs": "gui",
+    "CodeTable": "columns", "ColumnCatalog": "columns", "ColumnTable": "columns",
+    "RowList": "columns",
+    "Database": "database", "open_database": "database", "write_database": "database",
+    "SearchIndex": "search", "NameMatcher": "fuzzy",
+    "Build": "optimize", "BuildOptimizer": "optimize", "best_builds": "optimize",
+    "FrontierBuild": "frontier", "ParetoTable": "frontier", "cheapest_build": "frontier",
+    "Plan": "upgrade", "Step": "upgrade", "UpgradePlanner": "upgrade", "upgrade_plan": "upgrade",
+}
+
+def __getattr__(name):
+    if name in _LAZY:
+        from importlib import import_module
+        return getattr(import_module(f".{_LAZY[name]}", __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,33 @@
+"""Entry point: `python -m bottleneck_calculator [batch | db | serve | loadtest | frontier ...]`."""
+
+import os
+import sys
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "batch":
+        from .batch import main as batch_main
+        return batch_main(argv[1:])
+    if argv and argv[0] == "db":
+        from .database import main as db_main
+        return db_main(argv[1:])
+    if argv and argv[0] == "serve":
+        from .server import main as serve_main
+        return serve_main(argv[1:])
+    if argv and argv[0] == "loadtest":
+        from .loadtest import main as loadtest_main
+        return loadtest_main(argv[1:])
+    if argv and argv[0] == "frontier":
+        from .frontier import main as frontier_main
+        return frontier_main(argv[1:])
+    if os.environ.get("BOTTLENECK_DEBUG"):
+        import logging
+        logging.basicConfig(level=logging.DEBUG, format="%(relativeCreated)8.0f ms  %(message)s")
+    from .gui import BottleneckApp
+    app = BottleneckApp()
+    app.mainloop()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
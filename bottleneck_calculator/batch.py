@@ -0,0 +1,277 @@
+"""
+Headless batch scoring — `python -m bottleneck_calculator batch`.
+
+Reads CPU / GPU / board name triples from a file or stdin (CSV or JSONL)
+and streams one result line per input row, so memory stays flat however
+long the input is. Names are resolved through REGISTRY, so the forgiving
+forms ("i7 13700k", "rtx 4070 ti", "z790") work too; with `--fuzzy`,
+typos and run-together names ("RTX4070TI 12G") resolve to their nearest
+part, and each row says what it matched and how confidently.
+`--workers N` shards the input across a process pool in chunks.
+Throughput is reported on stderr when the run finishes.
+
+    CSV   cpu,gpu,board              (header optional; "motherboard"/"mb" also accepted)
+    JSONL {"cpu": ..., "gpu": ..., "board": ...}
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+from itertools import chain, islice
+
+from .engine import REGISTRY, cached_bottleneck
+
+FIELDS = ("cpu", "gpu", "board", "bottleneck_pct", "side", "compatible",
+          "gap", "thread_penalty", "pcie_penalty", "error")
+FUZZY_FIELDS = ("cpu_match", "gpu_match", "board_match", "confidence")
+_BOARD_KEYS = ("board", "motherboard", "mb")
+
+
+# ─────────────────────────── INPUT ───────────────────────────────────────────
+def _sniff(lines):
+    """Guess the input format from the first non-blank line."""
+    lines = iter(lines)
+    for first in lines:
+        if first.strip():
+            fmt = "jsonl" if first.lstrip().startswith("{") else "csv"
+            return fmt, chain([first], lines)
+    return "csv", iter(())
+
+def read_rows(lines, fmt):
+    """Yield (cpu, gpu, board) name triples from CSV or JSONL lines."""
+    if fmt == "jsonl":
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                d = json.loads(line)
+            except ValueError:
+                d = {}
+            if not isinstance(d, dict):                 # 5, [..], "x": same as unparsable
+                d = {}
+            board = next((d[k] for k in _BOARD_KEYS if k in d), "")
+            yield str(d.get("cpu", "")), str(d.get("gpu", "")), str(board)
+        return
+
+    reader = csv.reader(lines)
+    first = next(reader, None)
+    if first is None:
+        return
+    head = [h.strip().lower() for h in first]
+    if "cpu" in head and "gpu" in head:
+        ci, gi = head.index("cpu"), head.index("gpu")
+        bi = next((head.index(k) for k in _BOARD_KEYS if k in head), None)
+        rows = reader
+    else:
+        ci, gi, bi = 0, 1, 2
+        rows = chain([first], reader)
+    for r in rows:
+        if not r:
+            continue
+        get = lambda i: r[i].strip() if i is not None and i < len(r) else ""
+        yield get(ci), get(gi), get(bi)
+
+
+# ─────────────────────────── SCORING ─────────────────────────────────────────
+def score_row(cpu_n, gpu_n, mb_n, suggestions=False, fuzzy=False):
+    """Score one name triple; unresolved names give an `error` field instead."""
+    out = {"cpu": cpu_n, "gpu": gpu_n, "board": mb_n}
+    if fuzzy:
+        hits = [REGISTRY.resolve(k, n) for k, n in (("cpu", cpu_n), ("gpu", gpu_n), ("board", mb_n))]
+        cpu, gpu, mb = (h and h.part for h in hits)
+        for k, h in zip(FUZZY_FIELDS, hits):
+            if h is not None:
+                out[k] = h.part.name
+        if any(hits):
+            out["confidence"] = min(h.confidence for h in hits if h is not None)
+    else:
+        cpu, gpu, mb = REGISTRY.cpu(cpu_n), REGISTRY.gpu(gpu_n), REGISTRY.board(mb_n)
+    missing = [k for k, p in (("cpu", cpu), ("gpu", gpu), ("board", mb)) if p is None]
+    if missing:
+        out["error"] = "not found: " + ", ".join(missing)
+        return out
+    r = cached_bottleneck(cpu, gpu, mb)
+    out.update(bottleneck_pct=r.bottleneck_pct, side=r.side,
+               compatible=r.compatible, gap=r.gap,
+               thread_penalty=r.thread_penalty, pcie_penalty=r.pcie_penalty)
+    if suggestions:
+        out["suggestions"] = list(r.suggestions)
+    return out
+
+def score_rows(rows, suggestions=False, fuzzy=False):
+    for cpu_n, gpu_n, mb_n in rows:
+        yield score_row(cpu_n, gpu_n, mb_n, suggestions, fuzzy)
+
+
+# ─────────────────────────── OUTPUT ──────────────────────────────────────────
+def _fields(suggestions, fuzzy=False):
+    return FIELDS + (FUZZY_FIELDS if fuzzy else ()) + (("suggestions",) if suggestions else ())
+
+def _writer(stream, fmt, suggestions, fuzzy=False):
+    """Return write(row) that appends one CSV (no header) or JSONL line."""
+    if fmt == "jsonl":
+        return lambda row: stream.write(json.dumps(row, ensure_ascii=False) + "\n")
+    w = csv.DictWriter(stream, _fields(suggestions, fuzzy), restval="", lineterminator="\n")
+    def write(row):
+        if "suggestions" in row:
+            row = dict(row, suggestions=" | ".join(row["suggestions"]))
+        w.writerow(row)
+    return write
+
+def encode_rows(rows, fmt, suggestions=False, fuzzy=False):
+    """Serialise result rows to CSV (no header) or JSONL text."""
+    buf = io.StringIO()
+    write = _writer(buf, fmt, suggestions, fuzzy)
+    for r in rows:
+        write(r)
+    return buf.getvalue()
+
+def _header(fmt, suggestions, fuzzy=False):
+    return ",".join(_fields(suggestions, fuzzy)) + "\n" if fmt == "csv" else ""
+
+
+# ─────────────────────────── PARALLEL ────────────────────────────────────────
+# Workers import this module once, which builds REGISTRY and the recommendation
+# indexes in-process (or inherits them on fork); tasks carry only name triples
+# and hand back ready-to-write text, so nothing heavy is pickled per chunk.
+def _init_worker(cache_size, db_path):
+    # Forked workers inherit the parent's mapping; spawned ones map the file.
+    if db_path and REGISTRY.source != db_path:
+        REGISTRY.load_database(db_path)
+    cached_bottleneck.resize(cache_size)
+
+def _score_chunk(chunk, fmt, suggestions, fuzzy=False):
+    rows = [score_row(c, g, m, suggestions, fuzzy) for c, g, m in chunk]
+    return encode_rows(rows, fmt, suggestions, fuzzy), len(rows), sum("error" in r for r in rows)
+
+def _chunks(rows, size):
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+def _parallel(rows, fmt, suggestions, workers, chunk_size, ordered, fuzzy=False):
+    # At most 2 chunks per worker are in flight, so memory stays bounded.
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(cached_bottleneck.maxsize, REGISTRY.source)) as pool:
+        pending = deque() if ordered else set()
+        for chunk in _chunks(rows, chunk_size):
+            if len(pending) >= 2 * workers:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from (f.result() for f in done)
+            fut = pool.submit(_score_chunk, chunk, fmt, suggestions, fuzzy)
+            pending.append(fut) if ordered else pending.add(fut)
+        if ordered:
+            yield from (f.result() for f in pending)
+        else:
+            yield from (f.result() for f in as_completed(pending))
+
+def run_batch(rows, out, fmt="jsonl", suggestions=False,
+              workers=1, chunk_size=2000, ordered=True, fuzzy=False):
+    """
+    Score (cpu, gpu, board) triples and write results to `out`. With
+    workers > 1, chunks are scored in a process pool; output keeps input
+    order unless ordered=False. fuzzy=True resolves names with
+    REGISTRY.resolve and adds FUZZY_FIELDS. Returns (rows, unresolved).
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}")
+    out.write(_header(fmt, suggestions, fuzzy))
+    n = errors = 0
+    if workers <= 1:
+        write = _writer(out, fmt, suggestions, fuzzy)
+        for row in score_rows(rows, suggestions, fuzzy):
+            write(row)
+            n += 1
+            errors += "error" in row
+        return n, errors
+    for text, k, e in _parallel(rows, fmt, suggestions, workers, chunk_size, ordered, fuzzy):
+        out.write(text)
+        n += k
+        errors += e
+    return n, errors
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+def _at_least(lo):
+    """argparse type: an int no smaller than `lo`."""
+    def parse(text):
+        n = int(text)
+        if n < lo:
+            raise argparse.ArgumentTypeError(f"must be at least {lo}, got {n}")
+        return n
+    parse.__name__ = "int"                              # argparse's "invalid int value"
+    return parse
+
+def _parser():
+    ap = argparse.ArgumentParser(
+        prog="python -m bottleneck_calculator batch",
+        description="Score CPU/GPU/board name triples from CSV or JSONL.")
+    ap.add_argument("input", nargs="?", default="-",
+                    help="input file (default: stdin)")
+    ap.add_argument("-o", "--output", default="-",
+                    help="output file (default: stdout)")
+    ap.add_argument("-f", "--format", choices=("csv", "jsonl"),
+                    help="input format (default: from extension, else sniffed)")
+    ap.add_argument("-t", "--to", choices=("csv", "jsonl"),
+                    help="output format (default: same as input)")
+    ap.add_argument("--suggestions", action="store_true",
+                    help="include suggestion text in each result")
+    ap.add_argument("--fuzzy", action="store_true",
+                    help="resolve misspelt or run-together names to the nearest part "
+                         "and report the matches and their confidence")
+    ap.add_argument("--db", metavar="PATH",
+                    help="component database file (default: $BOTTLENECK_DB or built-in)")
+    ap.add_argument("-w", "--workers", type=_at_least(0), default=1,
+                    help="worker processes; 0 = one per CPU (default: 1)")
+    ap.add_argument("--chunk-size", type=_at_least(1), default=2000,
+                    help="rows per worker task (default: 2000)")
+    ap.add_argument("--cache-size", type=_at_least(0), default=4096,
+                    help="LRU result cache entries per process; 0 disables (default: 4096)")
+    ap.add_argument("--unordered", action="store_true",
+                    help="write chunks as they finish instead of in input order")
+    return ap
+
+def _format_for(path):
+    ext = path.rsplit(".", 1)[-1].lower() if "." in path else ""
+    return {"csv": "csv", "jsonl": "jsonl", "ndjson": "jsonl"}.get(ext)
+
+def main(argv=None):
+    args = _parser().parse_args(argv)
+    workers = args.workers or os.cpu_count() or 1
+    if args.db:
+        REGISTRY.load_database(args.db)
+    cached_bottleneck.resize(args.cache_size)
+    src = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8", newline="")
+    dst = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8", newline="")
+    try:
+        fmt = args.format or _format_for(args.input)
+        lines = src
+        if fmt is None:
+            fmt, lines = _sniff(src)
+        t0 = time.perf_counter()
+        n, errors = run_batch(read_rows(lines, fmt), dst, args.to or fmt,
+                              args.suggestions, workers, args.chunk_size,
+                              not args.unordered, args.fuzzy)
+        dt = time.perf_counter() - t0
+    finally:
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+
+    print(f"{n:,} rows ({errors:,} unresolved) in {dt:.2f}s — "
+          f"{n / dt if dt else 0:,.0f} rows/s  [{workers} worker(s)]", file=sys.stderr)
+    if workers <= 1:
+        ci = cached_bottleneck.info()
+        print(f"cache: {ci.hits:,} hits, {ci.misses:,} misses, {ci.evictions:,} evictions",
+              file=sys.stderr)
+    return 0
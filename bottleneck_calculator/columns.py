@@ -0,0 +1,178 @@
+"""
+Columnar (struct-of-arrays) component store for large catalogs.
+
+A ColumnTable keeps one compact `array` per numeric field, interns the
+string fields (socket, vendor, generation, chipset) to small integer codes
+shared across tables, and packs every name into one UTF-8 blob plus an
+offsets column. Rows are only materialised as dataclasses on request; a
+RowList presents a table as a list that does so row by row, on first access.
+Columns may be `array`s or memoryviews over a mapped database file (see
+database.py); ColumnCatalog.arrays() hands the columns bottleneck_matrix
+reads to NumPy without copying either way.
+"""
+
+from array import array
+from bisect import bisect_left
+from collections.abc import Sequence
+from dataclasses import fields
+from zlib import crc32
+
+from .models import CPU, GPU, Motherboard
+
+_TYPECODES = {int: "i", float: "d", bool: "B"}
+
+def _name_hash(name):
+    return crc32(name.encode("utf-8"))
+
+def _typecode(col):
+    return col.typecode if isinstance(col, array) else col.format
+
+
+class CodeTable:
+    """Interns strings to dense integer codes."""
+    def __init__(self, values=()):
+        self.values = list(values)
+        self._codes = {v: i for i, v in enumerate(self.values)}
+
+    def code(self, value):
+        c = self._codes.get(value)
+        if c is None:
+            c = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return c
+
+    def get(self, value, default=None):
+        return self._codes.get(value, default)
+
+
+class ColumnTable:
+    """One component table (CPUs, GPUs or boards) stored column-wise."""
+    def __init__(self, cls, parts, codes=None):
+        self.cls     = cls
+        self.codes   = CodeTable() if codes is None else codes
+        self._fields = [f for f in fields(cls) if f.name != "name"]
+        self._str_fields = {f.name for f in self._fields if f.type is str}
+        self.columns = {}
+        for f in self._fields:
+            if f.type is str:
+                col = array("H", (self.codes.code(getattr(p, f.name)) for p in parts))
+            else:
+                col = array(_TYPECODES[f.type], (getattr(p, f.name) for p in parts))
+            self.columns[f.name] = col
+
+        names = [p.name.encode("utf-8") for p in parts]
+        self.blob    = b"".join(names)
+        self.offsets = array("I", [0])
+        for n in names:
+            self.offsets.append(self.offsets[-1] + len(n))
+        # Name lookups bisect a sorted column of stable 32-bit name hashes
+        # (crc32), so no per-name dict is kept alongside the blob.
+        order = sorted(range(len(names)), key=lambda i: (crc32(names[i]), i))
+        self.hashes    = array("I", (crc32(names[i]) for i in order))
+        self.hash_rows = array("I", order)
+
+    @classmethod
+    def from_buffers(cls, model, columns, blob, offsets, hashes, hash_rows, codes):
+        """Wrap existing column buffers (e.g. memoryviews of a mapped file)."""
+        self = cls.__new__(cls)
+        self.cls, self.codes, self.columns = model, codes, columns
+        self._fields = [f for f in fields(model) if f.name != "name"]
+        self._str_fields = {f.name for f in self._fields if f.type is str}
+        self.blob, self.offsets = blob, offsets
+        self.hashes, self.hash_rows = hashes, hash_rows
+        return self
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        return (self.row(i) for i in range(len(self)))
+
+    def name(self, i):
+        return str(self.blob[self.offsets[i]:self.offsets[i + 1]], "utf-8")
+
+    def value(self, field, i):
+        v = self.columns[field][i]
+        return self.codes.values[v] if field in self._str_fields else v
+
+    def row(self, i):
+        """Materialise row `i` as a CPU / GPU / Motherboard."""
+        vals = {}
+        for f in self._fields:
+            v = self.columns[f.name][i]
+            vals[f.name] = (self.codes.values[v] if f.type is str
+                            else bool(v) if f.type is bool else v)
+        return self.cls(self.name(i), **vals)
+
+    def find(self, name):
+        """Row index for an exact name, or -1."""
+        h = _name_hash(name)
+        j = bisect_left(self.hashes, h)
+        while j < len(self.hashes) and self.hashes[j] == h:
+            i = self.hash_rows[j]
+            if self.name(i) == name:
+                return i
+            j += 1
+        return -1
+
+    def get(self, name, default=None):
+        i = self.find(name)
+        return self.row(i) if i >= 0 else default
+
+
+class RowList(Sequence):
+    """
+    A ColumnTable as a read-only list. Each row is materialised the first
+    time it is read and then kept, so a row is always the same object.
+    """
+    def __init__(self, table):
+        self.table = table
+        self._rows = [None] * len(table)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self._rows)))]
+        row = self._rows[i]
+        if row is None:
+            row = self._rows[i] = self.table.row(range(len(self._rows))[i])
+        return row
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self._rows)))
+
+    def names(self):
+        """Every row's name, without materialising the rows."""
+        return [self.table.name(i) for i in range(len(self._rows))]
+
+
+class ColumnCatalog:
+    """CPU, GPU and board tables sharing one string code table."""
+    TABLES = (("cpu", CPU), ("gpu", GPU), ("board", Motherboard))
+
+    def __init__(self, cpus, gpus, mbs):
+        self.codes = CodeTable()
+        self.cpu   = ColumnTable(CPU, cpus, self.codes)
+        self.gpu   = ColumnTable(GPU, gpus, self.codes)
+        self.board = ColumnTable(Motherboard, mbs, self.codes)
+
+    @classmethod
+    def from_tables(cls, codes, cpu, gpu, board):
+        self = cls.__new__(cls)
+        self.codes, self.cpu, self.gpu, self.board = codes, cpu, gpu, board
+        return self
+
+    def arrays(self):
+        """Zero-copy NumPy views in the layout bottleneck_matrix expects."""
+        import numpy as np
+        view = lambda col: np.frombuffer(col, dtype=np.dtype(_typecode(col)))
+        return {
+            "cpu_perf":   view(self.cpu.columns["perf_score"]),
+            "cpu_cores":  view(self.cpu.columns["cores"]),
+            "cpu_socket": view(self.cpu.columns["socket"]),
+            "gpu_perf":   view(self.gpu.columns["perf_score"]),
+            "mb_pcie":    view(self.board.columns["pcie_gen"]),
+            "mb_socket":  view(self.board.columns["socket"]),
+        }
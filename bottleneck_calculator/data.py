@@ -0,0 +1,386 @@
+"""Built-in component database."""
+
+from .models import CPU, GPU, Motherboard
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CPU DATABASE
+# ══════════════════════════════════════════════════════════════════════════════
+CPU_LIST = [
+    # Intel Arrow Lake LGA1851
+    CPU("Intel Core Ultra 9 285K",   24,24,3.7,5.7,125, 92,"LGA1851","Arrow Lake"),
+    CPU("Intel Core Ultra 7 265K",   20,20,3.9,5.5,125, 88,"LGA1851","Arrow Lake"),
+    CPU("Intel Core Ultra 7 265KF",  20,20,3.9,5.5,125, 88,"LGA1851","Arrow Lake"),
+    CPU("Intel Core Ultra 5 245K",   14,14,4.2,5.2,125, 82,"LGA1851","Arrow Lake"),
+    CPU("Intel Core Ultra 5 245KF",  14,14,4.2,5.2,125, 82,"LGA1851","Arrow Lake"),
+    # Intel 14th Gen LGA1700
+    CPU("Intel Core i9-14900KS",     24,32,3.2,6.2,150, 93,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i9-14900K",      24,32,3.2,6.0,125, 91,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i9-14900KF",     24,32,3.2,6.0,125, 91,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i9-14900F",      24,32,2.0,5.8, 65, 87,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i7-14700K",      20,28,3.4,5.6,125, 88,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i7-14700KF",     20,28,3.4,5.6,125, 88,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i7-14700F",      20,28,2.1,5.4, 65, 84,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i5-14600K",      14,20,3.5,5.3,125, 80,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i5-14600KF",     14,20,3.5,5.3,125, 80,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i5-14500",       14,20,2.6,5.0, 65, 75,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i5-14400F",      10,16,2.5,4.7, 65, 68,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i5-14400",       10,16,2.5,4.7, 65, 68,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i3-14100F",       4, 8,3.5,4.7, 58, 52,"LGA1700","Raptor Lake Refresh"),
+    CPU("Intel Core i3-14100",        4, 8,3.5,4.7, 58, 52,"LGA1700","Raptor Lake Refresh"),
+    # Intel 13th Gen LGA1700
+    CPU("Intel Core i9-13900KS",     24,32,3.2,6.0,150, 92,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i9-13900K",      24,32,3.0,5.8,125, 90,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i9-13900KF",     24,32,3.0,5.8,125, 90,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i9-13900F",      24,32,2.0,5.6, 65, 86,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i7-13700K",      16,24,3.4,5.4,125, 86,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i7-13700KF",     16,24,3.4,5.4,125, 86,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i7-13700F",      16,24,2.1,5.2, 65, 82,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i5-13600K",      14,20,3.5,5.1,125, 79,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i5-13600KF",     14,20,3.5,5.1,125, 79,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i5-13500",       14,20,2.5,4.8, 65, 73,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i5-13400F",      10,16,2.5,4.6, 65, 66,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i5-13400",       10,16,2.5,4.6, 65, 66,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i3-13100F",       4, 8,3.4,4.5, 58, 50,"LGA1700","Raptor Lake"),
+    CPU("Intel Core i3-13100",        4, 8,3.4,4.5, 58, 50,"LGA1700","Raptor Lake"),
+    # Intel 12th Gen LGA1700
+    CPU("Intel Core i9-12900KS",     16,24,3.4,5.5,150, 84,"LGA1700","Alder Lake"),
+    CPU("Intel Core i9-12900K",      16,24,3.2,5.2,125, 82,"LGA1700","Alder Lake"),
+    CPU("Intel Core i9-12900KF",     16,24,3.2,5.2,125, 82,"LGA1700","Alder Lake"),
+    CPU("Intel Core i7-12700K",      12,20,3.6,5.0,125, 78,"LGA1700","Alder Lake"),
+    CPU("Intel Core i7-12700KF",     12,20,3.6,5.0,125, 78,"LGA1700","Alder Lake"),
+    CPU("Intel Core i7-12700F",      12,20,2.1,4.9, 65, 75,"LGA1700","Alder Lake"),
+    CPU("Intel Core i5-12600K",      10,16,3.7,4.9,125, 72,"LGA1700","Alder Lake"),
+    CPU("Intel Core i5-12600KF",     10,16,3.7,4.9,125, 72,"LGA1700","Alder Lake"),
+    CPU("Intel Core i5-12500",        6,12,3.0,4.6, 65, 65,"LGA1700","Alder Lake"),
+    CPU("Intel Core i5-12400F",       6,12,2.5,4.4, 65, 63,"LGA1700","Alder Lake"),
+    CPU("Intel Core i5-12400",        6,12,2.5,4.4, 65, 63,"LGA1700","Alder Lake"),
+    CPU("Intel Core i3-12100F",       4, 8,3.3,4.3, 58, 47,"LGA1700","Alder Lake"),
+    CPU("Intel Core i3-12100",        4, 8,3.3,4.3, 58, 47,"LGA1700","Alder Lake"),
+    # Intel 11th Gen LGA1200
+    CPU("Intel Core i9-11900K",       8,16,3.5,5.2,125, 65,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i9-11900KF",      8,16,3.5,5.2,125, 65,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i7-11700K",       8,16,3.6,5.0,125, 62,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i7-11700KF",      8,16,3.6,5.0,125, 62,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i7-11700F",       8,16,2.5,4.9, 65, 59,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i5-11600K",       6,12,3.9,4.9,125, 57,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i5-11600KF",      6,12,3.9,4.9,125, 57,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i5-11400F",       6,12,2.6,4.4, 65, 52,"LGA1200","Rocket Lake"),
+    CPU("Intel Core i3-11100F",       4, 8,3.6,4.4, 65, 42,"LGA1200","Rocket Lake"),
+    # Intel 10th Gen LGA1200
+    CPU("Intel Core i9-10900K",      10,20,3.7,5.3,125, 60,"LGA1200","Comet Lake"),
+    CPU("Intel Core i9-10900KF",     10,20,3.7,5.3,125, 60,"LGA1200","Comet Lake"),
+    CPU("Intel Core i7-10700K",       8,16,3.8,5.1,125, 57,"LGA1200","Comet Lake"),
+    CPU("Intel Core i7-10700KF",      8,16,3.8,5.1,125, 57,"LGA1200","Comet Lake"),
+    CPU("Intel Core i7-10700F",       8,16,2.9,4.8, 65, 54,"LGA1200","Comet Lake"),
+    CPU("Intel Core i5-10600K",       6,12,4.1,4.8,125, 52,"LGA1200","Comet Lake"),
+    CPU("Intel Core i5-10600KF",      6,12,4.1,4.8,125, 52,"LGA1200","Comet Lake"),
+    CPU("Intel Core i5-10400F",       6,12,2.9,4.3, 65, 46,"LGA1200","Comet Lake"),
+    CPU("Intel Core i5-10400",        6,12,2.9,4.3, 65, 46,"LGA1200","Comet Lake"),
+    CPU("Intel Core i3-10100F",       4, 8,3.6,4.3, 65, 38,"LGA1200","Comet Lake"),
+    CPU("Intel Core i3-10100",        4, 8,3.6,4.3, 65, 38,"LGA1200","Comet Lake"),
+    # Intel 9th Gen LGA1151
+    CPU("Intel Core i9-9900KS",       8,16,4.0,5.0,127, 56,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i9-9900K",        8,16,3.6,5.0, 95, 54,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i9-9900KF",       8,16,3.6,5.0, 95, 54,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i7-9700K",        8, 8,3.6,4.9, 95, 50,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i7-9700KF",       8, 8,3.6,4.9, 95, 50,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i5-9600K",        6, 6,3.7,4.6, 95, 45,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i5-9600KF",       6, 6,3.7,4.6, 95, 45,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i5-9400F",        6, 6,2.9,4.1, 65, 40,"LGA1151","Coffee Lake R"),
+    CPU("Intel Core i3-9100F",        4, 4,3.6,4.2, 65, 33,"LGA1151","Coffee Lake R"),
+    # Intel 8th Gen LGA1151
+    CPU("Intel Core i7-8700K",        6,12,3.7,4.7, 95, 47,"LGA1151","Coffee Lake"),
+    CPU("Intel Core i7-8700",         6,12,3.2,4.6, 65, 44,"LGA1151","Coffee Lake"),
+    CPU("Intel Core i5-8600K",        6, 6,3.6,4.3, 95, 41,"LGA1151","Coffee Lake"),
+    CPU("Intel Core i5-8400",         6, 6,2.8,4.0, 65, 37,"LGA1151","Coffee Lake"),
+    CPU("Intel Core i3-8100",         4, 4,3.6,3.6, 65, 30,"LGA1151","Coffee Lake"),
+    # Intel 7th Gen LGA1151
+    CPU("Intel Core i7-7700K",        4, 8,4.2,4.5, 91, 38,"LGA1151","Kaby Lake"),
+    CPU("Intel Core i7-7700",         4, 8,3.6,4.2, 65, 35,"LGA1151","Kaby Lake"),
+    CPU("Intel Core i5-7600K",        4, 4,3.8,4.2, 91, 32,"LGA1151","Kaby Lake"),
+    CPU("Intel Core i5-7500",         4, 4,3.4,3.8, 65, 29,"LGA1151","Kaby Lake"),
+    CPU("Intel Core i3-7100",         2, 4,3.9,3.9, 51, 22,"LGA1151","Kaby Lake"),
+    # Intel 6th Gen LGA1151
+    CPU("Intel Core i7-6700K",        4, 8,4.0,4.2, 91, 35,"LGA1151","Skylake"),
+    CPU("Intel Core i7-6700",         4, 8,3.4,4.0, 65, 32,"LGA1151","Skylake"),
+    CPU("Intel Core i5-6600K",        4, 4,3.5,3.9, 91, 28,"LGA1151","Skylake"),
+    CPU("Intel Core i5-6500",         4, 4,3.2,3.6, 65, 25,"LGA1151","Skylake"),
+    CPU("Intel Core i3-6100",         2, 4,3.7,3.7, 51, 19,"LGA1151","Skylake"),
+    # Intel HEDT LGA2066
+    CPU("Intel Core i9-10980XE",     18,36,3.0,4.8,165, 78,"LGA2066","Cascade Lake-X"),
+    CPU("Intel Core i9-10940X",      14,28,3.3,4.8,165, 74,"LGA2066","Cascade Lake-X"),
+    CPU("Intel Core i9-10920X",      12,24,3.5,4.8,165, 71,"LGA2066","Cascade Lake-X"),
+    CPU("Intel Core i9-10900X",      10,20,3.5,4.7,165, 68,"LGA2066","Cascade Lake-X"),
+    CPU("Intel Core i9-9980XE",      18,36,3.0,4.5,165, 72,"LGA2066","Skylake-X"),
+    CPU("Intel Core i7-9800X",        8,16,3.8,4.5,165, 60,"LGA2066","Skylake-X"),
+    # Intel HEDT LGA2011-3
+    CPU("Intel Core i7-6950X",       10,20,3.0,3.5,140, 45,"LGA2011-3","Broadwell-E"),
+    CPU("Intel Core i7-6900K",        8,16,3.2,3.7,140, 40,"LGA2011-3","Broadwell-E"),
+    # AMD Ryzen 9000 Zen 5 AM5
+    CPU("AMD Ryzen 9 9950X",         16,32,4.3,5.7,170, 97,"AM5","Zen 5"),
+    CPU("AMD Ryzen 9 9900X",         12,24,4.4,5.6,120, 91,"AM5","Zen 5"),
+    CPU("AMD Ryzen 7 9800X3D",        8,16,4.7,5.2,120,100,"AM5","Zen 5"),
+    CPU("AMD Ryzen 7 9700X",          8,16,3.8,5.5, 65, 87,"AM5","Zen 5"),
+    CPU("AMD Ryzen 5 9600X",          6,12,3.9,5.4, 65, 82,"AM5","Zen 5"),
+    CPU("AMD Ryzen 5 9600",           6,12,3.8,5.3, 65, 80,"AM5","Zen 5"),
+    # AMD Ryzen 7000 Zen 4 AM5
+    CPU("AMD Ryzen 9 7950X",         16,32,4.5,5.7,170, 95,"AM5","Zen 4"),
+    CPU("AMD Ryzen 9 7950X3D",       16,32,4.2,5.7,120, 98,"AM5","Zen 4"),
+    CPU("AMD Ryzen 9 7900X",         12,24,4.7,5.6,170, 89,"AM5","Zen 4"),
+    CPU("AMD Ryzen 9 7900X3D",       12,24,4.4,5.6,120, 92,"AM5","Zen 4"),
+    CPU("AMD Ryzen 9 7900",          12,24,3.7,5.4, 65, 86,"AM5","Zen 4"),
+    CPU("AMD Ryzen 7 7800X3D",        8,16,4.5,5.0,120, 96,"AM5","Zen 4"),
+    CPU("AMD Ryzen 7 7700X",          8,16,4.5,5.4,105, 85,"AM5","Zen 4"),
+    CPU("AMD Ryzen 7 7700",           8,16,3.8,5.3, 65, 82,"AM5","Zen 4"),
+    CPU("AMD Ryzen 5 7600X",          6,12,4.7,5.3,105, 78,"AM5","Zen 4"),
+    CPU("AMD Ryzen 5 7600",           6,12,3.8,5.1, 65, 75,"AM5","Zen 4"),
+    CPU("AMD Ryzen 5 7500F",          6,12,3.7,5.0, 65, 73,"AM5","Zen 4"),
+    # AMD Ryzen 5000 Zen 3 AM4
+    CPU("AMD Ryzen 9 5950X",         16,32,3.4,4.9,105, 88,"AM4","Zen 3"),
+    CPU("AMD Ryzen 9 5900X",         12,24,3.7,4.8,105, 83,"AM4","Zen 3"),
+    CPU("AMD Ryzen 9 5900",          12,24,3.0,4.7, 65, 80,"AM4","Zen 3"),
+    CPU("AMD Ryzen 7 5800X3D",        8,16,3.4,4.5,105, 87,"AM4","Zen 3"),
+    CPU("AMD Ryzen 7 5800X",          8,16,3.8,4.7,105, 78,"AM4","Zen 3"),
+    CPU("AMD Ryzen 7 5800",           8,16,3.4,4.6, 65, 75,"AM4","Zen 3"),
+    CPU("AMD Ryzen 5 5600X",          6,12,3.7,4.6, 65, 72,"AM4","Zen 3"),
+    CPU("AMD Ryzen 5 5600",           6,12,3.5,4.4, 65, 69,"AM4","Zen 3"),
+    CPU("AMD Ryzen 5 5600G",          6,12,3.9,4.4, 65, 64,"AM4","Zen 3"),
+    CPU("AMD Ryzen 5 5500",           6,12,3.6,4.2, 65, 60,"AM4","Zen 3"),
+    CPU("AMD Ryzen 3 5300G",          4, 8,4.0,4.2, 65, 47,"AM4","Zen 3"),
+    CPU("AMD Ryzen 3 5100",           4, 8,3.8,3.8, 65, 40,"AM4","Zen 3"),
+    # AMD Ryzen 3000 Zen 2 AM4
+    CPU("AMD Ryzen 9 3950X",         16,32,3.5,4.7,105, 78,"AM4","Zen 2"),
+    CPU("AMD Ryzen 9 3900X",         12,24,3.8,4.6,105, 72,"AM4","Zen 2"),
+    CPU("AMD Ryzen 9 3900",          12,24,3.1,4.3, 65, 68,"AM4","Zen 2"),
+    CPU("AMD Ryzen 7 3800X",          8,16,3.9,4.5,105, 65,"AM4","Zen 2"),
+    CPU("AMD Ryzen 7 3800XT",         8,16,3.9,4.7,105, 66,"AM4","Zen 2"),
+    CPU("AMD Ryzen 7 3700X",          8,16,3.6,4.4, 65, 63,"AM4","Zen 2"),
+    CPU("AMD Ryzen 5 3600X",          6,12,3.8,4.4, 95, 60,"AM4","Zen 2"),
+    CPU("AMD Ryzen 5 3600XT",         6,12,3.8,4.5, 95, 61,"AM4","Zen 2"),
+    CPU("AMD Ryzen 5 3600",           6,12,3.6,4.2, 65, 57,"AM4","Zen 2"),
+    CPU("AMD Ryzen 5 3500X",          6, 6,3.6,4.1, 65, 52,"AM4","Zen 2"),
+    CPU("AMD Ryzen 3 3300X",          4, 8,3.8,4.3, 65, 43,"AM4","Zen 2"),
+    CPU("AMD Ryzen 3 3100",           4, 8,3.6,3.9, 65, 39,"AM4","Zen 2"),
+    # AMD Ryzen 2000 Zen+ AM4
+    CPU("AMD Ryzen 7 2700X",          8,16,3.7,4.3,105, 52,"AM4","Zen+"),
+    CPU("AMD Ryzen 7 2700",           8,16,3.2,4.1, 65, 48,"AM4","Zen+"),
+    CPU("AMD Ryzen 5 2600X",          6,12,3.6,4.2, 95, 46,"AM4","Zen+"),
+    CPU("AMD Ryzen 5 2600",           6,12,3.4,3.9, 65, 43,"AM4","Zen+"),
+    CPU("AMD Ryzen 3 2200G",          4, 4,3.5,3.7, 65, 30,"AM4","Zen+"),
+    # AMD Ryzen 1000 Zen AM4
+    CPU("AMD Ryzen 7 1800X",          8,16,3.6,4.0, 95, 44,"AM4","Zen"),
+    CPU("AMD Ryzen 7 1700X",          8,16,3.4,3.8, 95, 41,"AM4","Zen"),
+    CPU("AMD Ryzen 7 1700",           8,16,3.0,3.7, 65, 38,"AM4","Zen"),
+    CPU("AMD Ryzen 5 1600X",          6,12,3.6,4.0, 95, 38,"AM4","Zen"),
+    CPU("AMD Ryzen 5 1600",           6,12,3.2,3.6, 65, 35,"AM4","Zen"),
+    CPU("AMD Ryzen 5 1500X",          4, 8,3.5,3.7, 65, 29,"AM4","Zen"),
+    CPU("AMD Ryzen 3 1300X",          4, 4,3.5,3.7, 65, 27,"AM4","Zen"),
+    CPU("AMD Ryzen 3 1200",           4, 4,3.1,3.4, 65, 23,"AM4","Zen"),
+    # AMD Threadripper sTRX4
+    CPU("AMD Threadripper 3990X",    64,128,2.9,4.3,280, 90,"sTRX4","Zen 2"),
+    CPU("AMD Threadripper 3970X",    32, 64,3.7,4.5,280, 86,"sTRX4","Zen 2"),
+    CPU("AMD Threadripper 3960X",    24, 48,3.8,4.5,280, 83,"sTRX4","Zen 2"),
+    # AMD Threadripper TR4
+    CPU("AMD Threadripper 2990WX",   32, 64,3.0,4.2,250, 72,"TR4","Zen+"),
+    CPU("AMD Threadripper 2950X",    16, 32,3.5,4.4,180, 64,"TR4","Zen+"),
+    CPU("AMD Threadripper 2920X",    12, 24,3.5,4.3,180, 58,"TR4","Zen+"),
+    # AMD Threadripper PRO sTR5
+    CPU("AMD Threadripper PRO 7985WX",64,128,3.2,5.1,350, 99,"sTR5","Zen 4"),
+    CPU("AMD Threadripper PRO 7965WX",24, 48,3.8,5.3,350, 96,"sTR5","Zen 4"),
+    CPU("AMD Threadripper PRO 7955WX",16, 32,4.5,5.3,350, 93,"sTR5","Zen 4"),
+]
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  GPU DATABASE  — names include VRAM size. Low Profile models tagged.
+#  perf_score: 0-100 unified scale (RTX 4090/5090 = 100)
+# ══════════════════════════════════════════════════════════════════════════════
+GPU_LIST = [
+    # ── NVIDIA RTX 50 ────────────────────────────────────────────────────────
+    GPU("NVIDIA RTX 5090 32GB",         32,575,100,"NVIDIA"),
+    GPU("NVIDIA RTX 5080 16GB",         16,360, 91,"NVIDIA"),
+    GPU("NVIDIA RTX 5070 Ti 16GB",      16,300, 83,"NVIDIA"),
+    GPU("NVIDIA RTX 5070 12GB",         12,250, 76,"NVIDIA"),
+    GPU("NVIDIA RTX 5060 Ti 16GB",      16,180, 68,"NVIDIA"),
+    GPU("NVIDIA RTX 5060 Ti 8GB",        8,180, 66,"NVIDIA"),
+    GPU("NVIDIA RTX 5060 8GB",           8,150, 58,"NVIDIA"),
+    # ── NVIDIA RTX 40 ────────────────────────────────────────────────────────
+    GPU("NVIDIA RTX 4090 24GB",         24,450,100,"NVIDIA"),
+    GPU("NVIDIA RTX 4080 Super 16GB",   16,320, 88,"NVIDIA"),
+    GPU("NVIDIA RTX 4080 16GB",         16,320, 86,"NVIDIA"),
+    GPU("NVIDIA RTX 4070 Ti Super 16GB",16,285, 80,"NVIDIA"),
+    GPU("NVIDIA RTX 4070 Ti 12GB",      12,285, 77,"NVIDIA"),
+    GPU("NVIDIA RTX 4070 Super 12GB",   12,220, 74,"NVIDIA"),
+    GPU("NVIDIA RTX 4070 12GB",         12,200, 69,"NVIDIA"),
+    GPU("NVIDIA RTX 4060 Ti 16GB",      16,165, 63,"NVIDIA"),
+    GPU("NVIDIA RTX 4060 Ti 8GB",        8,165, 62,"NVIDIA"),
+    GPU("NVIDIA RTX 4060 8GB",           8,115, 55,"NVIDIA"),
+    GPU("NVIDIA RTX 4050 6GB",           6, 70, 45,"NVIDIA"),
+    # ── NVIDIA RTX 30 ────────────────────────────────────────────────────────
+    GPU("NVIDIA RTX 3090 Ti 24GB",      24,450, 84,"NVIDIA"),
+    GPU("NVIDIA RTX 3090 24GB",         24,350, 82,"NVIDIA"),
+    GPU("NVIDIA RTX 3080 Ti 12GB",      12,350, 79,"NVIDIA"),
+    GPU("NVIDIA RTX 3080 12GB",         12,350, 77,"NVIDIA"),
+    GPU("NVIDIA RTX 3080 10GB",         10,320, 75,"NVIDIA"),
+    GPU("NVIDIA RTX 3070 Ti 8GB",        8,290, 70,"NVIDIA"),
+    GPU("NVIDIA RTX 3070 8GB",           8,220, 68,"NVIDIA"),
+    GPU("NVIDIA RTX 3060 Ti 8GB",        8,200, 64,"NVIDIA"),
+    GPU("NVIDIA RTX 3060 12GB",         12,170, 54,"NVIDIA"),
+    GPU("NVIDIA RTX 3050 8GB",           8,130, 43,"NVIDIA"),
+    GPU("NVIDIA RTX 3050 6GB",           6,130, 40,"NVIDIA"),
+    # ── NVIDIA RTX 20 ────────────────────────────────────────────────────────
+    GPU("NVIDIA RTX 2080 Ti 11GB",      11,250, 72,"NVIDIA"),
+    GPU("NVIDIA RTX 2080 Super 8GB",     8,250, 65,"NVIDIA"),
+    GPU("NVIDIA RTX 2080 8GB",           8,215, 63,"NVIDIA"),
+    GPU("NVIDIA RTX 2070 Super 8GB",     8,215, 60,"NVIDIA"),
+    GPU("NVIDIA RTX 2070 8GB",           8,175, 57,"NVIDIA"),
+    GPU("NVIDIA RTX 2060 Super 8GB",     8,175, 52,"NVIDIA"),
+    GPU("NVIDIA RTX 2060 6GB",           6,160, 48,"NVIDIA"),
+    # ── NVIDIA GTX 16 ────────────────────────────────────────────────────────
+    GPU("NVIDIA GTX 1660 Ti 6GB",        6,120, 40,"NVIDIA"),
+    GPU("NVIDIA GTX 1660 Super 6GB",     6,125, 40,"NVIDIA"),
+    GPU("NVIDIA GTX 1660 6GB",           6,120, 37,"NVIDIA"),
+    GPU("NVIDIA GTX 1650 Super 4GB",     4,100, 31,"NVIDIA"),
+    GPU("NVIDIA GTX 1650 4GB",           4, 75, 26,"NVIDIA"),
+    GPU("NVIDIA GTX 1650 LP 4GB",        4, 75, 24,"NVIDIA", True),   # Low Profile
+    # ── NVIDIA GTX 10 ────────────────────────────────────────────────────────
+    GPU("NVIDIA GTX 1080 Ti 11GB",      11,250, 55,"NVIDIA"),
+    GPU("NVIDIA GTX 1080 8GB",           8,180, 48,"NVIDIA"),
+    GPU("NVIDIA GTX 1070 Ti 8GB",        8,180, 44,"NVIDIA"),
+    GPU("NVIDIA GTX 1070 8GB",           8,150, 41,"NVIDIA"),
+    GPU("NVIDIA GTX 1060 6GB",           6,120, 33,"NVIDIA"),
+    GPU("NVIDIA GTX 1060 3GB",           3,120, 30,"NVIDIA"),
+    GPU("NVIDIA GTX 1050 Ti 4GB",        4, 75, 22,"NVIDIA"),
+    GPU("NVIDIA GTX 1050 Ti LP 4GB",     4, 75, 21,"NVIDIA", True),   # Low Profile
+    GPU("NVIDIA GTX 1050 2GB",           2, 75, 17,"NVIDIA"),
+    GPU("NVIDIA GTX 1050 LP 2GB",        2, 75, 16,"NVIDIA", True),   # Low Profile
+    GPU("NVIDIA GT 1030 2GB",            2, 30,  8,"NVIDIA"),
+    GPU("NVIDIA GT 1030 LP 2GB",         2, 30,  7,"NVIDIA", True),   # Low Profile
+    # ── NVIDIA GTX 900 ───────────────────────────────────────────────────────
+    GPU("NVIDIA GTX 980 Ti 6GB",         6,250, 38,"NVIDIA"),
+    GPU("NVIDIA GTX 980 4GB",            4,165, 32,"NVIDIA"),
+    GPU("NVIDIA GTX 970 4GB",            4,145, 28,"NVIDIA"),
+    GPU("NVIDIA GTX 960 2GB",            2,120, 19,"NVIDIA"),
+    GPU("NVIDIA GTX 950 2GB",            2, 90, 15,"NVIDIA"),
+    GPU("NVIDIA GTX 750 Ti LP 2GB",      2, 60, 10,"NVIDIA", True),   # Low Profile
+    GPU("NVIDIA GTX 750 LP 1GB",         1, 55,  8,"NVIDIA", True),   # Low Profile
+    # ── AMD RX 9000 ──────────────────────────────────────────────────────────
+    GPU("AMD RX 9070 XT 16GB",          16,304, 83,"AMD"),
+    GPU("AMD RX 9070 16GB",             16,220, 76,"AMD"),
+    # ── AMD RX 7000 ──────────────────────────────────────────────────────────
+    GPU("AMD RX 7900 XTX 24GB",         24,355, 93,"AMD"),
+    GPU("AMD RX 7900 XT 20GB",          20,315, 87,"AMD"),
+    GPU("AMD RX 7900 GRE 16GB",         16,260, 80,"AMD"),
+    GPU("AMD RX 7800 XT 16GB",          16,263, 73,"AMD"),
+    GPU("AMD RX 7700 XT 12GB",          12,245, 66,"AMD"),
+    GPU("AMD RX 7600 XT 16GB",          16,190, 57,"AMD"),
+    GPU("AMD RX 7600 8GB",               8,165, 53,"AMD"),
+    # ── AMD RX 6000 ──────────────────────────────────────────────────────────
+    GPU("AMD RX 6950 XT 16GB",          16,335, 83,"AMD"),
+    GPU("AMD RX 6900 XT 16GB",          16,300, 79,"AMD"),
+    GPU("AMD RX 6800 XT 16GB",          16,300, 75,"AMD"),
+    GPU("AMD RX 6800 16GB",             16,250, 70,"AMD"),
+    GPU("AMD RX 6750 XT 12GB",          12,250, 64,"AMD"),
+    GPU("AMD RX 6700 XT 12GB",          12,230, 62,"AMD"),
+    GPU("AMD RX 6700 10GB",             10,175, 58,"AMD"),
+    GPU("AMD RX 6650 XT 8GB",            8,176, 53,"AMD"),
+    GPU("AMD RX 6600 XT 8GB",            8,160, 51,"AMD"),
+    GPU("AMD RX 6600 8GB",               8,132, 48,"AMD"),
+    GPU("AMD RX 6500 XT 4GB",            4, 65, 28,"AMD"),
+    GPU("AMD RX 6400 4GB",               4, 53, 22,"AMD"),
+    GPU("AMD RX 6400 LP 4GB",            4, 53, 21,"AMD", True),     # Low Profile
+    # ── AMD RX 5000 ──────────────────────────────────────────────────────────
+    GPU("AMD RX 5700 XT 8GB",            8,225, 52,"AMD"),
+    GPU("AMD RX 5700 8GB",               8,180, 48,"AMD"),
+    GPU("AMD RX 5600 XT 6GB",            6,150, 43,"AMD"),
+    GPU("AMD RX 5500 XT 8GB",            8,130, 33,"AMD"),
+    GPU("AMD RX 5500 XT 4GB",            4,130, 30,"AMD"),
+    # ── AMD Vega ─────────────────────────────────────────────────────────────
+    GPU("AMD Radeon VII 16GB",          16,300, 54,"AMD"),
+    GPU("AMD RX Vega 64 8GB",            8,295, 44,"AMD"),
+    GPU("AMD RX Vega 56 8GB",            8,210, 40,"AMD"),
+    # ── AMD RX 500 ───────────────────────────────────────────────────────────
+    GPU("AMD RX 590 8GB",                8,225, 29,"AMD"),
+    GPU("AMD RX 580 8GB",                8,185, 26,"AMD"),
+    GPU("AMD RX 570 4GB",                4,150, 22,"AMD"),
+    GPU("AMD RX 560 4GB",                4, 80, 15,"AMD"),
+    GPU("AMD RX 550 LP 4GB",             4, 50, 10,"AMD", True),     # Low Profile
+    GPU("AMD RX 550 LP 2GB",             2, 50,  8,"AMD", True),     # Low Profile
+    # ── Intel Arc B (Battlemage) ──────────────────────────────────────────────
+    GPU("Intel Arc B580 12GB",          12,190, 60,"Intel"),
+    GPU("Intel Arc B570 10GB",          10,150, 54,"Intel"),
+    # ── Intel Arc A (Alchemist) ───────────────────────────────────────────────
+    GPU("Intel Arc A770 16GB",          16,225, 53,"Intel"),
+    GPU("Intel Arc A770 8GB",            8,225, 52,"Intel"),
+    GPU("Intel Arc A750 8GB",            8,190, 47,"Intel"),
+    GPU("Intel Arc A580 8GB",            8,175, 41,"Intel"),
+    GPU("Intel Arc A380 6GB",            6, 75, 20,"Intel"),
+    GPU("Intel Arc A310 4GB",            4, 50, 12,"Intel"),
+    GPU("Intel Arc A310 LP 4GB",         4, 50, 11,"Intel", True),   # Low Profile
+]
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  MOTHERBOARD DATABASE — simplified chipset-only names (H510, B550, Z790…)
+# ══════════════════════════════════════════════════════════════════════════════
+MB_LIST = [
+    # ── Intel LGA1851 (Arrow Lake) ────────────────────────────────────────────
+    Motherboard("Z890 (LGA1851)",    "LGA1851","Z890", 192,5),
+    Motherboard("B860 (LGA1851)",    "LGA1851","B860", 192,5),
+    Motherboard("H810 (LGA1851)",    "LGA1851","H810", 128,5),
+    # ── Intel LGA1700 (12th/13th/14th Gen) ────────────────────────────────────
+    Motherboard("Z790 (LGA1700)",    "LGA1700","Z790", 128,5),
+    Motherboard("H770 (LGA1700)",    "LGA1700","H770",  64,5),
+    Motherboard("B760 (LGA1700)",    "LGA1700","B760",  64,5),
+    Motherboard("H610 (LGA1700)",    "LGA1700","H610",  64,5),
+    Motherboard("Z690 (LGA1700)",    "LGA1700","Z690", 128,5),
+    # ── Intel LGA1200 (10th/11th Gen) ─────────────────────────────────────────
+    Motherboard("Z590 (LGA1200)",    "LGA1200","Z590", 128,4),
+    Motherboard("H570 (LGA1200)",    "LGA1200","H570",  64,4),
+    Motherboard("B560 (LGA1200)",    "LGA1200","B560",  64,4),
+    Motherboard("H510 (LGA1200)",    "LGA1200","H510",  64,4),
+    Motherboard("Z490 (LGA1200)",    "LGA1200","Z490", 128,3),
+    Motherboard("H470 (LGA1200)",    "LGA1200","H470",  64,3),
+    Motherboard("B460 (LGA1200)",    "LGA1200","B460",  64,3),
+    Motherboard("H410 (LGA1200)",    "LGA1200","H410",  64,3),
+    # ── Intel LGA1151 (6th–9th Gen) ───────────────────────────────────────────
+    Motherboard("Z390 (LGA1151)",    "LGA1151","Z390", 128,3),
+    Motherboard("H370 (LGA1151)",    "LGA1151","H370",  64,3),
+    Motherboard("B365 (LGA1151)",    "LGA1151","B365",  64,3),
+    Motherboard("B360 (LGA1151)",    "LGA1151","B360",  64,3),
+    Motherboard("H310 (LGA1151)",    "LGA1151","H310",  32,3),
+    Motherboard("Z370 (LGA1151)",    "LGA1151","Z370", 128,3),
+    Motherboard("Z270 (LGA1151)",    "LGA1151","Z270", 128,3),
+    Motherboard("B250 (LGA1151)",    "LGA1151","B250",  64,3),
+    Motherboard("Z170 (LGA1151)",    "LGA1151","Z170", 128,3),
+    Motherboard("H170 (LGA1151)",    "LGA1151","H170",  64,3),
+    Motherboard("B150 (LGA1151)",    "LGA1151","B150",  64,3),
+    Motherboard("H110 (LGA1151)",    "LGA1151","H110",  32,3),
+    # ── Intel LGA2066 HEDT ────────────────────────────────────────────────────
+    Motherboard("X299 (LGA2066)",    "LGA2066","X299", 256,3),
+    # ── Intel LGA2011-3 HEDT ──────────────────────────────────────────────────
+    Motherboard("X99 (LGA2011-3)",   "LGA2011-3","X99",128,3),
+    # ── AMD AM5 ───────────────────────────────────────────────────────────────
+    Motherboard("X870E (AM5)",       "AM5","X870E", 256,5),
+    Motherboard("X870 (AM5)",        "AM5","X870",  192,5),
+    Motherboard("X670E (AM5)",       "AM5","X670E", 128,5),
+    Motherboard("X670 (AM5)",        "AM5","X670",  128,5),
+    Motherboard("B650E (AM5)",       "AM5","B650E", 128,5),
+    Motherboard("B650 (AM5)",        "AM5","B650",  128,5),
+    Motherboard("A620 (AM5)",        "AM5","A620",   64,5),
+    # ── AMD AM4 ───────────────────────────────────────────────────────────────
+    Motherboard("X570 (AM4)",        "AM4","X570",  128,4),
+    Motherboard("B550 (AM4)",        "AM4","B550",  128,4),
+    Motherboard("A520 (AM4)",        "AM4","A520",   64,4),
+    Motherboard("X470 (AM4)",        "AM4","X470",   64,3),
+    Motherboard("B450 (AM4)",        "AM4","B450",   64,3),
+    Motherboard("X370 (AM4)",        "AM4","X370",   64,3),
+    Motherboard("B350 (AM4)",        "AM4","B350",   64,3),
+    Motherboard("A320 (AM4)",        "AM4","A320",   32,3),
+    Motherboard("X300 (AM4)",        "AM4","X300",   32,3),
+    Motherboard("A300 (AM4)",        "AM4","A300",   32,3),
+    # ── AMD sTRX4 ─────────────────────────────────────────────────────────────
+    Motherboard("TRX40 (sTRX4)",     "sTRX4","TRX40",256,4),
+    # ── AMD TR4 ───────────────────────────────────────────────────────────────
+    Motherboard("X399 (TR4)",        "TR4","X399",   256,3),
+    # ── AMD sTR5 ──────────────────────────────────────────────────────────────
+    Motherboard("TRX50 (sTR5)",      "sTR5","TRX50", 512,5),
+]
@@ -0,0 +1,282 @@
+"""
+External component database — a versioned, memory-mapped columnar file.
+
+Layout (all column data native-endian, 8-byte aligned):
+
+    b"BCDB" | u16 format version | u32 manifest length | manifest JSON | data
+
+The manifest records the dataset version, the shared string code table
+and, per table, where each column, the UTF-8 name blob, its offsets and
+the sorted name-hash index live in the data section. open_database()
+maps the file read-only and wraps those regions as memoryviews, so every
+process that opens (or forks after opening) the same file shares one copy
+of the pages. write_database() replaces the file atomically, so readers
+that already mapped the old one keep a consistent view while a refresh
+picks up the new one.
+
+The lists in data.py remain the built-in default dataset; set
+BOTTLENECK_DB to a file path to start from an external database instead.
+`db import` builds one from CSV / JSONL part rows (see read_parts), so
+new parts ship as data, not code.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import MISSING, fields
+
+from .columns import CodeTable, ColumnCatalog, ColumnTable, _typecode
+
+MAGIC          = b"BCDB"
+FORMAT_VERSION = 1
+_HEADER        = struct.Struct("<4sHI")
+
+
+def _layout(model):
+    return [[f.name, str(f.type.__name__)] for f in fields(model)]
+
+def write_database(path, cpus, gpus, mbs, version=None):
+    """Write a component database file; returns the dataset version written."""
+    import tempfile
+    from datetime import datetime, timezone
+    version = version or datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    catalog = ColumnCatalog(cpus, gpus, mbs)
+
+    chunks, pos = [], 0
+    def place(buf):
+        nonlocal pos
+        data = bytes(buf)
+        entry = [pos, len(data)]
+        pad = -len(data) % 8
+        chunks.append(data + b"\0" * pad)
+        pos += len(data) + pad
+        return entry
+
+    tables = {}
+    for key, model in ColumnCatalog.TABLES:
+        t = getattr(catalog, key)
+        tables[key] = {
+            "rows":      len(t),
+            "schema":    _layout(model),
+            "columns":   {n: [_typecode(c), c.itemsize, *place(c)] for n, c in t.columns.items()},
+            "names":     place(t.blob),
+            "offsets":   ["I", t.offsets.itemsize, *place(t.offsets)],
+            "hashes":    ["I", t.hashes.itemsize, *place(t.hashes)],
+            "hash_rows": ["I", t.hash_rows.itemsize, *place(t.hash_rows)],
+        }
+    manifest = json.dumps({"version": version, "byteorder": sys.byteorder,
+                           "codes": catalog.codes.values, "tables": tables}).encode("utf-8")
+    head = _HEADER.pack(MAGIC, FORMAT_VERSION, len(manifest)) + manifest
+    head += b"\0" * (-len(head) % 8)
+
+    d = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=d, prefix=".bcdb-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(head)
+            for c in chunks:
+                f.write(c)
+        umask = os.umask(0)
+        os.umask(umask)
+        os.chmod(tmp, 0o666 & ~umask)   # mkstemp creates 0600; readers may be other users
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+    return version
+
+
+class Database(ColumnCatalog):
+    """A ColumnCatalog whose columns are views into a read-only file mapping."""
+    path = version = None
+
+
+def open_database(path):
+    """Memory-map a database file and return it as a Database catalog."""
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    magic, fmt, mlen = _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ValueError(f"{path}: not a component database")
+    if fmt != FORMAT_VERSION:
+        raise ValueError(f"{path}: database format {fmt}, expected {FORMAT_VERSION}")
+    manifest = json.loads(mm[_HEADER.size:_HEADER.size + mlen])
+    if manifest["byteorder"] != sys.byteorder:
+        raise ValueError(f"{path}: written on a {manifest['byteorder']}-endian machine")
+    base = _HEADER.size + mlen
+    base += -base % 8
+    buf = memoryview(mm)
+
+    def view(spec):
+        code, size, off, n = spec
+        if array(code).itemsize != size:
+            raise ValueError(f"{path}: column width mismatch for type {code!r}")
+        return buf[base + off:base + off + n].cast(code)
+
+    codes  = CodeTable(manifest["codes"])
+    tables = {}
+    for key, model in ColumnCatalog.TABLES:
+        spec = manifest["tables"][key]
+        if spec["schema"] != _layout(model):
+            raise ValueError(f"{path}: {key} schema does not match {model.__name__}")
+        off, n = spec["names"]
+        tables[key] = ColumnTable.from_buffers(
+            model, {name: view(c) for name, c in spec["columns"].items()},
+            buf[base + off:base + off + n], view(spec["offsets"]),
+            view(spec["hashes"]), view(spec["hash_rows"]), codes)
+
+    db = Database.from_tables(codes, tables["cpu"], tables["gpu"], tables["board"])
+    db.path, db.version, db._mmap = path, manifest["version"], mm
+    return db
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+def read_prices(path):
+    """name → price from a `name,price` CSV (a header row is optional)."""
+    import csv
+    prices = {}
+    with open(path, newline="", encoding="utf-8") as f:
+        for i, row in enumerate(csv.reader(f)):
+            if len(row) < 2 or not row[0].strip():
+                continue
+            try:
+                prices[row[0].strip()] = float(row[1])
+            except ValueError:
+                if i:               # only the first row may be a header
+                    raise ValueError(f"{path}:{i + 1}: bad price {row[1]!r}") from None
+    return prices
+
+def _field_value(f, text):
+    """A CSV cell or JSON value as field `f`'s type."""
+    if isinstance(text, str):
+        text = text.strip()
+        if f.type is bool:
+            if text.lower() in ("1", "true", "yes", "y"):
+                return True
+            if text.lower() in ("0", "false", "no", "n"):
+                return False
+            raise ValueError(f"{f.name}: not a boolean: {text!r}")
+    elif f.type is int and isinstance(text, float) and not text.is_integer():
+        raise ValueError(f"{f.name}: not an integer: {text!r}")
+    return f.type(text)
+
+def read_parts(path, model):
+    """
+    `model` (CPU / GPU / Motherboard) rows from a CSV file with a header
+    row of field names, or a JSONL file of objects with those keys (by
+    extension, else by the first character). Fields with a default, like
+    price, may be left out or blank.
+    """
+    import csv
+    from itertools import chain
+    fs    = {f.name: f for f in fields(model)}
+    parts = []
+    with open(path, newline="", encoding="utf-8") as f:
+        lines = iter(f)
+        first = next((l for l in lines if l.strip()), "")
+        lines = chain([first], lines)
+        if path.lower().endswith((".jsonl", ".ndjson")) or first.lstrip().startswith("{"):
+            rows = ((i, json.loads(l)) for i, l in enumerate(lines, 1) if l.strip())
+        else:
+            reader = csv.DictReader(lines)
+            rows   = ((reader.line_num, r) for r in reader if any(v.strip() for v in r.values() if v))
+        for line, row in rows:
+            where = f"{path}:{line}"
+            if not isinstance(row, dict):
+                raise ValueError(f"{where}: expected an object, got {type(row).__name__}")
+            unknown = sorted(set(row) - set(fs), key=str)
+            if unknown:
+                raise ValueError(f"{where}: unknown field(s) {', '.join(map(str, unknown))}")
+            kwargs = {}
+            for name, fld in fs.items():
+                value = row.get(name)
+                if value is None or value == "":
+                    if fld.default is MISSING:
+                        raise ValueError(f"{where}: missing {name}")
+                    continue
+                try:
+                    kwargs[name] = _field_value(fld, value)
+                except (TypeError, ValueError) as e:
+                    raise ValueError(f"{where}: bad {name} {value!r}") from e
+            parts.append(model(**kwargs))
+    return parts
+
+def _merge(base, new):
+    """`base` with same-named parts replaced by `new` ones, then the other new parts."""
+    by_name = {p.name: p for p in new}
+    return [by_name.pop(p.name, p) for p in base] + list(by_name.values())
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(prog="python -m bottleneck_calculator db",
+                                 description="Export, import or inspect a component database file.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    ex = sub.add_parser("export", help="write the built-in dataset to a database file")
+    ex.add_argument("path")
+    ex.add_argument("--version", help="dataset version label (default: UTC timestamp)")
+    ex.add_argument("--prices", metavar="CSV", help="name,price rows for the price column")
+    im = sub.add_parser("import", help="write parts from CSV / JSONL files to a database file")
+    im.add_argument("path")
+    im.add_argument("--cpus",   metavar="FILE", help="CPU rows (CSV with a header, or JSONL)")
+    im.add_argument("--gpus",   metavar="FILE", help="GPU rows")
+    im.add_argument("--boards", metavar="FILE", help="motherboard rows")
+    base = im.add_mutually_exclusive_group()
+    base.add_argument("--base", metavar="DB",
+                      help="start from this database file's parts; imported rows with "
+                           "the same name replace them (the file may be PATH itself)")
+    base.add_argument("--builtin", action="store_true",
+                      help="start from the built-in dataset the same way")
+    im.add_argument("--version", help="dataset version label (default: UTC timestamp)")
+    info = sub.add_parser("info", help="show a database file's version and row counts")
+    info.add_argument("path")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "export":
+        from dataclasses import replace
+        from .data import CPU_LIST, GPU_LIST, MB_LIST
+        lists = CPU_LIST, GPU_LIST, MB_LIST
+        if args.prices:
+            prices = read_prices(args.prices)
+            lists  = [[replace(p, price=prices[p.name]) if p.name in prices else p for p in parts]
+                      for parts in lists]
+            known  = {p.name for parts in lists for p in parts}
+            unused = sorted(set(prices) - known)
+            priced = sum(p.price > 0 for parts in lists for p in parts)
+            print(f"prices: {priced} parts priced, {len(unused)} unknown names ignored"
+                  + (f" (e.g. {unused[0]!r})" if unused else ""))
+        v = write_database(args.path, *lists, args.version)
+        print(f"wrote {args.path}  (version {v})")
+    elif args.cmd == "import":
+        from .models import CPU, GPU, Motherboard
+        sources = ((args.cpus, CPU), (args.gpus, GPU), (args.boards, Motherboard))
+        if not any(src for src, _ in sources) and not (args.base or args.builtin):
+            ap.error("import: give --cpus, --gpus and/or --boards")
+        if args.base:
+            from .columns import RowList
+            db    = open_database(args.base)
+            bases = [list(RowList(t)) for t in (db.cpu, db.gpu, db.board)]
+        elif args.builtin:
+            from .data import CPU_LIST, GPU_LIST, MB_LIST
+            bases = [CPU_LIST, GPU_LIST, MB_LIST]
+        else:
+            bases = [[], [], []]
+        try:
+            new = [read_parts(src, model) if src else [] for src, model in sources]
+        except (OSError, ValueError) as e:
+            print(f"db import: {e}", file=sys.stderr)
+            return 1
+        lists = [_merge(b, n) for b, n in zip(bases, new)]
+        replaced = sum(len(b) + len(n) - len(l) for b, n, l in zip(bases, new, lists))
+        v = write_database(args.path, *lists, args.version)
+        print(f"imported {len(new[0])} CPUs, {len(new[1])} GPUs, {len(new[2])} boards"
+              f" ({replaced} replacing parts of the same name)")
+        print(f"wrote {args.path}  (version {v}; {len(lists[0])} CPUs  •  {len(lists[1])} GPUs"
+              f"  •  {len(lists[2])} boards)")
+    else:
+        db = open_database(args.path)
+        print(f"{db.path}: version {db.version}, format {FORMAT_VERSION}")
+        print(f"  {len(db.cpu)} CPUs  •  {len(db.gpu)} GPUs  •  {len(db.board)} boards")
+    return 0
@@ -0,0 +1,677 @@
+"""Bottleneck engine: registry, recommendation index, scalar and matrix scoring."""
+
+import os
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, namedtuple
+from functools import cached_property, wraps
+from weakref import WeakKeyDictionary
+
+from .models import CPU, GPU, Motherboard
+
+# ─────────────────────────── RECOMMENDATION INDEX ────────────────────────────
+class ScoreIndex:
+    """
+    Components bucketed by perf_score, for nearest-score upgrade lookups and
+    score range scans.
+    """
+    def __init__(self, parts):
+        buckets = {}
+        for pos, p in enumerate(parts):
+            buckets.setdefault(p.perf_score, []).append((pos, p))
+        self.scores   = sorted(buckets)
+        self._buckets = [buckets[s] for s in self.scores]
+        # The same parts flattened in (score, list order); bucket j is
+        # _sorted[_starts[j]:_starts[j + 1]], so a score range is one slice.
+        self._sorted  = [p for b in self._buckets for _, p in b]
+        self._starts  = [0]
+        for b in self._buckets:
+            self._starts.append(self._starts[-1] + len(b))
+
+    def __len__(self):
+        return len(self._sorted)
+
+    def between(self, lo, hi, offset=0, limit=None):
+        """
+        (parts with lo <= perf_score <= hi, how many there are in all), by
+        score then list order. `offset` / `limit` page through the range.
+        """
+        start = self._starts[bisect_left(self.scores, lo)]
+        end   = self._starts[bisect_right(self.scores, hi)]
+        total = max(end - start, 0)
+        start = min(start + max(offset, 0), end)
+        if limit is not None:
+            end = min(end, start + max(limit, 0))
+        return self._sorted[start:end], total
+
+    def _first(self, j, exclude):
+        for pos, p in self._buckets[j]:
+            if p.name != exclude:
+                return pos, p
+        return None
+
+    def nearest(self, target, exclude=None, floor=6):
+        """
+        Part closest to `target` with perf_score >= target-floor, skipping the
+        part named `exclude`. Ties go to the earlier list entry — the same
+        part sorted(..., key=lambda p: abs(p.perf_score - target))[0] returns.
+        """
+        i = bisect_left(self.scores, target)
+        best = None
+        for j in range(i, len(self.scores)):                 # at/above target
+            hit = self._first(j, exclude)
+            if hit:
+                best = (self.scores[j] - target, *hit)
+                break
+        for j in range(i - 1, -1, -1):                       # below, down to the floor
+            if self.scores[j] < target - floor:
+                break
+            hit = self._first(j, exclude)
+            if hit:
+                cand = (target - self.scores[j], *hit)
+                if best is None or cand[:2] < best[:2]:
+                    best = cand
+                break
+        return best[2] if best else None
+
+# ─────────────────────────── COMPONENT REGISTRY ──────────────────────────────
+_VENDOR_WORDS = ("intel", "core", "nvidia", "geforce", "amd", "radeon")
+
+# A resolve() answer; fuzzy.py builds them too, exact hits are (part, 1.0, 0).
+Match = namedtuple("Match", "part confidence distance")
+
+def normalize_name(name):
+    """Lower-case, punctuation-free form used for forgiving name lookups."""
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", name.lower()).split())
+
+def _aliases(name):
+    # "NVIDIA RTX 4070 Ti 12GB" → "nvidia rtx 4070 ti 12gb", "rtx 4070 ti 12gb",
+    # "nvidia rtx 4070 ti", "rtx 4070 ti"; boards also drop "(LGA1700)".
+    words = normalize_name(re.sub(r"\(.*?\)", "", name)).split()
+    forms = [normalize_name(name)]
+    while words:
+        forms.append(" ".join(words))
+        if re.fullmatch(r"\d+gb", words[-1]):
+            forms.append(" ".join(words[:-1]))
+        if words[0] not in _VENDOR_WORDS:
+            break
+        words = words[1:]
+    return [f for f in forms if f]
+
+class ComponentRegistry:
+    """
+    The component database in lookup form: name → component dicts for CPUs,
+    GPUs and boards plus the perf_score recommendation indexes.
+    Lookups try the exact name, then a normalized/alias key, so
+    "rtx 4070 ti" finds "NVIDIA RTX 4070 Ti 12GB" without scanning. When an
+    alias is shared ("rtx 5060 ti") the first listed part wins.
+    resolve() goes on to a fuzzy match for typos and run-together forms
+    ("RTX4070TI 12G") and says how confident it is; the fuzzy index for a
+    kind is built by its first miss, so exact names never pay for it.
+
+    load() swaps in new component lists and bumps `version`, which is how
+    caches built on top of the registry notice the database changed;
+    load_database() does the same from a memory-mapped database file. Its
+    lists are RowLists over the mapped columns: exact names are found with
+    the file's hash index, and a part becomes a Python object only once
+    something reads it.
+    """
+    def __init__(self, cpus, gpus, mbs):
+        self.version = 0
+        self.source  = None   # database file path, None for in-memory lists
+        self.load(cpus, gpus, mbs)
+
+    def load(self, cpus=None, gpus=None, mbs=None):
+        """Replace the component lists (omitted ones are kept) and drop every index."""
+        self.cpus = _listed(self.cpus if cpus is None else cpus)
+        self.gpus = _listed(self.gpus if gpus is None else gpus)
+        self.mbs  = _listed(self.mbs  if mbs  is None else mbs)
+        self._parts = {"cpu": self.cpus, "gpu": self.gpus, "board": self.mbs}
+        self.source = None
+        # Indexes are cached_properties, rebuilt on first use after a load so
+        # that importing the engine stays cheap.
+        for attr in ("gpu_index", "cpu_index", "_exact", "_alias", "_fuzzy", "columns"):
+            self.__dict__.pop(attr, None)
+        self.version += 1
+
+    def _kinds(self):
+        return (("cpu", self.cpus), ("gpu", self.gpus), ("board", self.mbs))
+
+    def parts(self, kind):
+        return self._parts[kind]
+
+    def names(self, kind):
+        """Part names in list order; a mapped database's rows stay unmaterialised."""
+        return _names(self.parts(kind))
+
+    @cached_property
+    def gpu_index(self):
+        return ScoreIndex(self.gpus)
+
+    @cached_property
+    def cpu_index(self):
+        """socket → ScoreIndex of the CPUs that fit it."""
+        by_socket = {}
+        for c in self.cpus:
+            by_socket.setdefault(c.socket, []).append(c)
+        return {sock: ScoreIndex(cpus) for sock, cpus in by_socket.items()}
+
+    @cached_property
+    def _exact(self):
+        # name → list position. Mapped tables start empty and remember the
+        # names found through the file's hash index (~3 µs a probe).
+        return {kind: {} if hasattr(parts, "table") else
+                {p.name: i for i, p in reversed(list(enumerate(parts)))}
+                for kind, parts in self._kinds()}
+
+    @cached_property
+    def _alias(self):
+        out = {}
+        for kind, _ in self._kinds():
+            names = self.names(kind)
+            alias = {}
+            for i, n in enumerate(names):
+                alias.setdefault(normalize_name(n), i)
+            for i, n in enumerate(names):
+                for a in _aliases(n):
+                    alias.setdefault(a, i)
+            out[kind] = alias
+        return out
+
+    @cached_property
+    def columns(self):
+        """Struct-of-arrays ColumnCatalog of the current lists, built on first use."""
+        from .columns import ColumnCatalog
+        return ColumnCatalog(self.cpus, self.gpus, self.mbs)
+
+    def load_database(self, path):
+        """(Re)load from a database file; its mapped columns become `columns`."""
+        from .database import open_database
+        from .columns import RowList
+        db = open_database(path)
+        self.load(RowList(db.cpu), RowList(db.gpu), RowList(db.board))
+        self.columns = db
+        self.source  = path
+
+    def find(self, kind, name, default=None):
+        parts = self._parts[kind]
+        i = self._exact[kind].get(name, -1)
+        if i < 0:
+            if hasattr(parts, "table"):
+                i = parts.table.find(name)
+                if i >= 0:
+                    self._exact[kind][name] = i
+                    return parts[i]
+            i = self._alias[kind].get(normalize_name(name), -1)
+        return parts[i] if i >= 0 else default
+
+    @cached_property
+    def _fuzzy(self):
+        """fuzzy.py, imported on the first miss, and the NameMatchers built so far."""
+        from . import fuzzy
+        return fuzzy, {}
+
+    def _matcher(self, kind):
+        fuzzy, built = self._fuzzy
+        m = built.get(kind)
+        if m is None:                               # one kind's index per first miss
+            m = built[kind] = fuzzy.NameMatcher(self.parts(kind), self.names(kind))
+        return m
+
+    def resolve(self, kind, name, min_confidence=None):
+        """
+        find(), then the nearest fuzzy match (see fuzzy.py) as a Match with a
+        confidence; None if there is none of at least `min_confidence`
+        (default fuzzy.MIN_CONFIDENCE).
+        """
+        hit = self.find(kind, name)
+        if hit is not None:
+            return Match(hit, 1.0, 0)
+        if min_confidence is None:
+            min_confidence = self._fuzzy[0].MIN_CONFIDENCE
+        m = self._matcher(kind).match(name)
+        return m if m is not None and m.confidence >= min_confidence else None
+
+    def matches(self, kind, name, k=3):
+        """The `k` nearest fuzzy matches for `name`, best first."""
+        return self._matcher(kind).matches(name, k)
+
+    def cpu(self, name, default=None):   return self.find("cpu", name, default)
+    def gpu(self, name, default=None):   return self.find("gpu", name, default)
+    def board(self, name, default=None): return self.find("board", name, default)
+
+def _listed(parts):
+    # RowLists over a mapped database stay lazy; anything else is copied.
+    return parts if hasattr(parts, "table") else list(parts)
+
+def _names(parts):
+    return parts.names() if hasattr(parts, "table") else [p.name for p in parts]
+
+if os.environ.get("BOTTLENECK_DB"):         # the built-in lists are never imported
+    REGISTRY = ComponentRegistry((), (), ())
+    REGISTRY.load_database(os.environ["BOTTLENECK_DB"])
+else:
+    from .data import CPU_LIST, GPU_LIST, MB_LIST
+    REGISTRY = ComponentRegistry(CPU_LIST, GPU_LIST, MB_LIST)
+
+def per_registry(build):
+    """
+    Decorator for indexes over a registry's lists: f(registry=None) returns
+    build(registry) (default REGISTRY), kept until that registry's next load().
+    """
+    cache = WeakKeyDictionary()     # registry → (its version, build(registry))
+    @wraps(build)
+    def get(registry=None):
+        reg = REGISTRY if registry is None else registry
+        hit = cache.get(reg)
+        if hit is None or hit[0] != reg.version:
+            hit = cache[reg] = (reg.version, build(reg))
+        return hit[1]
+    return get
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BOTTLENECK ENGINE
+# ══════════════════════════════════════════════════════════════════════════════
+BALANCED_GAP = 8     # |CPU - GPU perf_score| up to this is "Balanced"
+
+# _raw_scores in parts, each reading only the components it depends on, so
+# LiveScorer can memoize them separately.
+def _pair_terms(cpu, gpu):
+    """CPU × GPU terms: performance gap, its bottleneck share, thread penalty."""
+    gap = cpu.perf_score - gpu.perf_score
+    thread_penalty = 0.0
+    if cpu.cores <= 4 and gpu.perf_score >= 60:
+        thread_penalty = min((gpu.perf_score - 60) * 0.12, 10.0)
+    return gap, abs(gap) * 0.55, thread_penalty
+
+def _pcie_penalty(gpu, mb):
+    """GPU × board term."""
+    if mb.pcie_gen <= 3 and gpu.perf_score >= 75:
+        return min((gpu.perf_score - 75) * 0.10, 5.0)
+    return 0.0
+
+def _combine(gap, bn_pct, thread_penalty, pcie_penalty):
+    total_pct = min(bn_pct + thread_penalty + pcie_penalty, 68.0)
+    if gap > BALANCED_GAP:
+        side = "GPU"
+    elif gap < -BALANCED_GAP:
+        side = "CPU"
+    else:
+        side = "Balanced"
+        total_pct = min(total_pct, 7.0)
+    return gap, thread_penalty, pcie_penalty, total_pct, side
+
+def _raw_scores(cpu, gpu, mb):
+    return _combine(*_pair_terms(cpu, gpu), _pcie_penalty(gpu, mb))
+
+# Scoring classes: all the terms above read of a part is its perf_score, a
+# CPU's core count (4 or fewer) and a board's PCIe generation (3 or older);
+# the socket only decides compatibility. Parts of one class score alike in
+# every build, so searches over builds (frontier.py, upgrade.py) only need
+# the cheapest part of each. Keep these in step with the terms.
+def cpu_class(cpu):  return (cpu.socket, cpu.perf_score, cpu.cores <= 4)
+def gpu_class(gpu):  return gpu.perf_score
+def board_class(mb): return (mb.socket, mb.pcie_gen <= 3)
+
+def cheapest_per_class(parts, key, reps=None):
+    """
+    Fold the priced `parts` into `reps` ({class: cheapest part}, the first
+    listed winning ties) and return the parts that became representatives.
+    """
+    reps  = {} if reps is None else reps
+    fresh = set()
+    for p in parts:
+        if p.price > 0:
+            k   = key(p)
+            cur = reps.get(k)
+            if cur is None or p.price < cur.price:
+                reps[k] = p
+                fresh.add(id(p))
+    return [p for p in reps.values() if id(p) in fresh]
+
+def build_suggestions(cpu: CPU, gpu: GPU, mb: Motherboard):
+    """Suggestion text for a build — the slow half of calculate_bottleneck."""
+    return _suggestions(cpu, gpu, mb, *_raw_scores(cpu, gpu, mb))
+
+def _suggestions(cpu, gpu, mb, gap, thread_penalty, pcie_penalty, total_pct, side):
+    compatible = (cpu.socket == mb.socket)
+    suggestions = []
+    if not compatible:
+        suggestions.append(
+            f"🔴  INCOMPATIBLE: {cpu.name} uses socket {cpu.socket} but "
+            f"{mb.name} requires socket {mb.socket}. This system will NOT boot."
+        )
+    if side == "GPU" and total_pct >= 10:
+        target = min(cpu.perf_score, 100)
+        rec = REGISTRY.gpu_index.nearest(target, exclude=gpu.name)
+        rec = rec.name if rec else "a higher-tier GPU"
+        suggestions.append(
+            f"🎮  GPU Bottleneck ({total_pct:.0f}%): Your {cpu.name} (CPU score "
+            f"{cpu.perf_score}) is significantly stronger than your {gpu.name} "
+            f"(GPU score {gpu.perf_score}). The GPU is the limiting factor. "
+            f"Upgrading to the {rec} would balance this build."
+        )
+    if side == "CPU" and total_pct >= 10:
+        target = min(gpu.perf_score, 100)
+        idx = REGISTRY.cpu_index.get(mb.socket)
+        rec = idx.nearest(target, exclude=cpu.name) if idx else None
+        rec = rec.name if rec else f"a stronger CPU (socket {mb.socket})"
+        suggestions.append(
+            f"🖥️  CPU Bottleneck ({total_pct:.0f}%): Your {gpu.name} (GPU score "
+            f"{gpu.perf_score}) is significantly stronger than your {cpu.name} "
+            f"(CPU score {cpu.perf_score}). Upgrade to {rec} to unleash your GPU."
+        )
+    if thread_penalty > 3:
+        suggestions.append(
+            f"🔧  Low core count ({cpu.cores} cores): Modern game engines need "
+            "6–8+ cores. Your CPU may cause stuttering with this GPU."
+        )
+    if pcie_penalty > 1:
+        suggestions.append(
+            f"📡  PCIe Gen {mb.pcie_gen} bandwidth may limit your high-end GPU. "
+            "A PCIe Gen 4 or Gen 5 board removes this constraint."
+        )
+    if gpu.vram_gb < 8 and gpu.perf_score >= 45:
+        suggestions.append(
+            f"💾  Only {gpu.vram_gb} GB VRAM: Modern titles at 1440p/4K often "
+            "need 10–12+ GB. Expect texture pop-in or VRAM overflow stutters."
+        )
+    if gpu.low_profile:
+        suggestions.append(
+            "📐  Low Profile GPU: Make sure your case supports LP cards. "
+            "LP GPUs typically have reduced cooling headroom — ensure good airflow."
+        )
+    if side == "Balanced":
+        suggestions.append(
+            f"✅  Well-matched build! {cpu.name} ({cpu.perf_score}) and "
+            f"{gpu.name} ({gpu.perf_score}) are within {abs(gap)} pts — "
+            "neither component is significantly limiting the other."
+        )
+        suggestions.append(
+            "💡  Enable XMP/EXPO in BIOS, use a fast NVMe SSD (PCIe 4.0+), "
+            "and ensure good case airflow to squeeze out maximum performance."
+        )
+    if not suggestions:
+        suggestions.append("✅  Solid build. Fast RAM and NVMe SSD will complete the picture.")
+
+    return suggestions
+
+class BottleneckScore(namedtuple("BottleneckScore",
+                                 "bottleneck_pct side gap thread_penalty pcie_penalty "
+                                 "compatible cpu gpu mb")):
+    """
+    Numeric result of score_build, immutable (results are shared through
+    cached_bottleneck); `suggestions` is only generated (once) the first
+    time it is read.
+    """
+    def __setattr__(self, name, value):
+        raise AttributeError(f"BottleneckScore is immutable; can't set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"BottleneckScore is immutable; can't delete {name!r}")
+
+    @property
+    def breakdown(self):
+        return {
+            "cpu_perf_score":  self.cpu.perf_score,
+            "gpu_perf_score":  self.gpu.perf_score,
+            "performance_gap": round(float(self.gap), 1),
+            "thread_penalty":  self.thread_penalty,
+            "pcie_penalty":    self.pcie_penalty,
+        }
+
+    @cached_property
+    def suggestions(self):
+        return tuple(build_suggestions(self.cpu, self.gpu, self.mb))
+
+    def as_dict(self):
+        """Same shape as calculate_bottleneck's dict."""
+        return {"bottleneck_pct": self.bottleneck_pct, "side": self.side,
+                "breakdown": self.breakdown, "suggestions": list(self.suggestions),
+                "compatible": self.compatible, "gap": self.gap}
+
+def score_build(cpu: CPU, gpu: GPU, mb: Motherboard):
+    """Fast numeric core: scores, penalties, side and compatibility, no text."""
+    gap, thread_penalty, pcie_penalty, total_pct, side = _raw_scores(cpu, gpu, mb)
+    return BottleneckScore(round(total_pct, 1), side, gap,
+                           round(thread_penalty, 1), round(pcie_penalty, 1),
+                           cpu.socket == mb.socket, cpu, gpu, mb)
+
+def calculate_bottleneck(cpu: CPU, gpu: GPU, mb: Motherboard):
+    raw = _raw_scores(cpu, gpu, mb)
+    gap, thread_penalty, pcie_penalty, total_pct, side = raw
+    breakdown = {
+        "cpu_perf_score":  cpu.perf_score,
+        "gpu_perf_score":  gpu.perf_score,
+        "performance_gap": round(float(gap), 1),
+        "thread_penalty":  round(thread_penalty, 1),
+        "pcie_penalty":    round(pcie_penalty, 1),
+    }
+    return {"bottleneck_pct": round(total_pct, 1), "side": side,
+            "breakdown": breakdown, "suggestions": _suggestions(cpu, gpu, mb, *raw),
+            "compatible": cpu.socket == mb.socket, "gap": gap}
+
+# ─────────────────────────── RESULT CACHE ────────────────────────────────────
+CacheInfo = namedtuple("CacheInfo", "hits misses evictions size maxsize")
+
+class BottleneckCache:
+    """
+    Bounded LRU memo of score_build results, keyed on the (CPU, GPU,
+    Motherboard) field values. Entries are immutable BottleneckScore tuples
+    (breakdown is a fresh dict per read, suggestions a tuple generated at
+    most once), so a caller can't corrupt a shared entry. The cache empties
+    itself whenever the registry's version changes.
+    """
+    def __init__(self, maxsize=4096, registry=None):
+        self.maxsize   = maxsize
+        self._registry = REGISTRY if registry is None else registry
+        self._version  = self._registry.version
+        self._data     = OrderedDict()
+        self._lock     = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def __call__(self, cpu, gpu, mb):
+        if self.maxsize <= 0:
+            self.misses += 1
+            return score_build(cpu, gpu, mb)
+        key = (cpu, gpu, mb)   # frozen dataclasses hash by field values
+        with self._lock:
+            if self._version != self._registry.version:
+                self._data.clear()
+                self._version = self._registry.version
+            r = self._data.get(key)
+            if r is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return r
+            self.misses += 1
+            version = self._version
+
+        r = score_build(cpu, gpu, mb)
+        with self._lock:
+            if version == self._version:
+                self._data[key] = r
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+        return r
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.evictions, len(self._data), self.maxsize)
+
+    def resize(self, maxsize):
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._data) > max(maxsize, 0):
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+cached_bottleneck = BottleneckCache()
+
+# ─────────────────────────── LIVE SCORING ────────────────────────────────────
+class LiveScorer:
+    """
+    score_build for a build edited one part at a time (the GUI's live mode).
+    The partial terms are memoized on just the parts they read: CPU × GPU
+    for the gap and thread penalty, GPU × board for the PCIe penalty. So a
+    board change only recomputes the PCIe penalty and compatibility, and
+    flipping back to a recent part is a lookup. Whole results are memoized
+    too, which keeps their lazily built suggestions.
+
+    Parts are keyed by identity (the registry hands out the same objects),
+    which is much cheaper than hashing every dataclass field; each entry
+    holds its parts, so an id can't be recycled while it is cached.
+    Single-threaded: the GUI calls it from Tk's thread only.
+    """
+    def __init__(self, maxsize=512, registry=None):
+        self.maxsize   = maxsize
+        self._registry = REGISTRY if registry is None else registry
+        self._version  = self._registry.version
+        self._pair     = OrderedDict()      # (id cpu, id gpu) → (cpu, gpu, _pair_terms)
+        self._pcie     = OrderedDict()      # (id gpu, id mb)  → (gpu, mb, _pcie_penalty)
+        self._full     = OrderedDict()      # (id cpu, id gpu, id mb) → BottleneckScore
+        self._last     = None               # last build computed (not just looked up)
+        self._pair_now = self._pcie_now = None
+        self.hits = self.misses = 0         # partial terms, not whole results
+
+    def _memo(self, table, a, b, fn):
+        key = (id(a), id(b))
+        e = table.get(key)
+        if e is not None:
+            table.move_to_end(key)
+            self.hits += 1
+            return e[2]
+        self.misses += 1
+        e = table[key] = (a, b, fn(a, b))
+        if len(table) > self.maxsize:
+            table.popitem(last=False)
+        return e[2]
+
+    def __call__(self, cpu, gpu, mb):
+        if self._version != self._registry.version:     # suggestions read the registry
+            self.clear()
+            self._version = self._registry.version
+        key = (id(cpu), id(gpu), id(mb))
+        r = self._full.get(key)
+        if r is not None:
+            self._full.move_to_end(key)
+            return r
+        # Usually only one part changed since the last build computed here:
+        # its terms are reused as they are, without even a memo lookup.
+        last = self._last
+        if last is None or last.cpu is not cpu or last.gpu is not gpu:
+            self._pair_now = self._memo(self._pair, cpu, gpu, _pair_terms)
+        if last is None or last.gpu is not gpu or last.mb is not mb:
+            self._pcie_now = self._memo(self._pcie, gpu, mb, _pcie_penalty)
+        gap, thread_penalty, pcie_penalty, total_pct, side = _combine(*self._pair_now,
+                                                                      self._pcie_now)
+        r = self._last = self._full[key] = BottleneckScore(round(total_pct, 1), side, gap,
+                                              round(thread_penalty, 1), round(pcie_penalty, 1),
+                                              cpu.socket == mb.socket, cpu, gpu, mb)
+        if len(self._full) > self.maxsize:
+            self._full.popitem(last=False)
+        return r
+
+    def clear(self):
+        self._pair.clear(); self._pcie.clear(); self._full.clear()
+        self._last = None
+
+# ─────────────────────────── PARTNER QUERIES ─────────────────────────────────
+PartnerPage = namedtuple("PartnerPage", "parts total offset")
+
+def balanced_gpus(cpu, within=BALANCED_GAP, offset=0, limit=None, registry=None):
+    """
+    GPUs whose perf_score is within `within` points of `cpu`'s, as a
+    PartnerPage (this page of parts, the full match count, the offset).
+    With the default window these are exactly the GPUs that score as
+    "Balanced" with `cpu` on any board. It is a range scan of
+    registry.gpu_index, not an evaluation of every GPU.
+    """
+    reg = REGISTRY if registry is None else registry
+    parts, total = reg.gpu_index.between(cpu.perf_score - within, cpu.perf_score + within,
+                                         offset, limit)
+    return PartnerPage(parts, total, offset)
+
+def balanced_cpus(gpu, board, within=BALANCED_GAP, offset=0, limit=None, registry=None):
+    """
+    CPUs that fit `board`'s socket with a perf_score within `within`
+    points of `gpu`'s, i.e. compatible "Balanced" builds. The result is a
+    PartnerPage like balanced_gpus.
+    """
+    reg = REGISTRY if registry is None else registry
+    idx = reg.cpu_index.get(board.socket)
+    if idx is None:
+        return PartnerPage([], 0, offset)
+    parts, total = idx.between(gpu.perf_score - within, gpu.perf_score + within, offset, limit)
+    return PartnerPage(parts, total, offset)
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  BATCH ENGINE — every CPU × GPU × board combination in one NumPy pass
+# ══════════════════════════════════════════════════════════════════════════════
+SIDES = ("Balanced", "GPU", "CPU")   # side codes returned by bottleneck_matrix
+
+def component_arrays(cpus=None, gpus=None, mbs=None):
+    """
+    The NumPy columns bottleneck_matrix reads. With no arguments these are
+    zero-copy views of REGISTRY.columns; explicit lists get packed first.
+    """
+    _numpy()
+    if cpus is None and gpus is None and mbs is None:
+        return REGISTRY.columns.arrays()
+    from .columns import ColumnCatalog
+    return ColumnCatalog(REGISTRY.cpus if cpus is None else cpus,
+                         REGISTRY.gpus if gpus is None else gpus,
+                         REGISTRY.mbs  if mbs  is None else mbs).arrays()
+
+def _numpy():
+    # Imported on first use: NumPy is optional and costs ~100 ms to import.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("the matrix engine requires NumPy (pip install numpy)") from None
+    return numpy
+
+def _round1(a):
+    np = _numpy()
+    # np.round scales by 10 and can land on the other side of a .x5 tie;
+    # apply Python's round() to the few distinct values instead.
+    u, inv = np.unique(a, return_inverse=True)
+    return np.array([round(x, 1) for x in u.tolist()])[inv].reshape(a.shape)
+
+def bottleneck_matrix(arrays=None):
+    """
+    Vectorised calculate_bottleneck over the full CPU × GPU × board cube.
+    Every array is indexed [cpu, gpu, board] and matches the scalar engine
+    exactly: bottleneck_pct, gap, thread_penalty and pcie_penalty (rounded as
+    in the breakdown), side (codes into SIDES) and compatible.
+    """
+    np = _numpy()
+    a = component_arrays() if arrays is None else arrays
+    cp, cores, gp, pcie = a["cpu_perf"], a["cpu_cores"], a["gpu_perf"], a["mb_pcie"]
+
+    gap = cp[:, None] - gp[None, :]                                     # [cpu, gpu]
+    bn_pct = np.abs(gap) * 0.55
+    thread_penalty = np.where((cores <= 4)[:, None] & (gp >= 60)[None, :],
+                              np.minimum((gp - 60) * 0.12, 10.0)[None, :], 0.0)
+    pcie_penalty = np.where((gp >= 75)[:, None] & (pcie <= 3)[None, :],
+                            np.minimum((gp - 75) * 0.10, 5.0)[:, None], 0.0)  # [gpu, board]
+
+    total = np.minimum((bn_pct + thread_penalty)[:, :, None] + pcie_penalty[None, :, :], 68.0)
+    side = np.where(gap > BALANCED_GAP, 1, np.where(gap < -BALANCED_GAP, 2, 0)).astype(np.int8)
+    total = np.where((side == 0)[:, :, None], np.minimum(total, 7.0), total)
+
+    shape = total.shape
+    return {
+        "bottleneck_pct": _round1(total),
+        "side":           np.broadcast_to(side[:, :, None], shape),
+        "gap":            np.broadcast_to(gap[:, :, None], shape),
+        "thread_penalty": np.broadcast_to(_round1(thread_penalty)[:, :, None], shape),
+        "pcie_penalty":   np.broadcast_to(_round1(pcie_penalty)[None, :, :], shape),
+        "compatible":     np.broadcast_to((a["cpu_socket"][:, None] == a["mb_socket"][None, :])[:, None, :], shape),
+    }
@@ -0,0 +1,244 @@
+"""
+Pareto frontiers of priced builds, per socket: an offline stage.
+
+For each socket the frontier holds the CPU + board + GPU builds that no
+other build beats on price (lower), combined perf_score (higher) and
+bottleneck_pct (lower) all at once, cheapest first. It answers "cheapest
+non-dominated build scoring at least N" with one lookup, in about a
+microsecond, instead of scoring the whole catalog.
+
+Building one doesn't score every build either. Parts of one scoring class
+(engine.cpu_class and friends) score alike in every build, so only the
+cheapest of each class can be on a frontier. These representatives are at
+most ~200 CPUs and 2 boards per socket and ~100 GPUs, however large the
+catalog.
+
+ParetoTable.add() takes new parts incrementally. Only builds involving a
+part that became a new representative are scored and merged; builds it
+undercuts fall off. Parts that got dearer or were withdrawn need a fresh
+ParetoTable.build(). save() / load() keep a table (representatives
+included, so it can keep growing) in a compact JSON file.
+
+    python -m bottleneck_calculator frontier build frontier.json [--db parts.bcdb]
+    python -m bottleneck_calculator frontier update frontier.json --db newparts.bcdb
+    python -m bottleneck_calculator frontier query frontier.json --min-score 150
+"""
+
+import json
+import os
+import sys
+from collections import namedtuple
+from dataclasses import astuple
+
+from .engine import (REGISTRY, board_class, cheapest_per_class, cpu_class, gpu_class,
+                     per_registry, score_build)
+from .models import CPU, GPU, Motherboard
+
+FORMAT = 1
+
+FrontierBuild = namedtuple("FrontierBuild", "price perf bottleneck_pct cpu gpu board")
+
+
+def _pareto(builds):
+    """The non-dominated FrontierBuilds (one per distinct point), cheapest first."""
+    builds = sorted(builds, key=lambda b: (b.price, -b.perf, b.bottleneck_pct))
+    top = max((b.perf for b in builds), default=0)
+    # floor[v]: lowest bottleneck_pct kept so far among builds with perf >= v.
+    # Builds come cheapest first, so one is dominated iff floor[perf] <= its pct.
+    floor = [float("inf")] * (top + 1)
+    out = []
+    for b in builds:
+        if floor[b.perf] <= b.bottleneck_pct:
+            continue
+        out.append(b)
+        for v in range(b.perf, -1, -1):        # floor is non-decreasing in v
+            if floor[v] <= b.bottleneck_pct:
+                break
+            floor[v] = b.bottleneck_pct
+    return out
+
+
+class ParetoTable:
+    """Per-socket Pareto frontiers over (price, perf, bottleneck_pct)."""
+    def __init__(self):
+        self._cpus   = {}       # cpu_class → cheapest CPU
+        self._boards = {}       # board_class → cheapest board
+        self._gpus   = {}       # gpu_class → cheapest GPU
+        self.frontiers = {}     # socket → [FrontierBuild], cheapest first
+        self._merged   = []     # every socket's frontier builds, cheapest first
+        self._lookup   = {}     # socket or None → [index of the cheapest with perf >= n]
+
+    @classmethod
+    def build(cls, cpus, gpus, mbs):
+        table = cls()
+        table.add(cpus, gpus, mbs)
+        return table
+
+    def __len__(self):
+        return sum(map(len, self.frontiers.values()))
+
+    # ── building ──────────────────────────────────────────────────────────────
+    def add(self, cpus=(), gpus=(), mbs=()):
+        """Fold new (priced) parts in; returns how many builds were scored."""
+        new_c = {id(c): c for c in cheapest_per_class(cpus, cpu_class, self._cpus)}
+        new_m = {id(m): m for m in cheapest_per_class(mbs, board_class, self._boards)}
+        new_g = {id(g): g for g in cheapest_per_class(gpus, gpu_class, self._gpus)}
+        if not (new_c or new_m or new_g):
+            return 0
+
+        by_socket = {}
+        for c in self._cpus.values():
+            by_socket.setdefault(c.socket, ([], []))[0].append(c)
+        for m in self._boards.values():
+            by_socket.setdefault(m.socket, ([], []))[1].append(m)
+        gpus_all = list(self._gpus.values())
+
+        scored = 0
+        for socket, (cs, ms) in by_socket.items():
+            # Builds with at least one new representative, each exactly once:
+            # new CPU × any board × any GPU, old CPU × new board × any GPU,
+            # old CPU × old board × new GPU.
+            cands = []
+            for c in cs:
+                c_new = id(c) in new_c
+                for m in ms:
+                    gs = gpus_all if c_new or id(m) in new_m else new_g.values()
+                    for g in gs:
+                        r = score_build(c, g, m)
+                        cands.append(FrontierBuild(c.price + m.price + g.price,
+                                                   c.perf_score + g.perf_score,
+                                                   r.bottleneck_pct, c, g, m))
+            if cands:
+                scored += len(cands)
+                self.frontiers[socket] = _pareto(self.frontiers.get(socket, []) + cands)
+        self._index()
+        return scored
+
+    # ── queries ───────────────────────────────────────────────────────────────
+    def _index(self):
+        """Lookup tables per socket, and for all sockets together (key None)."""
+        self._merged = sorted((b for front in self.frontiers.values() for b in front),
+                              key=lambda b: b.price)
+        self._lookup = {}
+        for s, front in [(None, self._merged), *self.frontiers.items()]:
+            t = []                              # t[n]: index of the cheapest with perf >= n
+            for i, b in enumerate(front):       # cheapest first: first hit wins
+                t.extend([i] * (b.perf + 1 - len(t)))
+            self._lookup[s] = t
+
+    def cheapest(self, min_score=0, socket=None, max_pct=None):
+        """
+        Cheapest frontier build with perf (CPU + GPU perf_score) >= `min_score`
+        and, if given, bottleneck_pct <= `max_pct`, on `socket` or any
+        socket. None if there is none.
+        """
+        front = self._merged if socket is None else self.frontiers.get(socket, ())
+        t = self._lookup.get(socket, ())
+        n = max(min_score, 0)
+        if n >= len(t):
+            return None
+        if max_pct is None:
+            return front[t[n]]
+        # Nothing cheaper than front[t[n]] scores high enough; scan on from there.
+        return next((b for b in front[t[n]:] if b.perf >= n and b.bottleneck_pct <= max_pct), None)
+
+    # ── storage ───────────────────────────────────────────────────────────────
+    def save(self, path):
+        """Write the table as JSON, atomically."""
+        import tempfile
+        parts = {"cpus": list(self._cpus.values()), "gpus": list(self._gpus.values()),
+                 "boards": list(self._boards.values())}
+        pos = {id(p): i for ps in parts.values() for i, p in enumerate(ps)}
+        doc = {"format": FORMAT,
+               **{k: [astuple(p) for p in ps] for k, ps in parts.items()},
+               "frontiers": {s: [[b.price, b.perf, b.bottleneck_pct,
+                                  pos[id(b.cpu)], pos[id(b.gpu)], pos[id(b.board)]]
+                                 for b in front]
+                             for s, front in self.frontiers.items()}}
+        d = os.path.dirname(os.path.abspath(path))
+        fd, tmp = tempfile.mkstemp(dir=d, prefix=".frontier-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(doc, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(tmp, path)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    @classmethod
+    def load(cls, path):
+        with open(path, encoding="utf-8") as f:
+            doc = json.load(f)
+        if doc.get("format") != FORMAT:
+            raise ValueError(f"{path}: frontier format {doc.get('format')}, expected {FORMAT}")
+        cpus   = [CPU(*row) for row in doc["cpus"]]
+        gpus   = [GPU(*row) for row in doc["gpus"]]
+        boards = [Motherboard(*row) for row in doc["boards"]]
+        table = cls()
+        table._cpus   = {cpu_class(c): c for c in cpus}
+        table._boards = {board_class(m): m for m in boards}
+        table._gpus   = {gpu_class(g): g for g in gpus}
+        table.frontiers = {s: [FrontierBuild(price, perf, pct, cpus[ci], gpus[gi], boards[bi])
+                               for price, perf, pct, ci, gi, bi in rows]
+                           for s, rows in doc["frontiers"].items()}
+        table._index()
+        return table
+
+
+# ─────────────────────────── API ─────────────────────────────────────────────
+@per_registry
+def pareto_table(reg):
+    """The ParetoTable for a registry's current lists, rebuilt after a load."""
+    return ParetoTable.build(reg.cpus, reg.gpus, reg.mbs)
+
+def cheapest_build(min_score=0, socket=None, max_pct=None, registry=None):
+    """Cheapest non-dominated build scoring at least `min_score`; see ParetoTable.cheapest."""
+    return pareto_table(registry).cheapest(min_score, socket, max_pct)
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+def main(argv=None):
+    import argparse
+    import time
+    ap = argparse.ArgumentParser(prog="python -m bottleneck_calculator frontier",
+                                 description="Precompute and query per-socket Pareto frontiers.")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+    b = sub.add_parser("build", help="compute frontiers for the current dataset")
+    b.add_argument("path")
+    u = sub.add_parser("update", help="fold the current dataset's new or cheaper parts in")
+    u.add_argument("path")
+    for p in (b, u):
+        p.add_argument("--db", metavar="PATH",
+                       help="component database file (default: $BOTTLENECK_DB or built-in)")
+    q = sub.add_parser("query", help="cheapest non-dominated build above a score")
+    q.add_argument("path")
+    q.add_argument("--min-score", type=int, default=0, help="combined CPU + GPU perf_score")
+    q.add_argument("--socket")
+    q.add_argument("--max-pct", type=float, help="highest bottleneck_pct accepted")
+    args = ap.parse_args(argv)
+
+    if args.cmd == "query":
+        table = ParetoTable.load(args.path)
+        t0 = time.perf_counter()
+        hit = table.cheapest(args.min_score, args.socket, args.max_pct)
+        dt = (time.perf_counter() - t0) * 1e6
+        if hit is None:
+            print("no build on the frontier meets that", file=sys.stderr)
+            return 1
+        print(f"{hit.price:.2f}  perf {hit.perf}  bottleneck {hit.bottleneck_pct}%  "
+              f"{hit.cpu.name} + {hit.board.name} + {hit.gpu.name}   ({dt:.1f} µs)")
+        return 0
+
+    if args.db:
+        REGISTRY.load_database(args.db)
+    t0 = time.perf_counter()
+    if args.cmd == "build":
+        table = ParetoTable.build(REGISTRY.cpus, REGISTRY.gpus, REGISTRY.mbs)
+        scored = "all"
+    else:
+        table = ParetoTable.load(args.path)
+        scored = table.add(REGISTRY.cpus, REGISTRY.gpus, REGISTRY.mbs)
+    table.save(args.path)
+    print(f"wrote {args.path}: {len(table)} frontier builds over {len(table.frontiers)} sockets "
+          f"({scored} builds scored, {time.perf_counter() - t0:.2f} s)")
+    return 0
@@ -0,0 +1,234 @@
+"""
+Fuzzy name resolution for messy feeds: "RTX4070TI 12G", "b650 am5 board".
+
+Names are folded to a compact key: lower-cased, split into letter and
+digit runs, with vendor words ("intel", "nvidia", ...) and filler
+("board", "graphics card", ...) dropped, "12g" read as "12gb", and the
+rest run together, so "NVIDIA RTX 4070 Ti 12GB" and "rtx4070ti 12g" are
+both "rtx4070ti12gb". Every part is indexed under its full key, its key
+without the memory size, and (boards) its key without the "(socket)".
+
+A key that exactly matches one of those is a hit with confidence 1.0.
+Otherwise only keys of the same shape are candidates: the same digit runs
+in the same places, between the same number of letter runs ("rtx4070ti"
+is "_4070_"). A typo may garble a word, but a different model number
+("rtx 4090 ti" for the 4070 Ti, "b660" for the B860) or a missing or
+extra suffix ("rtx 4090 ti" for the plain 4090) is a different part, not
+a misspelling, so it doesn't match at all. Each shape has its own tables.
+
+Most typos are one edit away, and two keys are one edit apart only if one
+is the other minus a character, or both lose the character at the same
+position. So a table of every key with one character deleted (and where)
+gives the distance-1 neighbours from a dozen dict lookups. Anything
+further is looked up in a BK-tree over the shape's keys by Levenshtein
+distance, at radius 2, 3, ... up to about a quarter of the key's length.
+The nearest key wins, with ties going to catalog order, and the
+confidence is 1 - distance / longer key length. Distances use Hyyrö's
+bit-parallel algorithm: the query's character masks are built once, then
+each key costs one pass of integer ops over its characters.
+
+Most lookups in a feed repeat, so NameMatcher remembers its answers (up to
+MEMO entries). ComponentRegistry.resolve() puts the exact and alias lookup
+in front of it.
+"""
+
+import re
+from .engine import Match
+
+MIN_CONFIDENCE = 0.75     # weaker matches are reported as not found
+MEMO           = 1 << 16  # remembered query strings per NameMatcher
+
+_TOKEN  = re.compile(r"[a-z]+|\d+")
+_WORDS  = re.compile(r"[a-z]+")
+_GB     = frozenset(("g", "gb", "gig", "gigs"))      # after a number: memory size
+_DROP   = frozenset(("intel", "core", "nvidia", "geforce", "amd", "radeon", "board",
+                     "motherboard", "mobo", "mainboard", "cpu", "processor", "gpu",
+                     "graphics", "card", "video", "edition", "the"))
+
+
+# Every run of letters one typo (edit or swap) from a dropped word of 4+
+# letters ("intl", "cre", "nvidai"), and dropped words run into a word's start.
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+def _typos(w):
+    for j in range(len(w) + 1):
+        yield from (w[:j] + c + w[j:] for c in _LETTERS)
+        if j < len(w):
+            yield w[:j] + w[j + 1:]
+            yield from (w[:j] + c + w[j + 1:] for c in _LETTERS)
+        if j < len(w) - 1:
+            yield w[:j] + w[j + 1] + w[j] + w[j + 2:]
+
+_MISSPELT = frozenset(t for w in _DROP if len(w) >= 4 for t in _typos(w))
+_GLUED    = re.compile("^(?:%s)+" % "|".join(sorted(_DROP, key=len, reverse=True)))
+
+def _loose(t):
+    """`t` without dropped words run into its start ("intelcore"); "" if misspelt one."""
+    t = _GLUED.sub("", t)
+    return "" if t in _MISSPELT else t
+
+def fold(name, loose=False):
+    """
+    The compact matching key of a name, e.g. "rtx4070ti12gb". `loose` also
+    drops run-together and misspelt dropped words (fuzzy lookups only).
+    """
+    out = []
+    for t in _TOKEN.findall(name.lower()):
+        if t in _DROP:
+            continue
+        if t in _GB and out and out[-1].isdigit():
+            t = "gb"
+        elif loose:
+            t = _loose(t)
+        out.append(t)
+    return "".join(out)
+
+def _keys(name):
+    """Keys a catalog name is indexed under: full, without memory, without socket."""
+    keys = [fold(name)]
+    bare = re.sub(r"\(.*?\)", " ", name)
+    for form in (re.sub(r"\b\d+\s*gb\b", " ", name, flags=re.I), bare):
+        k = fold(form)
+        if k and k not in keys:
+            keys.append(k)
+    return keys
+
+
+def shape(key):
+    """`key` with each run of letters reduced to "_": "rtx4070ti12gb" → "_4070_12_"."""
+    return _WORDS.sub("_", key)
+
+
+def _masks(s):
+    peq = {}
+    for i, ch in enumerate(s):
+        peq[ch] = peq.get(ch, 0) | (1 << i)
+    return peq
+
+def distance(peq, m, text):
+    """Levenshtein distance from the pattern (masks `peq`, length `m`) to `text`."""
+    if not m:
+        return len(text)
+    mask, hi = (1 << m) - 1, 1 << (m - 1)
+    pv, mv, score = mask, 0, m
+    for ch in text:
+        eq = peq.get(ch, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | ~(xh | pv)
+        mh = pv & xh
+        if ph & hi:
+            score += 1
+        elif mh & hi:
+            score -= 1
+        ph = (ph << 1) | 1
+        pv = ((mh << 1) | ~(xv | ph)) & mask
+        mv = ph & xv
+    return score
+
+
+class NameMatcher:
+    """
+    Exact-key table plus, per key shape, a deletion table and BK-tree over
+    one list of parts' folded names. `names` (default: each part's .name)
+    lets a mapped table be indexed without materialising its rows; only
+    the parts a lookup returns are read.
+    """
+    def __init__(self, parts, names=None):
+        self._parts = parts
+        self._exact = {}                # key → catalog position of its part (first listed wins)
+        for i, n in enumerate(names if names is not None else (p.name for p in parts)):
+            for k in _keys(n):
+                self._exact.setdefault(k, i)
+        self._dels  = {}                # (shape, key minus one character) → [(key, position)]
+        self._roots = {}                # shape → BK-tree [key, {distance: child}]
+        for k in self._exact:
+            sh = shape(k)
+            for j in range(len(k)):
+                self._dels.setdefault((sh, k[:j] + k[j + 1:]), []).append((k, j))
+            self._insert(sh, k)
+        self._memo = {}
+
+    def __len__(self):
+        return len(self._exact)
+
+    def _insert(self, sh, key):
+        node = self._roots.get(sh)
+        if node is None:
+            self._roots[sh] = [key, {}]
+            return
+        peq, m = _masks(key), len(key)
+        while True:
+            d = distance(peq, m, node[0])
+            child = node[1].get(d)
+            if child is None:
+                node[1][d] = [key, {}]
+                return
+            node = child
+
+    def within(self, key, radius):
+        """(distance, key) for every indexed key of `key`'s shape within `radius` of it."""
+        root = self._roots.get(shape(key))
+        if root is None:
+            return []
+        peq, m = _masks(key), len(key)
+        out, stack = [], [root]
+        while stack:
+            k, children = stack.pop()
+            d = distance(peq, m, k)
+            if d <= radius:
+                out.append((d, k))
+            for cd, child in children.items():
+                if d - radius <= cd <= d + radius:
+                    stack.append(child)
+        return out
+
+    def _near(self, key):
+        """Indexed keys of `key`'s shape exactly one edit from `key` (which isn't indexed)."""
+        exact, dels, sh = self._exact, self._dels, shape(key)
+        near = {k for k, _ in dels.get((sh, key), ())}  # key lost a character
+        for j in range(len(key)):
+            d = key[:j] + key[j + 1:]
+            if d in exact and shape(d) == sh:           # key gained one
+                near.add(d)
+            near.update(k for k, i in dels.get((sh, d), ()) if i == j)     # one changed
+        return [(1, k) for k in near]
+
+    def _radius(self, key):
+        return max(1, len(key) // 4)
+
+    def matches(self, name, k=3):
+        """Up to `k` Matches for `name`, nearest first, one per part."""
+        key, out, seen = fold(name, loose=True), [], set()
+        for d, kk in sorted(self.within(key, self._radius(key)),
+                            key=lambda e: (e[0], self._exact[e[1]])):
+            i = self._exact[kk]
+            if i not in seen and len(out) < k:
+                seen.add(i)
+                out.append(Match(self._parts[i],
+                                 round(1 - d / max(len(key), len(kk), 1), 3), d))
+        return out
+
+    def match(self, name):
+        """The best Match for `name`, or None if nothing is near enough."""
+        hit = self._memo.get(name, self)
+        if hit is not self:
+            return hit
+        key = fold(name)
+        i   = self._exact.get(key)
+        if i is None:
+            key = fold(name, loose=True)
+            i   = self._exact.get(key)
+        hit = None if i is None else Match(self._parts[i], 1.0, 0)
+        if hit is None:
+            for radius in range(1, self._radius(key) + 1):
+                near = self._near(key) if radius == 1 else self.within(key, radius)
+                if near:
+                    d, k = min(near, key=lambda e: (e[0], self._exact[e[1]]))
+                    hit = Match(self._parts[self._exact[k]],
+                                round(1 - d / max(len(key), len(k)), 3), d)
+                    break
+        if len(self._memo) >= MEMO:
+            self._memo.clear()
+        self._memo[name] = hit
+        return hit
@@ -0,0 +1,933 @@
+"""Tk user interface."""
+
+import logging
+import queue
+import time
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+from tkinter import ttk, messagebox
+import webbrowser
+
+from .engine import REGISTRY, LiveScorer, cached_bottleneck
+from .search import SearchIndex
+from .update import CURRENT_VER, DOWNLOAD_PAGE, GITHUB_REPO, check_update_async
+
+# ─────────────────────────── THEMES ──────────────────────────────────────────
+THEMES = {
+    "light": {
+        "primary":        "#1976D2",
+        "primary_dark":   "#0D47A1",
+        "primary_light":  "#BBDEFB",
+        "accent":         "#FF6D00",
+        "bg":             "#F5F5F5",
+        "card":           "#FFFFFF",
+        "error":          "#D32F2F",
+        "warning":        "#F57C00",
+        "success":        "#2E7D32",
+        "on_primary":     "#FFFFFF",
+        "on_bg":          "#212121",
+        "on_surface":     "#212121",
+        "secondary_text": "#616161",
+        "divider":        "#BDBDBD",
+        "shadow":         "#E0E0E0",
+        "entry_bg":       "#FFFFFF",
+        "entry_fg":       "#212121",
+        "list_bg":        "#FFFFFF",
+        "list_select":    "#BBDEFB",
+        "topbar_bg":      "#1976D2",
+        "topbar_fg":      "#FFFFFF",
+        "topbar_sub":     "#BBDEFB",
+        "gauge_track":    "#E0E0E0",
+        "toggle_bg":      "#E3F2FD",
+        "toggle_fg":      "#1976D2",
+    },
+    "dark": {
+        "primary":        "#42A5F5",
+        "primary_dark":   "#1565C0",
+        "primary_light":  "#1E3A5F",
+        "accent":         "#FF9800",
+        "bg":             "#121212",
+        "card":           "#1E1E1E",
+        "error":          "#EF5350",
+        "warning":        "#FFA726",
+        "success":        "#66BB6A",
+        "on_primary":     "#FFFFFF",
+        "on_bg":          "#E0E0E0",
+        "on_surface":     "#E0E0E0",
+        "secondary_text": "#9E9E9E",
+        "divider":        "#333333",
+        "shadow":         "#000000",
+        "entry_bg":       "#2C2C2C",
+        "entry_fg":       "#E0E0E0",
+        "list_bg":        "#2C2C2C",
+        "list_select":    "#1E3A5F",
+        "topbar_bg":      "#0D1B2A",
+        "topbar_fg":      "#E0E0E0",
+        "topbar_sub":     "#42A5F5",
+        "gauge_track":    "#333333",
+        "toggle_bg":      "#1E3A5F",
+        "toggle_fg":      "#42A5F5",
+    }
+}
+
+T = THEMES["light"].copy()   # active theme — mutated on toggle
+
+log = logging.getLogger(__name__)   # BOTTLENECK_DEBUG=1 logs per-keystroke timings
+
+
+class ThemeRegistry:
+    """
+    Which theme role (a THEMES key) each colour option of each widget plays,
+    recorded when the widget is built. apply() switches T and replays a
+    Tcl configure batch precomputed per theme: one call per widget, no tree
+    walk and no guessing roles back from colours. Destroyed widgets drop
+    out on their own.
+    """
+    def __init__(self):
+        self._roles   = {}      # widget → {option: role}
+        self._hooks   = []      # run after a switch (canvas redraws, labels…)
+        self._batches = {}      # theme name → [(tk.call, (path, "configure", -opt, colour, …))]
+
+    def add(self, widget, **roles):
+        """Give `widget` the current colours for `roles` and keep them themed."""
+        widget.configure(**{opt: T[role] for opt, role in roles.items()})
+        if widget not in self._roles:
+            self._roles[widget] = {}
+            widget.bind("<Destroy>", lambda e, w=widget: self._drop(w) if e.widget is w else None,
+                        add="+")
+        known = self._roles[widget]
+        if any(known.get(opt) != role for opt, role in roles.items()):
+            known.update(roles)
+            self._batches.clear()
+        return widget
+
+    def on_apply(self, hook):
+        self._hooks.append(hook)
+
+    def _drop(self, widget):
+        if self._roles.pop(widget, None) is not None:
+            self._batches.clear()
+
+    def _batch(self, name):
+        batch = self._batches.get(name)
+        if batch is None:
+            theme = THEMES[name]
+            batch = self._batches[name] = [
+                (w.tk.call, (str(w), "configure",
+                             *(x for opt, role in roles.items() for x in ("-" + opt, theme[role]))))
+                for w, roles in self._roles.items()]
+        return batch
+
+    def apply(self, name):
+        T.update(THEMES[name])
+        for call, args in self._batch(name):
+            call(args)
+        for hook in self._hooks:
+            hook()
+
+THEME = ThemeRegistry()
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  CALCULATION JOBS
+# ══════════════════════════════════════════════════════════════════════════════
+class CalcJobs:
+    """
+    Runs calculations on a worker thread and hands the newest one's result
+    back on the Tk thread. submit() supersedes the previous job: if it is
+    still queued it is cancelled, and if it is already running its result
+    is dropped. A long job can also check superseded() and return early.
+    Results travel through a SimpleQueue that `widget` polls with after(),
+    so on_result / on_error only ever run on Tk's thread.
+    """
+    POLL_MS = 15
+
+    def __init__(self, widget, on_result, on_error):
+        self._widget    = widget
+        self._on_result = on_result
+        self._on_error  = on_error
+        self._pool      = None          # created by the first submit()
+        self._queue     = queue.SimpleQueue()
+        self._seq       = 0             # id of the newest job
+        self._running   = 0             # id of the job on the worker, if any
+        self._future    = None
+        self._poll_id   = None          # after() id while a job is outstanding
+
+    def submit(self, fn, *args):
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(1, thread_name_prefix="calc")
+        if self._future is not None:
+            self._future.cancel()
+        self._seq += 1
+        self._future = self._pool.submit(self._run, self._seq, fn, args)
+        if self._poll_id is None:
+            self._poll_id = self._widget.after(self.POLL_MS, self._poll)
+        return self._seq
+
+    def superseded(self):
+        """True, on the worker, once a newer job than the running one is submitted."""
+        return self._running != self._seq
+
+    def busy(self):
+        return self._future is not None and not self._future.done()
+
+    def _run(self, seq, fn, args):
+        if seq != self._seq:
+            return
+        self._running = seq
+        t0 = time.perf_counter()
+        try:
+            self._queue.put((seq, True, fn(*args)))
+        except Exception as e:
+            self._queue.put((seq, False, e))
+        log.debug("calc job %d: %.1f ms on worker", seq, (time.perf_counter() - t0) * 1e3)
+
+    def _poll(self):
+        self._poll_id = None
+        # Snapshot before draining: a job that finishes after the drain was
+        # still busy here, so polling continues and picks its result up.
+        busy   = self.busy()
+        latest = None
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item[0] == self._seq:
+                latest = item
+        if latest is not None:
+            _, ok, value = latest
+            (self._on_result if ok else self._on_error)(value)
+        elif busy:
+            self._poll_id = self._widget.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        """Drop the outstanding job's result (a queued job never starts)."""
+        self._seq += 1
+        if self._future is not None:
+            self._future.cancel()
+
+    def shutdown(self):
+        self.cancel()
+        if self._poll_id is not None:
+            self._widget.after_cancel(self._poll_id)
+            self._poll_id = None
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SEARCH INDEXES
+# ══════════════════════════════════════════════════════════════════════════════
+_indexer = None
+
+def _build_index(names):
+    """A Future of SearchIndex(names), built on a shared background thread."""
+    global _indexer
+    if _indexer is None:
+        _indexer = ThreadPoolExecutor(1, thread_name_prefix="search-index")
+    return _indexer.submit(SearchIndex, names)
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  VIRTUAL LISTBOX
+# ══════════════════════════════════════════════════════════════════════════════
+class VirtualListbox(tk.Frame):
+    """
+    Listbox + scrollbar over an arbitrarily long sequence. Only the `rows`
+    visible items exist as Listbox rows; the scrollbar, mouse wheel and
+    keys move a window (`top`) over `items`, so opening, scrolling and
+    refiltering cost the same for 100 items or 100,000.
+    """
+    def __init__(self, parent, rows=10, **listbox_opts):
+        super().__init__(parent, bg=listbox_opts.get("bg"))
+        self.rows   = rows
+        self.items  = []
+        self.top    = 0         # index of the first visible item
+        self.cursor = None      # keyboard cursor (index into items), once navigating
+        self._shown = []        # what the Listbox currently holds
+
+        self._sb = tk.Scrollbar(self, orient="vertical", command=self._yview)
+        self.lb  = tk.Listbox(self, height=rows, **listbox_opts)
+        self._sb.pack(side="right", fill="y")
+        self.lb.pack(side="left", fill="both", expand=True)
+
+        self.lb.bind("<MouseWheel>", lambda e: self._scroll(-3 if e.delta > 0 else 3))
+        self.lb.bind("<Button-4>",   lambda e: self._scroll(-3))
+        self.lb.bind("<Button-5>",   lambda e: self._scroll(3))
+        for key, step in (("<Up>", -1), ("<Down>", 1),
+                          ("<Prior>", -rows), ("<Next>", rows)):
+            self.lb.bind(key, lambda e, d=step: self.move_cursor(d))
+        self.lb.bind("<Home>", lambda e: self.set_cursor(0))
+        self.lb.bind("<End>",  lambda e: self.set_cursor(len(self.items) - 1))
+
+    def set_items(self, items):
+        """Show a new sequence from the top; it is indexed, never copied into Tk."""
+        self.items  = items
+        self.top    = 0
+        self.cursor = None
+        self._render()
+
+    def selected(self):
+        """Index into `items` of the clicked / keyboard-selected row, or None."""
+        sel = self.lb.curselection()
+        return self.top + sel[0] if sel else None
+
+    def set_cursor(self, i):
+        if not self.items:
+            return "break"
+        self.cursor = max(0, min(i, len(self.items) - 1))
+        if self.cursor < self.top:
+            self.top = self.cursor
+        elif self.cursor >= self.top + self.rows:
+            self.top = self.cursor - self.rows + 1
+        self._render()
+        return "break"          # replaces the Listbox's own key bindings
+
+    def move_cursor(self, delta):
+        return self.set_cursor((self.top if self.cursor is None else self.cursor) + delta)
+
+    def _scroll(self, delta):
+        self._scroll_to(self.top + delta)
+        return "break"
+
+    def _scroll_to(self, top):
+        top = max(0, min(top, len(self.items) - self.rows))
+        if top != self.top:
+            self.top = top
+            self._render()
+
+    def _yview(self, *args):
+        if args[0] == "moveto":
+            self._scroll_to(round(float(args[1]) * len(self.items)))
+        elif args[0] == "scroll":
+            n = int(args[1])
+            self._scroll(n * self.rows if args[2] == "pages" else n)
+
+    def _render(self):
+        self._patch(self.items[self.top:self.top + self.rows])
+        n = len(self.items)
+        self._sb.set(*((self.top / n, min(1.0, (self.top + self.rows) / n)) if n else (0, 1)))
+        self.lb.selection_clear(0, "end")
+        if self.cursor is not None and 0 <= self.cursor - self.top < self.rows:
+            self.lb.selection_set(self.cursor - self.top)
+            self.lb.activate(self.cursor - self.top)
+
+    def _patch(self, rows):
+        """Make the Listbox hold `rows`, touching only the rows that changed."""
+        old = self._shown
+        if rows == old:
+            return
+        n, p = min(len(old), len(rows)), 0
+        while p < n and old[p] == rows[p]:
+            p += 1
+        q = 0
+        while q < n - p and old[-1 - q] == rows[-1 - q]:
+            q += 1
+        if p < len(old) - q:
+            self.lb.delete(p, len(old) - q - 1)
+        if p < len(rows) - q:
+            self.lb.insert(p, *rows[p:len(rows) - q])
+        self._shown = list(rows)
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  SEARCHABLE COMBOBOX WIDGET
+# ══════════════════════════════════════════════════════════════════════════════
+class SearchCombo(tk.Frame):
+    """
+    Entry + virtual Listbox dropdown with live, ranked search (see
+    search.py). The index is built off the Tk thread; until it is ready,
+    typing filters with a plain substring scan. Keystrokes are debounced:
+    the filter runs DEBOUNCE_MS after typing pauses, and only the visible
+    rows are handed to Tk. `command`,
+    if given, is called with the new value whenever the entry comes to hold
+    a different valid name (picked, or typed out in full).
+    """
+    DEBOUNCE_MS = 90
+
+    def __init__(self, parent, values, command=None, **kwargs):
+        super().__init__(parent)
+        THEME.add(self, bg="card")
+        self._all     = list(values)
+        self._valid   = set(self._all)
+        self._filtered= self._all
+        self._index   = _build_index(self._all)   # Future of the SearchIndex
+        self._var     = tk.StringVar()
+        self._open    = False
+        self._pending = None        # after() id of the debounced filter
+        self._quiet   = False       # set(quiet=True) in progress
+        self._value   = None        # last valid value reported to command
+        self._command = command
+
+        self._entry = THEME.add(tk.Entry(self, textvariable=self._var,
+                                         font=("Segoe UI",9),
+                                         relief="flat", bd=0,
+                                         highlightthickness=1),
+                                bg="entry_bg", fg="entry_fg", insertbackground="entry_fg",
+                                highlightbackground="divider", highlightcolor="primary")
+        self._entry.pack(fill="x", ipady=5, padx=0)
+
+        # Popup (Toplevel so it overlaps siblings)
+        self._popup = tk.Toplevel(self)
+        self._popup.withdraw()
+        self._popup.overrideredirect(True)
+        self._popup.attributes("-topmost", True)
+
+        frame = THEME.add(tk.Frame(self._popup, bd=1), bg="divider")
+        frame.pack(fill="both", expand=True)
+
+        self._list = THEME.add(VirtualListbox(frame, rows=10, font=("Segoe UI",9),
+                                              relief="flat", bd=0,
+                                              activestyle="none"),
+                               bg="list_bg")
+        self._list.pack(fill="both", expand=True)
+        self._lb = THEME.add(self._list.lb, bg="list_bg", fg="on_surface",
+                             selectbackground="list_select", selectforeground="on_surface")
+        self._list.set_items(self._filtered)
+
+        # Bindings
+        self._var.trace_add("write", self._on_type)
+        self._entry.bind("<FocusIn>",  self._show)
+        self._entry.bind("<FocusOut>", self._on_focus_out)
+        self._entry.bind("<Down>",     self._focus_list)
+        self._entry.bind("<Return>",   self._pick_first)
+        self._lb.bind("<<ListboxSelect>>", self._on_select)
+        self._lb.bind("<Return>",      self._on_select)
+        self._lb.bind("<Escape>",      lambda e: self._hide())
+        self._lb.bind("<FocusOut>",    self._on_focus_out)
+
+        # Set default
+        self.set(self._all[0] if self._all else "", quiet=True)
+
+    def _on_type(self, *_):
+        if self._pending:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.DEBOUNCE_MS, self._refilter)
+        if self._quiet:
+            return
+        if not self._open:
+            self._show()
+        v = self._var.get()
+        if self._command and v != self._value and v in self._valid:
+            self._value = v
+            self._command(v)
+
+    def _refilter(self):
+        self._pending = None
+        q  = self._var.get()
+        t0 = time.perf_counter()
+        if self._index.done():
+            self._filtered = self._index.result().search(q)
+        else:
+            ql = q.lower()
+            self._filtered = [v for v in self._all if ql in v.lower()] if ql else self._all
+        t1 = time.perf_counter()
+        self._list.set_items(self._filtered)
+        if log.isEnabledFor(logging.DEBUG):
+            self._lb.update_idletasks()
+            t2 = time.perf_counter()
+            log.debug("filter %r over %d: %d matches, search %.2f ms, render %.2f ms",
+                      q, len(self._all), len(self._filtered),
+                      (t1 - t0) * 1e3, (t2 - t1) * 1e3)
+
+    def _flush(self):
+        """Apply a pending debounced filter now (before acting on _filtered)."""
+        if self._pending:
+            self.after_cancel(self._pending)
+            self._refilter()
+
+    def _show(self, *_):
+        self._open = True
+        self._popup.deiconify()
+        self._reposition()
+
+    def _hide(self):
+        self._open = False
+        self._popup.withdraw()
+
+    def _reposition(self):
+        self.update_idletasks()
+        x = self._entry.winfo_rootx()
+        y = self._entry.winfo_rooty() + self._entry.winfo_height()
+        w = self._entry.winfo_width()
+        h = self._popup.winfo_reqheight()     # exactly `rows` listbox rows
+        self._popup.geometry(f"{w}x{h}+{x}+{y}")
+
+    def _on_focus_out(self, event):
+        # Delay to allow listbox click to register
+        self.after(150, self._check_focus)
+
+    def _check_focus(self):
+        try:
+            focused = self._popup.focus_get()
+            if focused not in (self._lb, self._entry):
+                self._hide()
+                # Restore to last valid value if entry doesn't match
+                if self._var.get() not in self._valid:
+                    self._var.set(self._all[0] if self._all else "")
+        except Exception:
+            pass
+
+    def _focus_list(self, *_):
+        self._flush()
+        if self._filtered:
+            self._lb.focus_set()
+            self._list.set_cursor(0)
+
+    def _pick_first(self, *_):
+        self._flush()
+        if self._filtered:
+            self._var.set(self._filtered[0])
+        self._hide()
+
+    def _on_select(self, *_):
+        i = self._list.selected()
+        if i is not None:
+            self._var.set(self._filtered[i])
+        self._hide()
+        self._entry.focus_set()
+
+    def get(self):
+        return self._var.get()
+
+    def set(self, val, quiet=False):
+        """
+        Put `val` in the entry. With `quiet`, the dropdown stays shut and
+        `command` isn't called (the caller already knows the value).
+        """
+        if quiet:
+            self._value, self._quiet = val, True
+        try:
+            self._var.set(val)
+        finally:
+            self._quiet = False
+
+# ══════════════════════════════════════════════════════════════════════════════
+#  MAIN APPLICATION
+# ══════════════════════════════════════════════════════════════════════════════
+class BottleneckApp(tk.Tk):
+    def __init__(self):
+        super().__init__()
+        self._dark = False
+        self.title(f"Bottleneck Calculator  v{CURRENT_VER}")
+        self.geometry("980x860")
+        self.minsize(840,750)
+        THEME.add(self, bg="bg")
+        self._jobs = CalcJobs(self, self._show_result, self._show_error)
+        self._live_score = LiveScorer()
+        self._build_ui()
+        self.after(2000, self._update_check)
+
+    def destroy(self):
+        self._jobs.shutdown()
+        super().destroy()
+
+    # ── THEME TOGGLE ──────────────────────────────────────────────────────────
+    def _toggle_theme(self):
+        self._dark = not self._dark
+        THEME.apply("dark" if self._dark else "light")
+
+    def _on_theme(self):
+        self.toggle_btn.configure(text=("☀️  Light Mode" if self._dark else "🌙  Dark Mode"))
+        self._draw_gauge(self._last_pct, self._last_side)
+
+    # ── BUILD ─────────────────────────────────────────────────────────────────
+    def _build_ui(self):
+        self._last_pct  = 0.0
+        self._last_side = "—"
+        self._topbar()
+        self._selector()
+        self._results()
+        self._footer()
+        THEME.on_apply(self._on_theme)
+
+    # ── TOP BAR ───────────────────────────────────────────────────────────────
+    def _topbar(self):
+        bar = THEME.add(tk.Frame(self, height=58), bg="topbar_bg")
+        bar.pack(fill="x"); bar.pack_propagate(False)
+
+        THEME.add(tk.Label(bar, text="⚡  Bottleneck Calculator",
+                           font=("Segoe UI",17,"bold")),
+                  fg="topbar_fg", bg="topbar_bg").pack(side="left", padx=20, pady=12)
+
+        # Dark/light toggle button
+        self.toggle_btn = THEME.add(tk.Button(bar, text="🌙  Dark Mode",
+                                              font=("Segoe UI",9,"bold"),
+                                              relief="flat", cursor="hand2",
+                                              bd=0, padx=12, pady=6,
+                                              command=self._toggle_theme),
+                                    bg="toggle_bg", fg="toggle_fg",
+                                    activebackground="primary_light")
+        self.toggle_btn.pack(side="right", padx=12, pady=12)
+
+        THEME.add(tk.Label(bar, text=f"v{CURRENT_VER}", font=("Segoe UI",9)),
+                  fg="topbar_sub", bg="topbar_bg").pack(side="right", padx=0, pady=20)
+
+    # ── SELECTOR ──────────────────────────────────────────────────────────────
+    def _selector(self):
+        outer = THEME.add(tk.Frame(self, pady=10), bg="bg")
+        outer.pack(fill="x", padx=18)
+        card = self._card(outer); card.pack(fill="x")
+
+        THEME.add(tk.Label(card, text="🔧  Select Your Components",
+                           font=("Segoe UI",11,"bold")),
+                  fg="primary", bg="card").pack(anchor="w", padx=18, pady=(12,4))
+
+        grid = THEME.add(tk.Frame(card), bg="card"); grid.pack(fill="x", padx=18, pady=(0,6))
+        for i in range(3): grid.columnconfigure(i, weight=1)
+
+        cpu_names = REGISTRY.names("cpu")
+        mb_names  = REGISTRY.names("board")
+        gpu_names = REGISTRY.names("gpu")
+
+        for col, text in enumerate(("🖥️  CPU", "🔌  Motherboard Chipset", "🎮  GPU")):
+            THEME.add(tk.Label(grid, text=text, font=("Segoe UI",9,"bold")),
+                      fg="secondary_text", bg="card").grid(row=0,column=col,sticky="w",padx=6,pady=(6,2))
+
+        self.cpu_cb = SearchCombo(grid, cpu_names, command=self._on_part)
+        self.cpu_cb.grid(row=1, column=0, sticky="ew", padx=6)
+        self.mb_cb  = SearchCombo(grid, mb_names, command=self._on_part)
+        self.mb_cb.grid(row=1, column=1, sticky="ew", padx=6)
+        self.gpu_cb = SearchCombo(grid, gpu_names, command=self._on_part)
+        self.gpu_cb.grid(row=1, column=2, sticky="ew", padx=6)
+
+        # Stats bar
+        info = THEME.add(tk.Frame(card), bg="primary_light"); info.pack(fill="x")
+        THEME.add(tk.Label(info,
+                           text=f"  {len(cpu_names)} CPUs  •  {len(gpu_names)} GPUs (incl. LP models)  •  {len(mb_names)} Chipsets  —  type to search",
+                           font=("Segoe UI",8)),
+                  fg="primary_dark", bg="primary_light").pack(side="left", pady=4, padx=6)
+
+        btn_row = THEME.add(tk.Frame(card), bg="card"); btn_row.pack(pady=10)
+        self.calc_btn = THEME.add(tk.Button(btn_row, text="  CALCULATE BOTTLENECK  ",
+                                            font=("Segoe UI",11,"bold"),
+                                            fg="white",
+                                            activebackground="#BF360C",
+                                            relief="flat", cursor="hand2",
+                                            bd=0, padx=28, pady=10,
+                                            command=self._calculate),
+                                  bg="accent")
+        self.calc_btn.pack(side="left")
+        self._hover(self.calc_btn, "accent", "#E65100")
+
+        self._live = tk.BooleanVar(value=False)
+        THEME.add(tk.Checkbutton(btn_row, text="Live update", variable=self._live,
+                                 command=self._on_part, font=("Segoe UI",9),
+                                 relief="flat", bd=0, cursor="hand2"),
+                  bg="card", fg="secondary_text", activebackground="card",
+                  activeforeground="primary", selectcolor="entry_bg").pack(side="left", padx=(14,0))
+
+    # ── RESULTS PANEL ─────────────────────────────────────────────────────────
+    def _results(self):
+        outer = THEME.add(tk.Frame(self), bg="bg")
+        outer.pack(fill="both", expand=True, padx=18, pady=(0,6))
+
+        top = THEME.add(tk.Frame(outer), bg="bg"); top.pack(fill="x")
+
+        # Gauge card
+        gc = self._card(top); gc.pack(side="left", fill="both", expand=True, pady=(0,6), padx=(0,5))
+        THEME.add(tk.Label(gc, text="Bottleneck Gauge", font=("Segoe UI",10,"bold")),
+                  fg="primary", bg="card").pack(anchor="w", padx=14, pady=(10,0))
+        self.gauge = THEME.add(tk.Canvas(gc, width=310, height=215, highlightthickness=0),
+                               bg="card")
+        self.gauge.pack(padx=10, pady=(0,10))
+        self._build_gauge()
+        self._draw_gauge(0,"—")
+
+        # Breakdown card
+        bc = self._card(top); bc.pack(side="left", fill="both", expand=True, pady=(0,6), padx=(5,0))
+        THEME.add(tk.Label(bc, text="Score Breakdown", font=("Segoe UI",10,"bold")),
+                  fg="primary", bg="card").pack(anchor="w", padx=14, pady=(10,2))
+        self.score_frame = THEME.add(tk.Frame(bc), bg="card")
+        self.score_frame.pack(fill="both", expand=True, padx=14, pady=(0,10))
+        self._bd_intro = THEME.add(tk.Label(self.score_frame,
+                                            text="Run a calculation to see results.\n\n"
+                                                 "Positive gap = CPU stronger = GPU bottleneck\n"
+                                                 "Negative gap = GPU stronger = CPU bottleneck",
+                                            font=("Segoe UI",9), justify="left"),
+                                   fg="secondary_text", bg="card")
+        self._bd_intro.pack(anchor="nw", pady=8)
+        self._bd_note = THEME.add(tk.Label(self.score_frame, font=("Segoe UI",8,"italic"),
+                                           wraplength=230, justify="left"),
+                                  fg="primary", bg="card")
+        self._bd_rows = {}          # breakdown key → (row frame, value label, rule)
+        self._bd_keys = None        # keys currently packed, in order
+        self._bd_text = {}          # breakdown key → text shown
+        self._sug     = None        # suggestions shown
+
+        # Suggestions card
+        sc = self._card(outer); sc.pack(fill="both", expand=True)
+        hdr = THEME.add(tk.Frame(sc), bg="primary_light"); hdr.pack(fill="x")
+        THEME.add(tk.Label(hdr, text="💡  Suggestions & Recommendations",
+                           font=("Segoe UI",10,"bold")),
+                  fg="primary_dark", bg="primary_light").pack(anchor="w", padx=14, pady=7)
+        tf = THEME.add(tk.Frame(sc), bg="card"); tf.pack(fill="both", expand=True)
+        self.sug_text = THEME.add(tk.Text(tf, font=("Segoe UI",10),
+                                          relief="flat", bd=0,
+                                          state="disabled", wrap="word",
+                                          height=8, padx=14, pady=10),
+                                  fg="on_surface", bg="card")
+        self.sug_text.pack(side="left", fill="both", expand=True)
+        sb = ttk.Scrollbar(tf, command=self.sug_text.yview)
+        self.sug_text.configure(yscrollcommand=sb.set); sb.pack(side="right", fill="y")
+        self._set_suggestions(["Type in any box to search, then click CALCULATE."])
+
+    def _footer(self):
+        THEME.add(tk.Frame(self, height=1), bg="divider").pack(fill="x")
+        foot = THEME.add(tk.Frame(self), bg="bg"); foot.pack(fill="x", padx=18, pady=5)
+        self.update_lbl = THEME.add(tk.Label(foot, text="Checking for updates…",
+                                             font=("Segoe UI",9)),
+                                    fg="secondary_text", bg="bg")
+        self.update_lbl.pack(side="left")
+        THEME.add(tk.Label(foot, text="Scores based on published benchmarks. For reference only.",
+                           font=("Segoe UI",8)),
+                  fg="divider", bg="bg").pack(side="right")
+
+    # ── GAUGE ─────────────────────────────────────────────────────────────────
+    # Items are created once by _build_gauge and updated in place; a new
+    # result can sweep the needle there over GAUGE_ANIM_MS, one frame every
+    # GAUGE_FRAME_MS, with progress taken from the clock so a slow frame
+    # shortens the animation instead of stretching it.
+    GAUGE_ANIMATE  = True
+    GAUGE_ANIM_MS  = 300
+    GAUGE_FRAME_MS = 16
+
+    def _build_gauge(self):
+        c = self.gauge
+        cx, cy, r = 155, 150, 112
+        box = (cx-r, cy-r, cx+r, cy+r)
+        self._g = {
+            "track": c.create_arc(*box, start=0, extent=180, style="arc", width=20),
+            "value": c.create_arc(*box, start=180, extent=-1, style="arc", width=20,
+                                  state="hidden"),
+            "pct":   c.create_text(cx, cy-24, font=("Segoe UI",30,"bold")),
+            "title": c.create_text(cx, cy+10, text="Bottleneck", font=("Segoe UI",10)),
+            "side":  c.create_text(cx, cy+35, font=("Segoe UI",12,"bold")),
+            "min":   c.create_text(cx-r-8, cy+8, text="0%",   font=("Segoe UI",8), anchor="e"),
+            "max":   c.create_text(cx+r+8, cy+8, text="100%", font=("Segoe UI",8), anchor="w"),
+        }
+        self._gauge_shown = 0.0        # pct currently drawn (mid-animation too)
+        self._gauge_anim  = None       # after() id of the next animation frame
+
+    def _draw_gauge(self, pct, side):
+        """Show `pct` / `side` immediately (also re-applies theme colours)."""
+        self._last_pct  = pct
+        self._last_side = side
+        if self._gauge_anim:
+            self.after_cancel(self._gauge_anim)
+            self._gauge_anim = None
+        self._paint_gauge(pct, side)
+
+    def _paint_gauge(self, pct, side):
+        t0 = time.perf_counter()
+        c, g = self.gauge, self._g
+        self._gauge_shown = pct
+
+        if side == "Balanced" or pct < 8:   color = T["success"]
+        elif pct < 20:  color = "#8BC34A"
+        elif pct < 35:  color = "#FBC02D"
+        elif pct < 50:  color = T["warning"]
+        else:           color = T["error"]
+
+        extent = int(pct/100*180)
+        c.itemconfigure(g["track"], outline=T["gauge_track"])
+        if extent > 0:
+            c.itemconfigure(g["value"], extent=-extent, outline=color, state="normal")
+        else:
+            c.itemconfigure(g["value"], state="hidden")
+        c.itemconfigure(g["pct"], text=f"{pct:.1f}%" if pct > 0 else "—", fill=color)
+        sc = {"CPU":T["warning"],"GPU":T["primary"],"Balanced":T["success"]}.get(side,T["secondary_text"])
+        c.itemconfigure(g["side"], text=(f"Side: {side}" if side not in("—","") else ""), fill=sc)
+        for k in ("title", "min", "max"):
+            c.itemconfigure(g[k], fill=T["secondary_text"])
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("gauge %.1f%%: %.3f ms", pct, (time.perf_counter() - t0) * 1e3)
+
+    def _animate_gauge(self, pct, side):
+        """Sweep from what is shown now to `pct` (ease-out), then settle exactly."""
+        if not self.GAUGE_ANIMATE:
+            return self._draw_gauge(pct, side)
+        start, t0 = self._gauge_shown, time.perf_counter()
+        self._draw_gauge(start, side)            # cancels a sweep in progress
+        self._last_pct = pct
+
+        def frame():
+            k = min(1.0, (time.perf_counter() - t0) * 1000 / self.GAUGE_ANIM_MS)
+            if k >= 1.0:
+                self._gauge_anim = None
+                self._paint_gauge(pct, side)
+                return
+            self._paint_gauge(start + (pct - start) * (1 - (1 - k) ** 3), side)
+            self._gauge_anim = self.after(self.GAUGE_FRAME_MS, frame)
+        frame()
+
+    # ── BREAKDOWN ─────────────────────────────────────────────────────────────
+    # Breakdown key → (label, colour, format). The colour is a theme role, a
+    # fixed "#rrggbb", or a function of the value returning either. Rows are
+    # built the first time their key shows up and then only reconfigured;
+    # keys not listed here get a row with BREAKDOWN_DEFAULT styling.
+    BREAKDOWN_ROWS = {
+        "cpu_perf_score":  ("CPU Perf Score",  "primary", "{:.0f}"),
+        "gpu_perf_score":  ("GPU Perf Score",  "#9C27B0", "{:.0f}"),
+        "performance_gap": ("Performance Gap", lambda v: "success" if v > 0 else "error", "{:+.0f}"),
+        "thread_penalty":  ("Thread Penalty",  "warning", "{:.1f}"),
+        "pcie_penalty":    ("PCIe Penalty",    "warning", "{:.1f}"),
+    }
+    BREAKDOWN_DEFAULT = (None, "warning", "{:.1f}")
+
+    def _breakdown_style(self, key):
+        label, colour, fmt = self.BREAKDOWN_ROWS.get(key, self.BREAKDOWN_DEFAULT)
+        return label or key.replace("_", " ").title(), colour, fmt
+
+    def _breakdown_row(self, key):
+        row = THEME.add(tk.Frame(self.score_frame), bg="card")
+        THEME.add(tk.Label(row, text=self._breakdown_style(key)[0], font=("Segoe UI",9),
+                           anchor="w", width=18),
+                  fg="secondary_text", bg="card").pack(side="left")
+        value = THEME.add(tk.Label(row, font=("Segoe UI",9,"bold"), width=6, anchor="e"),
+                          bg="card")
+        value.pack(side="right")
+        rule = THEME.add(tk.Frame(self.score_frame, height=1), bg="divider")
+        return row, value, rule
+
+    def _set_breakdown(self, bd, side):
+        keys = list(bd)
+        if keys != self._bd_keys:               # first result, or new breakdown keys
+            if self._bd_intro is not None:
+                self._bd_intro.destroy()
+                self._bd_intro = None
+                self._bd_note.pack(anchor="w", pady=(6,0))
+            for row, _, rule in self._bd_rows.values():
+                row.pack_forget(); rule.pack_forget()
+            for k in keys:
+                if k not in self._bd_rows:
+                    self._bd_rows[k] = self._breakdown_row(k)
+                row, _, rule = self._bd_rows[k]
+                row.pack(fill="x", pady=2, before=self._bd_note)
+                rule.pack(fill="x", before=self._bd_note)
+            self._bd_keys = keys
+
+        for k, v in bd.items():
+            _, colour, fmt = self._breakdown_style(k)
+            if callable(colour):
+                colour = colour(v)
+            value, text = self._bd_rows[k][1], fmt.format(v)
+            if self._bd_text.get(k) != text:
+                self._bd_text[k] = text
+                value.configure(text=text)
+            if colour in T:
+                THEME.add(value, fg=colour)
+            else:
+                value.configure(fg=colour)
+
+        note = {"GPU":"▲ CPU>GPU score → GPU bottleneck",
+                "CPU":"▼ GPU>CPU score → CPU bottleneck",
+                "Balanced":"≈ Balanced (gap ≤8 pts)"}.get(side,"")
+        self._bd_note.configure(text=note)
+
+    # ── SUGGESTIONS ───────────────────────────────────────────────────────────
+    def _set_suggestions(self, items):
+        items = tuple(items)
+        if items == self._sug:
+            return
+        self._sug = items
+        self.sug_text.configure(state="normal")
+        self.sug_text.delete("1.0","end")
+        for s in items:
+            self.sug_text.insert("end", s+"\n\n")
+        self.sug_text.configure(state="disabled")
+
+    # ── CALCULATE ─────────────────────────────────────────────────────────────
+    def _calculate(self):
+        # Names are read here, on Tk's thread; lookups and scoring run on the
+        # worker, and _show_result gets the newest result back via _jobs.
+        self._jobs.submit(self._score, self.cpu_cb.get(), self.gpu_cb.get(), self.mb_cb.get())
+
+    @staticmethod
+    def _score(cpu_n, gpu_n, mb_n):
+        """
+        Worker side of _calculate: resolve the names, misspelt ones to their
+        nearest part (REGISTRY.resolve), and score. No widgets.
+        """
+        hits = (REGISTRY.resolve("cpu", cpu_n), REGISTRY.resolve("gpu", gpu_n),
+                REGISTRY.resolve("board", mb_n))
+        if not all(hits):
+            return None
+        cpu, gpu, mb = (h.part for h in hits)
+        return cpu, gpu, mb, cached_bottleneck(cpu, gpu, mb)
+
+    def _show_result(self, res):
+        if res is None:
+            messagebox.showerror("Not Found",
+                "One or more components not found.\nPlease select from the dropdown suggestions.")
+            return
+
+        cpu, gpu, mb, r = res
+        # Show what a typed name was resolved to.
+        for cb, part in ((self.cpu_cb, cpu), (self.gpu_cb, gpu), (self.mb_cb, mb)):
+            if cb.get() != part.name:
+                cb.set(part.name, quiet=True)
+        self._show_score(r)
+
+        if not r.compatible:
+            messagebox.showwarning("Socket Mismatch",
+                f"⚠️  {cpu.name}  ({cpu.socket})\n"
+                f"    is NOT compatible with\n"
+                f"    {mb.name}  ({mb.socket})\n\n"
+                "The CPU won't physically fit this motherboard!")
+
+    def _show_score(self, r):
+        """Update the results panel; only what changed from the last result is redrawn."""
+        if (r.bottleneck_pct, r.side) != (self._last_pct, self._last_side):
+            self._animate_gauge(r.bottleneck_pct, r.side)
+        self._set_breakdown(r.breakdown, r.side)
+        self._set_suggestions(r.suggestions)
+
+    # ── LIVE MODE ─────────────────────────────────────────────────────────────
+    def _on_part(self, *_):
+        """A combo changed, or live mode was switched on: rescore on the spot."""
+        if not self._live.get():
+            return
+        t0  = time.perf_counter()
+        cpu = REGISTRY.cpu(self.cpu_cb.get())
+        gpu = REGISTRY.gpu(self.gpu_cb.get())
+        mb  = REGISTRY.board(self.mb_cb.get())
+        if not (cpu and gpu and mb):
+            return                      # mid-edit; keep showing the last result
+        self._jobs.cancel()             # an older CALCULATE must not overwrite this
+        # Inline rather than through _jobs: LiveScorer only recomputes the
+        # terms the changed part feeds, so this fits in a frame, and dialogs
+        # are left out (the suggestions already flag a socket mismatch).
+        self._show_score(self._live_score(cpu, gpu, mb))
+        if log.isEnabledFor(logging.DEBUG):
+            self.update_idletasks()
+            log.debug("live update: %.2f ms", (time.perf_counter() - t0) * 1e3)
+
+    def _show_error(self, exc):
+        log.error("calculation failed", exc_info=exc)
+        messagebox.showerror("Calculation Failed", f"{type(exc).__name__}: {exc}")
+
+    # ── UPDATE ────────────────────────────────────────────────────────────────
+    def _update_check(self):
+        self._poll_update(check_update_async())
+
+    def _poll_update(self, fut):
+        # The check runs on a worker thread; widgets are only touched here, on Tk's.
+        if not fut.done():
+            self.after(100, self._poll_update, fut)
+            return
+        tag, url = fut.result()
+        if tag:
+            label = f"🔔  Release [{tag}] available — click to download"
+            THEME.add(self.update_lbl, fg="accent").configure(text=label, cursor="hand2")
+            self.update_lbl.bind("<Button-1>", lambda e: webbrowser.open(url or DOWNLOAD_PAGE))
+        else:
+            THEME.add(self.update_lbl, fg="success").configure(
+                text=f"✔  Up to date  •  {GITHUB_REPO}")
+
+    # ── HELPERS ───────────────────────────────────────────────────────────────
+    def _card(self, parent):
+        return THEME.add(tk.Frame(parent, highlightthickness=1),
+                         bg="card", highlightbackground="shadow")
+
+    def _hover(self, w, role, h):
+        w.bind("<Enter>", lambda e: w.configure(bg=h))
+        w.bind("<Leave>", lambda e: w.configure(bg=T[role]))
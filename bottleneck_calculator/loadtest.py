@@ -0,0 +1,156 @@
+"""
+Load-test harness for the HTTP service — `python -m bottleneck_calculator loadtest`.
+
+Opens `--concurrency` keep-alive connections and has each send requests
+back to back until `--requests` have completed, then reports requests/s
+and p50/p90/p99/max latency. Builds are random (seeded) CPU/GPU/board
+triples from the registry, so the server's LRU sees a realistic mix.
+With `--bulk N` every request is a POST /bulk of N builds instead of a
+GET /score.
+
+Without `--url` a `serve` process is started on a free port for the run,
+so one command measures the whole thing on one box:
+
+    python -m bottleneck_calculator loadtest -c 64 -n 20000
+    python -m bottleneck_calculator loadtest --bulk 2000 -n 200
+    python -m bottleneck_calculator loadtest --url http://10.0.0.5:8080
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from urllib.parse import urlencode, urlsplit
+
+from .engine import REGISTRY
+
+
+# ─────────────────────────── CLIENT ──────────────────────────────────────────
+async def _read_response(reader):
+    """Read one HTTP/1.1 response; returns (status, body bytes)."""
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode("latin-1").split("\r\n")
+    status = int(lines[0].split(" ", 2)[1])
+    headers = {k.strip().lower(): v.strip()
+               for k, _, v in (l.partition(":") for l in lines[1:] if l)}
+    if "chunked" in headers.get("transfer-encoding", ""):
+        parts = []
+        while True:
+            size = int((await reader.readuntil(b"\r\n")).split(b";")[0], 16)
+            data = await reader.readexactly(size + 2)
+            if size == 0:
+                break
+            parts.append(data[:-2])
+        return status, b"".join(parts)
+    return status, await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+def _requests(host, n, bulk, seed):
+    """Pre-encode `n` raw requests (cycled if fewer are needed)."""
+    rnd = random.Random(seed)
+    pick = lambda: (rnd.choice(REGISTRY.cpus).name, rnd.choice(REGISTRY.gpus).name,
+                    rnd.choice(REGISTRY.mbs).name)
+    out = []
+    for _ in range(min(n, 1000)):
+        if bulk:
+            body = json.dumps([pick() for _ in range(bulk)]).encode("utf-8")
+            out.append(f"POST /bulk HTTP/1.1\r\nHost: {host}\r\n"
+                       f"Content-Type: application/json\r\n"
+                       f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+        else:
+            cpu, gpu, mb = pick()
+            q = urlencode({"cpu": cpu, "gpu": gpu, "board": mb})
+            out.append(f"GET /score?{q} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    return out
+
+
+async def _run(host, port, reqs, total, concurrency):
+    latencies, errors = [], 0
+    remaining = total
+
+    async def client(k):
+        nonlocal remaining, errors
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            i = k
+            while remaining > 0:
+                remaining -= 1
+                t0 = time.perf_counter()
+                writer.write(reqs[i % len(reqs)])
+                status, _ = await _read_response(reader)
+                latencies.append(time.perf_counter() - t0)
+                errors += status != 200
+                i += concurrency
+        finally:
+            writer.close()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(client(k) for k in range(concurrency)))
+    return latencies, errors, time.perf_counter() - t0
+
+
+def _pct(sorted_vals, p):
+    return sorted_vals[min(len(sorted_vals) - 1, int(p / 100 * len(sorted_vals)))]
+
+
+# ─────────────────────────── SERVER PROCESS ──────────────────────────────────
+def _spawn_server(cache_size):
+    proc = subprocess.Popen([sys.executable, "-m", "bottleneck_calculator", "serve",
+                             "--port", "0", "--cache-size", str(cache_size)],
+                            stderr=subprocess.PIPE, text=True,
+                            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    line = proc.stderr.readline()
+    if "listening on" not in line:
+        proc.kill()
+        raise RuntimeError(f"server failed to start: {line.strip() or proc.stderr.read()}")
+    return proc, urlsplit(line.split()[-1])
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="python -m bottleneck_calculator loadtest",
+                                 description="Measure latency and throughput of the HTTP service.")
+    ap.add_argument("--url", help="service to test (default: start one locally)")
+    ap.add_argument("-c", "--concurrency", type=int, default=32,
+                    help="concurrent keep-alive connections (default: 32)")
+    ap.add_argument("-n", "--requests", type=int, default=10000,
+                    help="total requests (default: 10000)")
+    ap.add_argument("--bulk", type=int, default=0, metavar="N",
+                    help="POST /bulk with N builds per request instead of GET /score")
+    ap.add_argument("--warmup", type=int, default=500,
+                    help="requests sent before measuring (default: 500)")
+    ap.add_argument("--cache-size", type=int, default=65536,
+                    help="cache size for a locally started server (default: 65536)")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args(argv)
+
+    proc = None
+    if args.url:
+        url = urlsplit(args.url if "//" in args.url else "http://" + args.url)
+    else:
+        proc, url = _spawn_server(args.cache_size)
+    host, port = url.hostname, url.port or 80
+    try:
+        reqs = _requests(f"{host}:{port}", args.requests, args.bulk, args.seed)
+        if args.warmup:
+            asyncio.run(_run(host, port, reqs, args.warmup, args.concurrency))
+        lat, errors, dt = asyncio.run(_run(host, port, reqs, args.requests, args.concurrency))
+    finally:
+        if proc:
+            proc.terminate()
+            proc.wait()
+
+    lat.sort()
+    ms = lambda s: f"{s * 1000:.2f} ms"
+    kind = f"POST /bulk x{args.bulk}" if args.bulk else "GET /score"
+    print(f"{kind}  •  {len(lat):,} requests over {args.concurrency} connections "
+          f"in {dt:.2f}s  ({errors:,} errors)")
+    print(f"  throughput : {len(lat) / dt:,.0f} req/s"
+          + (f"  ({len(lat) * args.bulk / dt:,.0f} builds/s)" if args.bulk else ""))
+    print(f"  latency    : p50 {ms(_pct(lat, 50))}   p90 {ms(_pct(lat, 90))}   "
+          f"p99 {ms(_pct(lat, 99))}   max {ms(lat[-1])}")
+    return 1 if errors else 0
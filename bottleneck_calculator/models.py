@@ -0,0 +1,29 @@
+"""
+Component data models. Slotted and frozen: no per-instance __dict__, and
+instances are hashable by value, so they can key caches directly.
+
+`price` is the street price in the catalog's currency; 0 means unpriced
+(the built-in lists carry none; see `db export --prices`).
+"""
+
+from dataclasses import dataclass
+
+# ─────────────────────────── DATA MODELS ─────────────────────────────────────
+@dataclass(frozen=True, slots=True)
+class CPU:
+    name: str; cores: int; threads: int
+    base_ghz: float; boost_ghz: float; tdp: int
+    perf_score: int; socket: str; generation: str
+    price: float = 0.0
+
+@dataclass(frozen=True, slots=True)
+class GPU:
+    name: str; vram_gb: int; tdp: int
+    perf_score: int; vendor: str; low_profile: bool = False
+    price: float = 0.0
+
+@dataclass(frozen=True, slots=True)
+class Motherboard:
+    name: str; socket: str; chipset: str
+    max_ram_gb: int; pcie_gen: int
+    price: float = 0.0
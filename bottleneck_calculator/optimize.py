@@ -0,0 +1,184 @@
+"""
+Budget optimizer: the best compatible builds that fit a price limit.
+
+best_builds(budget, k) returns the top `k` CPU + board + GPU builds whose
+parts share a socket and whose total price is within `budget`, ranked by
+
+    "balance"   lowest bottleneck_pct, then highest combined perf_score
+    "perf"      highest combined perf_score (CPU + GPU), then lowest bottleneck_pct
+
+with ties going to the cheaper build and then catalog order. The answer
+is exactly what scoring and sorting every affordable build would give.
+Only priced parts (price > 0) take part.
+
+The search is branch and bound. perf_score is a small integer scale, so
+the GPUs are bucketed by score with each bucket sorted by price, and the
+cheapest GPU per score is a table lookup. Each CPU (and each board for
+it) gets an optimistic key: the smallest CPU-GPU gap any still-affordable
+GPU reaches, the most perf any of them adds, and the cheapest price.
+CPUs are visited best bound first, boards cheapest first, and GPU buckets
+nearest the CPU's score first (strongest first for "perf"). As soon as a
+bound can't beat the current k-th best build, that CPU, board or bucket
+is skipped, along with everything ordered after it.
+"""
+
+from bisect import bisect_right, insort
+from collections import namedtuple
+from itertools import accumulate
+
+from .engine import BALANCED_GAP, per_registry, score_build
+
+OBJECTIVES = ("balance", "perf")
+
+Build = namedtuple("Build", "price perf score")    # score: the BottleneckScore
+
+def _pct_floor(gap):
+    """Lowest bottleneck_pct any build with this |CPU - GPU| gap can score."""
+    pct = min(gap * 0.55, 68.0)
+    return round(min(pct, 7.0) if gap <= BALANCED_GAP else pct, 1)
+
+
+class BuildOptimizer:
+    """Price-sorted indexes over one catalog, built once; best() runs a search."""
+    def __init__(self, cpus, gpus, mbs):
+        self._boards = {}                           # socket → [(price, index, board)]
+        for i, m in enumerate(mbs):
+            if m.price > 0:
+                self._boards.setdefault(m.socket, []).append((m.price, i, m))
+        for b in self._boards.values():
+            b.sort(key=lambda e: e[:2])
+        self._cpus = [(i, c) for i, c in enumerate(cpus)
+                      if c.price > 0 and c.socket in self._boards]
+
+        buckets = {}                                # perf_score → [(price, index, gpu)]
+        for i, g in enumerate(gpus):
+            if g.price > 0:
+                buckets.setdefault(g.perf_score, []).append((g.price, i, g))
+        for b in buckets.values():
+            b.sort(key=lambda e: e[:2])
+        self._buckets  = buckets
+        self._scores   = sorted(buckets)
+        self._cheapest = {s: b[0][0] for s, b in buckets.items()}
+        by_price = sorted((g.price, g.perf_score) for b in buckets.values() for _, _, g in b)
+        self._prices   = [p for p, _ in by_price]
+        self._max_perf = list(accumulate((s for _, s in by_price), max))
+        self.evaluated = 0                          # exact scores computed by the last best()
+
+    # ── bounds ────────────────────────────────────────────────────────────────
+    def _outwards(self, t):
+        """GPU scores by distance from `t`, lazily (searches rarely go far)."""
+        s = self._scores
+        hi = bisect_right(s, t)
+        lo = hi - 1
+        while lo >= 0 or hi < len(s):
+            if hi >= len(s) or (lo >= 0 and t - s[lo] <= s[hi] - t):
+                yield s[lo]; lo -= 1
+            else:
+                yield s[hi]; hi += 1
+
+    def _order(self, cpu, objective):
+        """GPU scores in visiting order: nearest the CPU first, or strongest first."""
+        if objective == "perf":
+            return reversed(self._scores)
+        return self._outwards(cpu.perf_score)
+
+    def _nearest_gap(self, t, base, budget):
+        """Smallest |t - score| over GPU scores with a GPU that fits the budget."""
+        for s in self._outwards(t):
+            if base + self._cheapest[s] <= budget:
+                return abs(t - s)
+        return None
+
+    def _bound(self, cpu, base, budget, objective):
+        """Optimistic key for any build of `cpu` whose CPU + board cost `base`."""
+        rest = budget - base
+        # A hair of slack: budget - base can round below what base + price <= budget allows.
+        n = bisect_right(self._prices, rest + 1e-9 * max(1.0, abs(budget)))
+        if not n:
+            return None
+        perf = cpu.perf_score + self._max_perf[n - 1]
+        gap  = self._nearest_gap(cpu.perf_score, base, budget)
+        if gap is None:
+            return None
+        floor = base + self._prices[0]
+        if objective == "perf":
+            return (-perf, _pct_floor(gap), floor)
+        return (_pct_floor(gap), -perf, floor)
+
+    # ── search ────────────────────────────────────────────────────────────────
+    def best(self, budget, k=10, objective="balance"):
+        """The top `k` builds within `budget` as Build tuples, best first."""
+        if objective not in OBJECTIVES:
+            raise ValueError(f"objective must be one of {OBJECTIVES}, not {objective!r}")
+        self.evaluated = 0
+        top = []                # sorted keys of the best builds so far, at most k
+        if k <= 0 or not self._prices:
+            return []
+        plans = []
+        for ci, c in self._cpus:
+            b = self._bound(c, c.price + self._boards[c.socket][0][0], budget, objective)
+            if b is not None:
+                plans.append((b, ci, c))
+        plans.sort(key=lambda p: p[:2])
+
+        for bound, ci, c in plans:
+            if len(top) == k and bound > top[-1]:
+                break                               # plans are in bound order
+            for mprice, mi, mb in self._boards[c.socket]:
+                base = c.price + mprice
+                b = self._bound(c, base, budget, objective)
+                if b is None or (len(top) == k and b > top[-1]):
+                    break                           # pricier boards only bound worse
+                self._scan(c, ci, mb, mi, base, budget, objective, top, k)
+
+        out = []
+        for key in top:                             # key[2] is the price, key[-1] the parts
+            score = score_build(*key[-1])
+            out.append(Build(key[2], score.cpu.perf_score + score.gpu.perf_score, score))
+        return out
+
+    def _scan(self, cpu, ci, mb, mi, base, budget, objective, top, k):
+        for s in self._order(cpu, objective):
+            if base + self._cheapest[s] > budget:
+                continue
+            gap, perf = abs(cpu.perf_score - s), cpu.perf_score + s
+            floor = _pct_floor(gap)
+            if len(top) == k:
+                worst = top[-1]
+                if objective == "perf":
+                    if -perf > worst[0]:
+                        break                       # every later bucket is weaker
+                    if (-perf, floor, base + self._cheapest[s]) > worst:
+                        continue
+                else:
+                    if floor > worst[0]:
+                        break                       # every later bucket is further away
+                    if (floor, -perf, base + self._cheapest[s]) > worst:
+                        continue
+            bucket = self._buckets[s]
+            # Within a bucket bottleneck_pct is the same for every GPU: the
+            # engine only reads the GPU's perf_score.
+            pct = score_build(cpu, bucket[0][2], mb).bottleneck_pct
+            self.evaluated += 1
+            for gprice, gi, g in bucket:
+                price = base + gprice
+                if price > budget:
+                    break
+                key = ((-perf, pct) if objective == "perf" else (pct, -perf)) + \
+                      (price, ci, gi, mi, (cpu, g, mb))
+                if len(top) == k:
+                    if key > top[-1]:
+                        break                       # the rest of the bucket costs more
+                    top.pop()
+                insort(top, key)
+
+
+# ─────────────────────────── API ─────────────────────────────────────────────
+@per_registry
+def optimizer(reg):
+    """The BuildOptimizer for a registry's current lists, rebuilt after a load."""
+    return BuildOptimizer(reg.cpus, reg.gpus, reg.mbs)
+
+def best_builds(budget, k=10, objective="balance", registry=None):
+    """Top `k` compatible builds costing at most `budget`; see the module docstring."""
+    return optimizer(registry).best(budget, k, objective)
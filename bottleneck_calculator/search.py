@@ -0,0 +1,178 @@
+"""
+Search index behind the SearchCombo dropdowns.
+
+Built once per list of names. Each name is lowercased and split into
+alphanumeric words ("NVIDIA RTX 4070 Ti 12GB" → "nvidia rtx 4070 ti 12gb"),
+and posting lists map every trigram, and every one- and two-character word
+prefix, to the names containing it. A query is split the same way and
+every word must match, in any order: words of three or more characters
+anywhere in the name, shorter ones at the start of a word (so "r" offers
+Ryzen and RTX parts, not every name containing an r). Candidates come
+from the rarest posting list among the query words and are then checked
+directly, so a keystroke touches only names that can match.
+
+Results are ranked: exact name, then names starting with the query, then
+the query as a contiguous phrase, then more words matched at a word start,
+then shorter names, then catalog order. They come back as a Matches
+sequence that ranks only as far as it is read, so a keystroke whose
+dropdown shows ten rows doesn't order (or even look up) the other
+thousands.
+"""
+
+import re
+from array import array
+from collections import defaultdict
+from collections.abc import Sequence
+from itertools import islice
+
+_WORD     = re.compile(r"[a-z0-9]+")
+_NON_WORD = re.compile(r"[^a-z0-9\n]+")
+
+
+def _words(text):
+    return _WORD.findall(text.lower())
+
+
+class Matches(Sequence):
+    """Search results; ranked lazily, the first time each position is read."""
+    def __init__(self, names, ranked, n):
+        self._names  = names            # id → name
+        self._ranked = ranked           # generator of ids, best first
+        self._ids    = []               # the ids ranked so far
+        self._n      = n
+
+    def __len__(self):
+        return self._n
+
+    def _upto(self, stop):
+        if stop > len(self._ids):
+            self._ids.extend(islice(self._ranked, stop - len(self._ids)))
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            start, stop, step = i.indices(self._n)
+            self._upto(max(start, stop) + 1)
+            return [self._names[j] for j in self._ids[start:stop:step]]
+        if i < 0:
+            i += self._n
+        if not 0 <= i < self._n:
+            raise IndexError("match index out of range")
+        self._upto(i + 1)
+        return self._names[self._ids[i]]
+
+    def __iter__(self):
+        self._upto(self._n)
+        return (self._names[i] for i in self._ids)
+
+
+class SearchIndex:
+    """Trigram / word-prefix index over a fixed list of names."""
+    def __init__(self, names):
+        self.names = list(names)
+        texts = [" " + " ".join(line.split()) for line in
+                 _NON_WORD.sub(" ", "\n".join(n.replace("\n", " ") for n in self.names).lower())
+                 .split("\n")]
+        # Internal ids are positions in "static" rank order — shorter names
+        # first, then catalog order — so posting lists, and any subset of
+        # one taken in order, come out already tie-broken for ranking.
+        order = sorted(range(len(texts)), key=list(map(len, texts)).__getitem__)
+        self._name = [self.names[i] for i in order]
+        self._text = [texts[i] for i in order]
+
+        # Words repeat heavily across a catalog ("nvidia", "rtx", "4070"), so
+        # grams are derived once per distinct word and each gram's posting
+        # list is the union of its words' lists.
+        word_ids = defaultdict(list)
+        first    = defaultdict(list)           # 1-/2-char prefix of the first word → ids
+        for i, text in enumerate(self._text):
+            words = text.split()
+            for w in set(words):
+                word_ids[w].append(i)
+            if words:
+                first[words[0][:1]].append(i)
+                if len(words[0]) > 1:
+                    first[words[0][:2]].append(i)
+        gram_words = defaultdict(list)
+        for w in word_ids:
+            for g in {" " + w[:1], " " + w[:2], *(w[j:j + 3] for j in range(len(w) - 2))}:
+                gram_words[g].append(w)
+        self._post = {g: array("I", word_ids[ws[0]] if len(ws) == 1 else
+                                    sorted(set().union(*map(word_ids.get, ws))))
+                      for g, ws in gram_words.items()}
+        self._first = {k: array("I", ids) for k, ids in first.items()}
+        self._last = ((), None)                 # (query words, matches) for narrowing
+
+    def __len__(self):
+        return len(self.names)
+
+    # ── matching ──────────────────────────────────────────────────────────────
+    @staticmethod
+    def _keys(word):
+        """The posting keys a query word needs; the rarest one bounds the candidates."""
+        if len(word) < 3:
+            return (" " + word,)
+        return tuple(word[j:j + 3] for j in range(len(word) - 2))
+
+    def _match(self, words):
+        keys  = [k for w in words for k in self._keys(w)]
+        lists = [self._post.get(k) for k in keys]
+        if any(p is None for p in lists):
+            return []
+        rarest = min(lists, key=len)
+        if len(keys) == 1:
+            return rarest                       # the posting list is the exact answer
+        # Typing usually extends the last query: narrow its matches instead,
+        # checking only the words that are new or longer. (Not when a short
+        # word grows past 2 chars, since "ti" only matches at a word start
+        # but "tit" matches anywhere.)
+        needle = lambda w: (" " + w) if len(w) < 3 else w
+        needles = {needle(w) for w in words}
+        prev_words, prev = self._last
+        if (prev is not None and len(words) >= len(prev_words)
+                and all(w.startswith(p) and (len(p) >= 3 or len(w) < 3)
+                        for w, p in zip(words, prev_words))
+                and len(prev) <= len(rarest)):
+            rarest   = prev
+            needles -= {needle(p) for p in prev_words}
+        text = self._text
+        ids  = rarest
+        for n in sorted(needles, key=len, reverse=True):
+            ids = [i for i in ids if n in text[i]]
+        return ids
+
+    # ── ranking ───────────────────────────────────────────────────────────────
+    def _rank(self, ids, words):
+        """
+        `ids` (in static order) best first, bucket by bucket, as a generator,
+        so the first rows cost a partial scan. Every bucket keeps static
+        order, so exact names lead the "starts with" bucket on their own.
+        A name that starts with the query matches it, so that bucket is
+        drawn from the names whose first word starts like the query.
+        """
+        phrase = " " + " ".join(words)
+        text   = self._text
+        yield from (i for i in self._first.get(words[0][:2], ())
+                    if text[i].startswith(phrase))
+        if len(words) == 1 and len(phrase) <= 3:        # matching already required " w"
+            yield from (i for i in ids if not text[i].startswith(phrase))
+            return
+        yield from (i for i in ids if phrase in text[i] and not text[i].startswith(phrase))
+        rest = [i for i in ids if phrase not in text[i]]
+        if len(rest) > 1:
+            starts = [" " + w for w in words]
+            rest.sort(key=lambda i: -sum(s in text[i] for s in starts))
+        yield from rest
+
+    def search(self, query, limit=None):
+        """
+        Names matching `query`, best first, as Matches (a list of at most
+        `limit` names if given); all names, in order, for a blank query.
+        """
+        words = _words(query)
+        if not words:
+            self._last = ((), None)
+            return self.names[:limit] if limit else list(self.names)
+        ids = self._match(words)
+        self._last = (words, ids)
+        found = Matches(self._name, self._rank(ids, words), len(ids))
+        return found[:limit] if limit else found
@@ -0,0 +1,388 @@
+"""
+HTTP scoring service — `python -m bottleneck_calculator serve`.
+
+A small asyncio HTTP/1.1 server (stdlib only, keep-alive) in front of the
+scoring engine. Every connection resolves names through the process-wide
+REGISTRY index and shares one cached_bottleneck LRU, so repeated builds
+cost a dict lookup. Results have the same fields as batch mode.
+
+    GET  /health
+    GET  /score?cpu=...&gpu=...&board=...[&suggestions=1][&fuzzy=1]
+    POST /score   {"cpu": ..., "gpu": ..., "board": ...}
+    POST /bulk    JSON array of {"cpu", "gpu", "board"} objects or
+                  [cpu, gpu, board] triples, or JSONL; `?suggestions=1`, `?fuzzy=1`
+    GET  /resolve?cpu=...|gpu=...|board=...[&k=3]
+                  nearest parts to a messy name, with confidences (see fuzzy.py)
+    GET  /partners?cpu=...               GPUs that balance a CPU
+    GET  /partners?gpu=...&board=...     CPUs for that board that balance a GPU
+                  [&within=8][&offset=0][&limit=50]
+    GET  /builds?budget=...[&k=10][&objective=balance|perf]
+                  best priced builds within a budget (see optimize.py)
+    GET  /frontier?min_score=...[&socket=...][&max_pct=...]
+                  cheapest non-dominated build at or above a combined
+                  perf_score, from a Pareto table (see frontier.py)
+    GET  /upgrade?cpu=...&gpu=...&board=...&budget=...[&steps=3]
+                  swaps, each within budget, that cut bottleneck_pct fastest
+                  (see upgrade.py)
+
+/partners is a range scan of the registry's perf_score indexes (see
+balanced_gpus / balanced_cpus), paged with offset and limit.
+
+/bulk streams its response with chunked transfer encoding — a JSON array,
+or one JSON object per line when the request asks for
+`Accept: application/x-ndjson` — and yields to the event loop between
+chunks, so a bulk request of thousands of rows doesn't stall
+single-build requests on other connections.
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+from urllib.parse import parse_qs, urlsplit
+
+from .batch import score_row
+from .engine import BALANCED_GAP, REGISTRY, balanced_cpus, balanced_gpus, cached_bottleneck
+
+MAX_HEADER = 16 * 1024
+BULK_CHUNK = 500          # rows encoded per response chunk
+PARTNER_LIMIT = 50        # default /partners page size
+PARTNER_MAX   = 1000      # largest page /partners will return
+BUILDS_MAX    = 100       # most builds /builds will return
+UPGRADE_STEPS = 5         # most steps /upgrade will plan
+RESOLVE_MAX   = 20        # most matches /resolve will return
+
+_frontier_table = None    # ParetoTable from --frontier; else built from REGISTRY
+
+_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+            411: "Length Required", 413: "Payload Too Large", 431: "Request Header Fields Too Large"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+# ─────────────────────────── REQUESTS ────────────────────────────────────────
+async def _read_request(reader, max_body):
+    """Return (method, path, query, headers, body), or None on a clean EOF."""
+    try:
+        head = await reader.readuntil(b"\r\n\r\n")
+    except asyncio.IncompleteReadError as e:
+        if e.partial.strip():
+            raise HTTPError(400, "truncated request") from None
+        return None
+    except asyncio.LimitOverrunError:
+        raise HTTPError(431, "request header too large") from None
+    lines = head.decode("latin-1").split("\r\n")
+    try:
+        method, target, version = lines[0].split(" ")
+    except ValueError:
+        raise HTTPError(400, "malformed request line") from None
+    headers = {}
+    for line in lines[1:]:
+        if line:
+            k, _, v = line.partition(":")
+            headers[k.strip().lower()] = v.strip()
+    if version == "HTTP/1.0" and headers.get("connection", "").lower() != "keep-alive":
+        headers.setdefault("connection", "close")
+
+    body = b""
+    if "chunked" in headers.get("transfer-encoding", "").lower():
+        raise HTTPError(411, "chunked request bodies are not supported; send Content-Length")
+    length = int(headers.get("content-length") or 0)
+    if length > max_body:
+        raise HTTPError(413, f"body larger than {max_body} bytes")
+    if length:
+        body = await reader.readexactly(length)
+    url = urlsplit(target)
+    return method, url.path, parse_qs(url.query), headers, body
+
+
+def _flag(query, name):
+    return query.get(name, ["0"])[-1].lower() in ("1", "true", "yes")
+
+def _triple(d):
+    if isinstance(d, dict):
+        board = next((d[k] for k in ("board", "motherboard", "mb") if k in d), "")
+        return str(d.get("cpu", "")), str(d.get("gpu", "")), str(board)
+    if isinstance(d, (list, tuple)) and len(d) == 3:
+        return tuple(str(x) for x in d)
+    raise HTTPError(400, "each build must be an object or a [cpu, gpu, board] triple")
+
+def _int(query, name, default):
+    v = query.get(name, [""])[-1]
+    return int(v) if v else default
+
+def _budget(query, example):
+    try:
+        budget = float(query.get("budget", [""])[-1])
+    except ValueError:
+        raise HTTPError(400, f"budget is required, e.g. ?budget={example}") from None
+    if not math.isfinite(budget):
+        raise HTTPError(400, "budget must be a finite number")
+    return budget
+
+def _part(kind, query):
+    name = query.get(kind, [""])[-1]
+    part = REGISTRY.find(kind, name)
+    if part is None:
+        raise HTTPError(400, f"{kind} not found: {name!r}")
+    return part
+
+def _partners(query):
+    within = _int(query, "within", BALANCED_GAP)
+    offset = _int(query, "offset", 0)
+    limit  = min(_int(query, "limit", PARTNER_LIMIT), PARTNER_MAX)
+    if within < 0 or offset < 0 or limit < 0:
+        raise HTTPError(400, "within, offset and limit must be >= 0")
+    if "cpu" in query:
+        cpu  = _part("cpu", query)
+        page = balanced_gpus(cpu, within, offset, limit)
+        out  = {"cpu": cpu.name, "perf_score": cpu.perf_score}
+        key, score = "gpus", lambda g: cpu.perf_score - g.perf_score
+    elif "gpu" in query and "board" in query:
+        gpu, mb = _part("gpu", query), _part("board", query)
+        page = balanced_cpus(gpu, mb, within, offset, limit)
+        out  = {"gpu": gpu.name, "perf_score": gpu.perf_score,
+                "board": mb.name, "socket": mb.socket}
+        key, score = "cpus", lambda c: c.perf_score - gpu.perf_score
+    else:
+        raise HTTPError(400, "give ?cpu=..., or ?gpu=...&board=...")
+    out.update(within=within, total=page.total, offset=offset, limit=limit)
+    out[key] = [{"name": p.name, "perf_score": p.perf_score, "gap": score(p)}
+                for p in page.parts]
+    return out
+
+def _builds(query):
+    from .optimize import best_builds
+    budget = _budget(query, 1500)
+    k = _int(query, "k", 10)
+    if k < 1:
+        raise HTTPError(400, "k must be at least 1")
+    k = min(k, BUILDS_MAX)
+    objective = query.get("objective", ["balance"])[-1]
+    builds = best_builds(budget, k, objective)
+    return {"budget": budget, "k": k, "objective": objective,
+            "builds": [{"price": round(b.price, 2), "perf": b.perf,
+                        "bottleneck_pct": b.score.bottleneck_pct, "side": b.score.side,
+                        "cpu": b.score.cpu.name, "gpu": b.score.gpu.name,
+                        "board": b.score.mb.name} for b in builds]}
+
+def _resolve(query):
+    kind = next((k for k in ("cpu", "gpu", "board") if k in query), None)
+    if kind is None:
+        raise HTTPError(400, "give ?cpu=..., ?gpu=... or ?board=...")
+    name = query[kind][-1]
+    k = _int(query, "k", 3)
+    if k < 1:
+        raise HTTPError(400, "k must be at least 1")
+    k = min(k, RESOLVE_MAX)
+    hit = REGISTRY.find(kind, name)
+    found = [(hit, 1.0)] if hit is not None else []
+    if k > len(found):
+        found += [(m.part, m.confidence) for m in REGISTRY.matches(kind, name, k)
+                  if m.part is not hit][:k - len(found)]
+    return {"kind": kind, "name": name,
+            "matches": [{"name": p.name, "confidence": c} for p, c in found]}
+
+def _upgrade(query):
+    from .upgrade import upgrade_plan
+    cpu, gpu, mb = _part("cpu", query), _part("gpu", query), _part("board", query)
+    budget = _budget(query, 500)
+    steps = _int(query, "steps", 3)
+    if not 1 <= steps <= UPGRADE_STEPS:
+        raise HTTPError(400, f"steps must be 1 to {UPGRADE_STEPS}")
+    plan = upgrade_plan(cpu, gpu, mb, budget, steps)
+    return {"cpu": cpu.name, "gpu": gpu.name, "board": mb.name, "budget": budget,
+            "bottleneck_pct": plan.start.bottleneck_pct, "spend": round(plan.spend, 2),
+            "steps": [{"swap": [p.name for p in s.swap], "price": round(s.price, 2),
+                       "bottleneck_pct": s.score.bottleneck_pct, "side": s.score.side}
+                      for s in plan.steps]}
+
+def _frontier(query):
+    from .frontier import pareto_table
+    try:
+        max_pct = float(query["max_pct"][-1]) if "max_pct" in query else None
+    except ValueError:
+        raise HTTPError(400, "max_pct must be a number") from None
+    min_score = _int(query, "min_score", 0)
+    socket    = query.get("socket", [None])[-1]
+    table = pareto_table() if _frontier_table is None else _frontier_table
+    hit = table.cheapest(min_score, socket, max_pct)
+    out = {"min_score": min_score, "socket": socket, "max_pct": max_pct, "build": None}
+    if hit is not None:
+        out["build"] = {"price": round(hit.price, 2), "perf": hit.perf,
+                        "bottleneck_pct": hit.bottleneck_pct, "socket": hit.cpu.socket,
+                        "cpu": hit.cpu.name, "gpu": hit.gpu.name, "board": hit.board.name}
+    return out
+
+def _bulk_rows(body, headers):
+    text = body.decode("utf-8")
+    if "ndjson" in headers.get("content-type", "") or not text.lstrip().startswith("["):
+        rows = []
+        for n, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                d = json.loads(line)
+            except ValueError as e:
+                raise HTTPError(400, f"line {n}: invalid JSON: {e}") from None
+            if not isinstance(d, dict):
+                raise HTTPError(400, f"line {n}: each JSONL line must be an object")
+            rows.append(_triple(d))
+        return rows
+    try:
+        items = json.loads(text)
+    except ValueError as e:
+        raise HTTPError(400, f"invalid JSON: {e}") from None
+    return [_triple(d) for d in items]
+
+
+# ─────────────────────────── RESPONSES ───────────────────────────────────────
+def _head(status, ctype, keep_alive, length=None):
+    lines = [f"HTTP/1.1 {status} {_REASONS.get(status, '')}",
+             f"Content-Type: {ctype}",
+             "Connection: " + ("keep-alive" if keep_alive else "close")]
+    lines.append(f"Content-Length: {length}" if length is not None
+                 else "Transfer-Encoding: chunked")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1")
+
+def _send_json(writer, status, obj, keep_alive):
+    data = json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    writer.write(_head(status, "application/json", keep_alive, len(data)) + data)
+
+def _chunk(text):
+    data = text.encode("utf-8")
+    return b"%x\r\n%s\r\n" % (len(data), data)
+
+async def _stream_bulk(writer, rows, suggestions, ndjson, keep_alive, fuzzy=False):
+    ctype = "application/x-ndjson" if ndjson else "application/json"
+    writer.write(_head(200, ctype, keep_alive))
+    sep, first = ("\n", "") if ndjson else (",\n", "[")
+    for i in range(0, len(rows), BULK_CHUNK):
+        out = [json.dumps(score_row(c, g, m, suggestions, fuzzy), ensure_ascii=False)
+               for c, g, m in rows[i:i + BULK_CHUNK]]
+        text = (first if i == 0 else sep) + sep.join(out)
+        writer.write(_chunk(text))
+        await writer.drain()       # backpressure from slow readers
+        await asyncio.sleep(0)     # drain() doesn't yield unless paused; let others run
+    tail = ("\n" if rows else "") if ndjson else ("[]" if not rows else "]")
+    writer.write(_chunk(tail) + b"0\r\n\r\n")
+
+
+# ─────────────────────────── ROUTES ──────────────────────────────────────────
+async def _dispatch(writer, method, path, query, headers, body, keep_alive):
+    if path == "/health":
+        ci = cached_bottleneck.info()
+        _send_json(writer, 200, {"status": "ok", "dataset": REGISTRY.source or "built-in",
+                                 "cache": ci._asdict()}, keep_alive)
+    elif path == "/score":
+        if method == "GET":
+            cpu_n, gpu_n, mb_n = (query.get(k, [""])[-1] for k in ("cpu", "gpu", "board"))
+        elif method == "POST":
+            try:
+                cpu_n, gpu_n, mb_n = _triple(json.loads(body or b"{}"))
+            except ValueError as e:
+                raise HTTPError(400, f"invalid JSON: {e}") from None
+        else:
+            raise HTTPError(405, "use GET or POST")
+        _send_json(writer, 200, score_row(cpu_n, gpu_n, mb_n, _flag(query, "suggestions"),
+                                          _flag(query, "fuzzy")), keep_alive)
+    elif path == "/partners":
+        if method != "GET":
+            raise HTTPError(405, "use GET")
+        _send_json(writer, 200, _partners(query), keep_alive)
+    elif path == "/builds":
+        if method != "GET":
+            raise HTTPError(405, "use GET")
+        _send_json(writer, 200, _builds(query), keep_alive)
+    elif path == "/resolve":
+        if method != "GET":
+            raise HTTPError(405, "use GET")
+        _send_json(writer, 200, _resolve(query), keep_alive)
+    elif path == "/upgrade":
+        if method != "GET":
+            raise HTTPError(405, "use GET")
+        _send_json(writer, 200, _upgrade(query), keep_alive)
+    elif path == "/frontier":
+        if method != "GET":
+            raise HTTPError(405, "use GET")
+        _send_json(writer, 200, _frontier(query), keep_alive)
+    elif path == "/bulk":
+        if method != "POST":
+            raise HTTPError(405, "use POST")
+        rows = _bulk_rows(body, headers)
+        await _stream_bulk(writer, rows, _flag(query, "suggestions"),
+                           "ndjson" in headers.get("accept", ""), keep_alive, _flag(query, "fuzzy"))
+    else:
+        raise HTTPError(404, f"no route for {path}")
+
+
+async def _serve_connection(reader, writer, max_body):
+    try:
+        while True:
+            try:
+                req = await _read_request(reader, max_body)
+                if req is None:
+                    break
+                method, path, query, headers, body = req
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await _dispatch(writer, method, path, query, headers, body, keep_alive)
+            except (HTTPError, ValueError) as e:   # ValueError: bad length or encoding
+                keep_alive = False
+                _send_json(writer, getattr(e, "status", 400), {"error": str(e)}, keep_alive)
+            await writer.drain()
+            if not keep_alive:
+                break
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def serve(host="127.0.0.1", port=8080, max_body=64 * 1024 * 1024, ready=None):
+    """Run the service until cancelled. `ready(port)` is called once listening."""
+    REGISTRY.find("cpu", "")        # build the name indexes before the first request
+    server = await asyncio.start_server(
+        lambda r, w: _serve_connection(r, w, max_body), host, port,
+        limit=MAX_HEADER, backlog=1024)
+    bound = server.sockets[0].getsockname()[1]
+    if ready:
+        ready(bound)
+    async with server:
+        await server.serve_forever()
+
+
+# ─────────────────────────── CLI ─────────────────────────────────────────────
+def main(argv=None):
+    global _frontier_table
+    ap = argparse.ArgumentParser(prog="python -m bottleneck_calculator serve",
+                                 description="Serve single-build and bulk scoring over HTTP.")
+    ap.add_argument("--host", default="127.0.0.1")
+    ap.add_argument("-p", "--port", type=int, default=8080, help="0 = any free port")
+    ap.add_argument("--db", metavar="PATH",
+                    help="component database file (default: $BOTTLENECK_DB or built-in)")
+    ap.add_argument("--frontier", metavar="PATH",
+                    help="Pareto table for /frontier, from `frontier build` "
+                         "(default: computed from the dataset on first use)")
+    ap.add_argument("--cache-size", type=int, default=65536,
+                    help="LRU result cache entries; 0 disables (default: 65536)")
+    ap.add_argument("--max-body", type=int, default=64 * 1024 * 1024,
+                    help="largest accepted request body in bytes")
+    args = ap.parse_args(argv)
+
+    if args.db:
+        REGISTRY.load_database(args.db)
+    if args.frontier:
+        from .frontier import ParetoTable
+        _frontier_table = ParetoTable.load(args.frontier)
+    cached_bottleneck.resize(args.cache_size)
+    ready = lambda port: print(f"listening on http://{args.host}:{port}", file=sys.stderr, flush=True)
+    try:
+        asyncio.run(serve(args.host, args.port, args.max_body, ready))
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -0,0 +1,132 @@
+"""Release metadata and the GitHub update check."""
+
+import json
+import os
+import threading
+import time
+
+GITHUB_REPO   = "abhrajo/bottleneck-calculator"
+CURRENT_VER   = "3.0.0"
+RELEASE_TAG   = "BC_Main"
+LATEST_URL    = f"https://api.github.com/repos/{GITHUB_REPO}/releases/latest"
+RELEASES_URL  = f"https://api.github.com/repos/{GITHUB_REPO}/releases/tags/{RELEASE_TAG}"
+DOWNLOAD_PAGE = f"https://github.com/{GITHUB_REPO}/releases/tag/{RELEASE_TAG}"
+UPDATE_TTL    = 6 * 3600          # seconds a cached answer (or failure) is trusted
+
+# ──────────────────────────── RESPONSE CACHE ─────────────────────────────────
+def update_cache_path():
+    """$BOTTLENECK_UPDATE_CACHE, else update.json under the user cache dir."""
+    if os.environ.get("BOTTLENECK_UPDATE_CACHE"):
+        return os.environ["BOTTLENECK_UPDATE_CACHE"]
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "bottleneck-calculator", "update.json")
+
+def _entry_ok(entry):
+    return (isinstance(entry, dict)
+            and isinstance(entry.get("fetched", 0), (int, float))
+            and isinstance(entry.get("body"), (dict, type(None)))
+            and isinstance(entry.get("etag"), (str, type(None))))
+
+def _load_cache(path):
+    """url → entry; a missing, unreadable or malformed file or entry is a miss."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {u: e for u, e in cache.items() if _entry_ok(e)}
+
+def _save_cache(path, cache):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError:
+        pass      # a read-only home just means no caching
+
+def _fetch(url, entry, timeout):
+    """
+    GET `url` as JSON, revalidating with the cached ETag. Returns the new
+    cache entry; on a network error the old body is kept (possibly None)
+    and the attempt is still timestamped, so offline machines back off
+    for the TTL too.
+    """
+    import urllib.error, urllib.request
+    entry = dict(entry or {}, fetched=time.time())
+    req = urllib.request.Request(url, headers={"Accept": "application/vnd.github+json",
+                                               "User-Agent": f"bottleneck-calculator/{CURRENT_VER}"})
+    if entry.get("etag"):
+        req.add_header("If-None-Match", entry["etag"])
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as r:
+            body = json.loads(r.read())
+            entry.update(body=body if isinstance(body, dict) else None,
+                         etag=r.headers.get("ETag"))
+    except urllib.error.HTTPError as e:
+        if e.code == 404:                    # no such release (yet)
+            entry.update(body=None, etag=None)
+        # 304 Not Modified: the cached body is still current
+    except Exception:
+        pass                                 # offline / timeout: keep the stale body
+    return entry
+
+def _fetch_all(urls, cache, ttl, timeout):
+    """Refresh the stale entries of `urls` concurrently; returns {url: body}."""
+    now, results = time.time(), {}
+    stale = [u for u in urls if now - cache.get(u, {}).get("fetched", 0) >= ttl]
+    def run(u):
+        results[u] = _fetch(u, cache.get(u), timeout)
+    threads = [threading.Thread(target=run, args=(u,), daemon=True) for u in stale]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(timeout + 1)
+    cache.update(results)
+    return {u: cache.get(u, {}).get("body") for u in urls}, bool(results)
+
+# ──────────────────────────── UPDATE CHECK ───────────────────────────────────
+def check_update(latest_url=LATEST_URL, tag_url=RELEASES_URL,
+                 cache_path=None, ttl=UPDATE_TTL, timeout=5):
+    """
+    Check GitHub for newer releases; returns (tag, url) or (None, None).
+    /releases/latest wins if it names a newer versioned release, otherwise
+    the known BC_Main tag is reported once it has downloadable assets.
+    Both endpoints are queried at once, answers are cached on disk for
+    `ttl` seconds and revalidated with If-None-Match after that.
+    """
+    path  = cache_path or update_cache_path()
+    cache = _load_cache(path)
+    bodies, refreshed = _fetch_all((latest_url, tag_url), cache, ttl, timeout)
+    if refreshed:
+        _save_cache(path, cache)
+
+    latest = bodies[latest_url] or {}
+    tag = latest.get("tag_name", "")
+    if tag and tag != RELEASE_TAG:
+        return tag, latest.get("html_url", DOWNLOAD_PAGE)
+
+    named = bodies[tag_url] or {}
+    tag = named.get("tag_name", "")
+    if named.get("assets") and tag:
+        return tag, named.get("html_url", DOWNLOAD_PAGE)
+    return None, None
+
+def check_update_async(**kwargs):
+    """
+    Run check_update on a daemon thread and return a Future of its result.
+    The GUI polls the future from the Tk thread with after(), so no widget
+    is ever touched off the main thread.
+    """
+    from concurrent.futures import Future
+    fut = Future()
+    def run():
+        try:
+            fut.set_result(check_update(**kwargs))
+        except Exception:
+            fut.set_result((None, None))
+    threading.Thread(target=run, daemon=True, name="update-check").start()
+    return fut
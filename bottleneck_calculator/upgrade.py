@@ -0,0 +1,137 @@
+"""
+Upgrade planner: the order of single-part swaps that cuts bottleneck_pct fastest.
+
+upgrade_plan(cpu, gpu, mb, budget, steps) starts from a current build and
+plans up to `steps` upgrades, each spending at most `budget`. A step swaps
+one part for a better one:
+
+    GPU         a GPU with a higher perf_score
+    board       a PCIe 4+ board for the CPU's socket, replacing a PCIe 3 one
+    CPU         a CPU with a higher perf_score (or the same score and more
+                than 4 cores where there were 4 or fewer), either for the
+                board's socket, keeping the board, or for another socket
+                together with a board for it (the forced board swap
+                counts as part of the same step)
+
+Swapping in a slower part to even out the gap isn't an upgrade, so it is
+never suggested.
+
+Plans are ranked by the sum of bottleneck_pct after each of the `steps`
+steps, so an upgrade that helps now beats one that helps the same amount
+later. Ties go to the lower total spend, then to fewer swaps. A plan can
+stop early when no swap within budget helps.
+
+Parts of one scoring class (engine.cpu_class and friends) score alike in
+every build, and each step's budget stands on its own, so only the
+cheapest part of each class is worth swapping in, which leaves a few
+hundred candidates per step. The search runs
+forwards one step at a time. Builds reached in the same number of steps
+are merged and keep their best prefix, since what can still follow
+depends only on the build (a DP over build states). bottleneck_pct is
+memoized per class combination. With `beam` set, only the `beam` most
+promising builds are carried into the next step, ranked by what the plan
+would total if it stopped there. beam=None searches exhaustively.
+"""
+
+from bisect import bisect_right
+from collections import namedtuple
+
+from .engine import (board_class, cheapest_per_class, cpu_class, gpu_class, per_registry,
+                     score_build)
+
+BEAM = 32           # builds kept per step by default
+
+Step = namedtuple("Step", "swap price score")            # swap: the part(s) put in
+Plan = namedtuple("Plan", "start steps spend pct_sum")   # start/score: BottleneckScore
+
+
+class UpgradePlanner:
+    """Cheapest part per scoring class, built once; plan() runs a search."""
+    def __init__(self, cpus, gpus, mbs):
+        self._gpus   = sorted(cheapest_per_class(gpus, gpu_class), key=lambda g: g.perf_score)
+        self._cpus   = {}                           # socket → [CPU]
+        self._boards = {}                           # socket → [board]
+        for c in cheapest_per_class(cpus, cpu_class):
+            self._cpus.setdefault(c.socket, []).append(c)
+        for m in cheapest_per_class(mbs, board_class):
+            self._boards.setdefault(m.socket, []).append(m)
+        self._pct = {}      # (cpu_class, gpu_class, board_class) → pct
+        self.evaluated = 0  # builds the last plan() looked at
+
+    def pct(self, cpu, gpu, mb):
+        key = (cpu_class(cpu), gpu_class(gpu), board_class(mb))
+        p = self._pct.get(key)
+        if p is None:
+            p = self._pct[key] = score_build(cpu, gpu, mb).bottleneck_pct
+        return p
+
+    # ── search ────────────────────────────────────────────────────────────────
+    def _menu(self, budget):
+        """The swaps a step can afford: GPUs, and per socket CPUs, boards and CPU + board pairs."""
+        gpus   = [g for g in self._gpus if g.price <= budget]
+        cpus   = {s: [c for c in cs if c.price <= budget] for s, cs in self._cpus.items()}
+        boards = {s: [m for m in ms if m.price <= budget] for s, ms in self._boards.items()}
+        pairs  = {s: [(c, m) for c in self._cpus[s] for m in self._boards.get(s, ())
+                      if c.price + m.price <= budget] for s in self._cpus}
+        return gpus, cpus, boards, pairs
+
+    def _moves(self, build, menu):
+        """(next build, price, parts swapped in) for every single upgrade from `build`."""
+        cpu, gpu, mb = build
+        gpus, cpus, boards, pairs = menu
+        for g in gpus[bisect_right(gpus, gpu.perf_score, key=lambda g: g.perf_score):]:
+            yield (cpu, g, mb), g.price, (g,)
+        for m in boards.get(cpu.socket, ()):
+            if mb.socket != cpu.socket or (m.pcie_gen > 3 and mb.pcie_gen <= 3):
+                yield (cpu, gpu, m), m.price, (m,)
+        better = lambda c: c.perf_score > cpu.perf_score or \
+            (c.perf_score == cpu.perf_score and c.cores > 4 >= cpu.cores)
+        for c in cpus.get(mb.socket, ()):
+            if better(c):
+                yield (c, gpu, mb), c.price, (c,)
+        for s, ps in pairs.items():
+            if s != mb.socket:
+                for c, m in ps:
+                    if better(c):
+                        yield (c, gpu, m), c.price + m.price, (c, m)
+
+    def plan(self, cpu, gpu, mb, budget, steps=3, beam=BEAM):
+        """The best Plan of at most `steps` swaps from (cpu, gpu, mb); see the module docstring."""
+        menu = self._menu(budget)
+        self.evaluated = 1
+        start = (cpu, gpu, mb)
+        # build ids → (pct sum so far, spend, swaps, build, pct, path)
+        layer = {tuple(map(id, start)): (0.0, 0.0, 0, start, self.pct(*start), ())}
+        for d in range(steps):
+            nxt = {}
+            def offer(build, p, acc, spend, path):
+                key = tuple(map(id, build))
+                cur = nxt.get(key)
+                if cur is None or (acc, spend, len(path)) < cur[:3]:
+                    nxt[key] = (acc, spend, len(path), build, p, path)
+            for acc, spend, _, build, p, path in layer.values():
+                offer(build, p, acc + p, spend, path)                   # swap nothing
+                for nb, price, swap in self._moves(build, menu):
+                    q = self.pct(*nb)
+                    self.evaluated += 1
+                    offer(nb, q, acc + q, spend + price, path + ((swap, price, nb),))
+            left = steps - d - 1
+            if beam is not None and left and len(nxt) > beam:
+                ranked = sorted(nxt.items(), key=lambda kv: (kv[1][0] + left * kv[1][4],) + kv[1][1:3])
+                nxt = dict(ranked[:beam])
+            layer = nxt
+        acc, spend, _, _, _, path = min(layer.values(), key=lambda e: e[:3])
+        return Plan(score_build(*start),
+                    [Step(swap, price, score_build(*nb)) for swap, price, nb in path],
+                    spend, round(acc, 1))
+
+
+# ─────────────────────────── API ─────────────────────────────────────────────
+@per_registry
+def planner(reg):
+    """The UpgradePlanner for a registry's current lists, rebuilt after a load."""
+    return UpgradePlanner(reg.cpus, reg.gpus, reg.mbs)
+
+def upgrade_plan(cpu, gpu, mb, budget, steps=3, beam=BEAM, registry=None):
+    """Best sequence of at most `steps` swaps costing `budget` each; see the module docstring."""
+    return planner(registry).plan(cpu, gpu, mb, budget, steps, beam)